@@ -0,0 +1,56 @@
+import gc
+import time
+import random
+from bifurcated_sort import bfc_sort
+
+n = 40000
+
+def nearly_sorted(swaps):
+    arr = list(range(n))
+    for _ in range(swaps):
+        i, j = random.randrange(n), random.randrange(n)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+def sorted_runs(count):
+    arr = [random.random() for _ in range(n)]
+    size = n // count
+    return [x for start in range(0, n, size) for x in sorted(arr[start:start + size])]
+
+inputs = {
+    "random": [random.random() for _ in range(n)],
+    "nearly sorted": nearly_sorted(2000),
+    "10 runs": sorted_runs(10),
+    "1000 runs": sorted_runs(1000),
+    "sawtooth": [i % 1000 for i in range(n)],
+    "few unique": [random.randint(0, 10) for _ in range(n)],
+    "jittered": [i + random.uniform(-20, 20) for i in range(n)],
+    "rev jittered": [n - i + random.uniform(-20, 20) for i in range(n)],
+}
+
+def best_time(arr, pending_item_percentage):
+    times = []
+    for _ in range(3):
+        copy = arr.copy()
+        gc.collect()
+        start = time.perf_counter()
+        bfc_sort(copy, pending_item_percentage=pending_item_percentage, counting_threshold=0, radix_max_bits=0)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+for name, arr in inputs.items():
+    fixed = best_time(arr, 0.55)
+    auto = best_time(arr, "auto")
+    print(f"{name:>13} 0.55: {fixed:.3f}s  auto: {auto:.3f}s")
+
+
+
+# Output :
+#        random 0.55: 0.015s  auto: 0.015s
+# nearly sorted 0.55: 0.023s  auto: 0.024s
+#       10 runs 0.55: 0.008s  auto: 0.008s
+#     1000 runs 0.55: 0.017s  auto: 0.017s
+#      sawtooth 0.55: 0.011s  auto: 0.011s
+#    few unique 0.55: 0.156s  auto: 0.130s
+#      jittered 0.55: 0.013s  auto: 0.008s
+#  rev jittered 0.55: 0.013s  auto: 0.008s
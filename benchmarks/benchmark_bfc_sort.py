@@ -1,23 +1,190 @@
-import time
+"""
+Benchmark harness for bfc_sort.
+
+Times bfc_sort against sorted() over a grid of input sizes, distributions,
+pending_item_percentage values and reverse settings, and reports median and
+p95 wall time, peak traced memory and the slowdown relative to sorted().
+The counting and radix sort fallbacks are turned off so every case times the
+linked lists; benchmarks/benchmark_integer_sort.py covers those.
+
+    python benchmarks/benchmark_bfc_sort.py
+    python benchmarks/benchmark_bfc_sort.py --sizes 1000 100000 --distributions random sorted
+    python benchmarks/benchmark_bfc_sort.py --json results.json
+    python benchmarks/benchmark_bfc_sort.py --json new.json --compare results.json
+
+Sizes up to 1e7 are supported but take minutes per case in pure Python.
+"""
+import argparse
+import gc
+import json
+import platform
 import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+import bifurcated_sort
 from bifurcated_sort import bfc_sort
 
-# generate data
-arr = [random.randint(0, 10**6) for _ in range(20000)]
 
-# benchmark bfc_sort
-copy1 = arr.copy()
-start = time.time()
-bfc_sort(copy1)
-print("bfc_sort time:", time.time() - start)
+def nearly_sorted(n, swaps=None):
+    arr = list(range(n))
+    for _ in range(n // 100 if swaps is None else swaps):
+        i, j = random.randrange(n), random.randrange(n)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+DISTRIBUTIONS = {
+    "random": lambda n: [random.randint(0, 10**9) for _ in range(n)],
+    "sorted": lambda n: list(range(n)),
+    "reversed": lambda n: list(range(n, 0, -1)),
+    "sawtooth": lambda n: [i % 1000 for i in range(n)],
+    "few-unique": lambda n: [random.randint(0, 9) for _ in range(n)],
+    "nearly-sorted": nearly_sorted,
+    "gaussian": lambda n: [int(random.gauss(0, 10**6)) for _ in range(n)],
+    "floats": lambda n: [random.random() for _ in range(n)],
+    "tuples": lambda n: [(random.randint(0, 100), random.randint(0, 10**6)) for _ in range(n)],
+}
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_PENDING = [0.1, 0.55, 1.0, "auto"]
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def time_runs(sort, data, repeat):
+    times = []
+    for _ in range(repeat):
+        copy = data.copy()
+        gc.collect()
+        start = time.perf_counter()
+        sort(copy)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def peak_memory(sort, data):
+    # Measured in a separate run because tracing slows the sort down.
+    copy = data.copy()
+    gc.collect()
+    tracemalloc.start()
+    sort(copy)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run_case(data, pending, reverse, repeat, measure_memory):
+    bfc = lambda arr: bfc_sort(
+        arr, pending_item_percentage=pending, reverse=reverse, counting_threshold=0, radix_max_bits=0,
+    )
+    builtin = lambda arr: arr.sort(reverse=reverse)
+
+    bfc_times = time_runs(bfc, data, repeat)
+    builtin_times = time_runs(builtin, data, repeat)
+    median = statistics.median(bfc_times)
+    builtin_median = statistics.median(builtin_times)
+    return {
+        "median_s": median,
+        "p95_s": percentile(bfc_times, 0.95),
+        "peak_bytes": peak_memory(bfc, data) if measure_memory else None,
+        "sorted_median_s": builtin_median,
+        "vs_sorted": median / builtin_median if builtin_median else None,
+    }
+
+
+def parse_pending(value):
+    return value if value == "auto" else float(value)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark bfc_sort against sorted().")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--distributions", nargs="+", choices=sorted(DISTRIBUTIONS), default=list(DISTRIBUTIONS))
+    parser.add_argument("--pending", type=parse_pending, nargs="+", default=DEFAULT_PENDING,
+                        help="pending_item_percentage values, numbers or 'auto'")
+    parser.add_argument("--reverse", choices=["false", "true", "both"], default="both")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc run")
+    parser.add_argument("--seed", type=int, default=1359)
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="earlier JSON results to flag regressions against")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="median slowdown against --compare that counts as a regression")
+    return parser.parse_args(argv)
+
+
+def case_id(result):
+    return (result["size"], result["distribution"], str(result["pending_item_percentage"]), result["reverse"])
+
+
+def compare(results, baseline_path, threshold):
+    with open(baseline_path) as f:
+        baseline = {case_id(result): result for result in json.load(f)["results"]}
+
+    regressions = []
+    for result in results:
+        before = baseline.get(case_id(result))
+        if before and result["median_s"] > before["median_s"] * threshold:
+            regressions.append((result, result["median_s"] / before["median_s"]))
+
+    for result, ratio in regressions:
+        size, distribution, pending, reverse = case_id(result)
+        print(f"REGRESSION {distribution} n={size} pending={pending} reverse={reverse}: {ratio:.2f}x slower")
+    return regressions
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    random.seed(args.seed)
+    reverse_values = {"false": [False], "true": [True], "both": [False, True]}[args.reverse]
+
+    results = []
+    print(f"{'distribution':>13} {'n':>9} {'pending':>7} {'rev':>5} {'median':>10} {'p95':>10} {'peak MiB':>9} {'x sorted':>9}")
+    for size in args.sizes:
+        for distribution in args.distributions:
+            data = DISTRIBUTIONS[distribution](size)
+            for pending in args.pending:
+                for reverse in reverse_values:
+                    result = {
+                        "size": size,
+                        "distribution": distribution,
+                        "pending_item_percentage": pending,
+                        "reverse": reverse,
+                    }
+                    result.update(run_case(data, pending, reverse, args.repeat, not args.no_memory))
+                    results.append(result)
+
+                    peak = "-" if result["peak_bytes"] is None else f"{result['peak_bytes'] / 2**20:.1f}"
+                    print(
+                        f"{distribution:>13} {size:>9} {str(pending):>7} {str(reverse):>5} "
+                        f"{result['median_s']:>9.4f}s {result['p95_s']:>9.4f}s {peak:>9} "
+                        f"{result['vs_sorted']:>8.1f}x"
+                    )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "meta": {
+                    "version": bifurcated_sort.__version__,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                    "repeat": args.repeat,
+                    "seed": args.seed,
+                },
+                "results": results,
+            }, f, indent=2)
 
-# benchmark built-in sorted
-copy2 = arr.copy()
-start = time.time()
-sorted(copy2)
-print("sorted() time:", time.time() - start)
+    if args.compare and compare(results, args.compare, args.threshold):
+        return 1
+    return 0
 
 
-# Output :
-# bfc_sort time: 0.026061058044433594
-# sorted() time: 0.001425027847290039
\ No newline at end of file
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+import time
+import random
+from bifurcated_sort import bfc_sort
+
+# Pending batches that arrive in sorted order turn the plain BST into a
+# chain, so every nearest-value lookup walks the whole batch. Items 2..n go
+# pending in the given order; a rising item after every 4 of them lands on
+# the ascending list and keeps the natural runs too short for the run merge.
+def pending_batch(values, n):
+    arr = [0, 2 * n + 10, n + 5, n + 6, 1]
+    for i, value in enumerate(values):
+        arr.append(value)
+        if i % 4 == 3:
+            arr.append(2 * n + 11 + i)
+    return arr
+
+def sorted_pending(n):
+    return pending_batch(range(2, n + 1), n)
+
+def reversed_pending(n):
+    return pending_batch(range(n, 1, -1), n)
+
+def random_input(n):
+    return [random.randint(0, 10**6) for _ in range(n)]
+
+for name, generate in [
+    ("random", random_input),
+    ("sorted pending", sorted_pending),
+    ("reversed pending", reversed_pending),
+]:
+    for n in (2000, 8000):
+        arr = generate(n)
+        for tree in ("bst", "avl", "rb", "treap"):
+            copy = arr.copy()
+            start = time.perf_counter()
+            bfc_sort(copy, tree=tree, accelerate=False)
+            print(f"{name:>16} n={n:<6} tree={tree:<5} time: {time.perf_counter() - start:.4f}")
+
+
+# Output :
+#           random n=2000   tree=bst   time: 0.0038
+#           random n=2000   tree=avl   time: 0.0054
+#           random n=2000   tree=rb    time: 0.0039
+#           random n=2000   tree=treap time: 0.0055
+#           random n=8000   tree=bst   time: 0.0150
+#           random n=8000   tree=avl   time: 0.0243
+#           random n=8000   tree=rb    time: 0.0179
+#           random n=8000   tree=treap time: 0.0299
+#   sorted pending n=2000   tree=bst   time: 0.0639
+#   sorted pending n=2000   tree=avl   time: 0.0201
+#   sorted pending n=2000   tree=rb    time: 0.0193
+#   sorted pending n=2000   tree=treap time: 0.0185
+#   sorted pending n=8000   tree=bst   time: 1.0419
+#   sorted pending n=8000   tree=avl   time: 0.2731
+#   sorted pending n=8000   tree=rb    time: 0.2601
+#   sorted pending n=8000   tree=treap time: 0.2656
+# reversed pending n=2000   tree=bst   time: 0.0463
+# reversed pending n=2000   tree=avl   time: 0.0060
+# reversed pending n=2000   tree=rb    time: 0.0042
+# reversed pending n=2000   tree=treap time: 0.0044
+# reversed pending n=8000   tree=bst   time: 0.7343
+# reversed pending n=8000   tree=avl   time: 0.0247
+# reversed pending n=8000   tree=rb    time: 0.0191
+# reversed pending n=8000   tree=treap time: 0.0278
\ No newline at end of file
@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+import random
+import tempfile
+from array import array
+from bifurcated_sort import bfc_sort_file
+
+# usage: python benchmarks/benchmark_external.py [size_mb] [memory_limit_mb]
+# Writes a synthetic file of random 64-bit integers and sorts it out of core.
+# Pass e.g. 4096 for a multi-GB run; the default keeps it to a quick check.
+size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+memory_limit_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+
+item_count = size_mb * 2**20 // 8
+block = 1 << 20
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    path = os.path.join(tmp_dir, "ids.bin")
+    with open(path, "wb") as f:
+        for offset in range(0, item_count, block):
+            count = min(block, item_count - offset)
+            array("q", (random.getrandbits(63) for _ in range(count))).tofile(f)
+
+    start = time.perf_counter()
+    runs = bfc_sort_file(path, memory_limit=memory_limit_mb * 2**20, tmp_dir=tmp_dir)
+    elapsed = time.perf_counter() - start
+
+    with open(path, "rb") as f:
+        head = array("q")
+        head.fromfile(f, min(item_count, 1000))
+    assert list(head) == sorted(head)
+
+    print(f"file: {size_mb} MiB ({item_count} items)  memory_limit: {memory_limit_mb} MiB")
+    print(f"runs: {runs}  time: {elapsed:.1f}s  throughput: {size_mb / elapsed:.2f} MiB/s")
+
+
+# Output :
+# file: 16 MiB (2097152 items)  memory_limit: 16 MiB
+# runs: 23  time: 1.7s  throughput: 9.39 MiB/s
+#
+# Without the compiled _speedups module :
+# file: 16 MiB (2097152 items)  memory_limit: 16 MiB
+# runs: 23  time: 3.1s  throughput: 5.22 MiB/s
+#
+# Before chunks took the default path (engine='array', 160 bytes per item) :
+# file: 16 MiB (2097152 items)  memory_limit: 16 MiB
+# runs: 21  time: 20.5s  throughput: 0.78 MiB/s
@@ -0,0 +1,36 @@
+import time
+import heapq
+import random
+from bifurcated_sort import bfc_sort, bfc_merge
+
+n = 400000
+
+def timed(merge, shards, **kwargs):
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in merge(*shards, **kwargs):
+            pass
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+for k in (2, 4, 8, 16, 64):
+    shards = [[random.randint(0, 10**9) for _ in range(n // k)] for _ in range(k)]
+    for shard in shards:
+        bfc_sort(shard)
+    print(
+        f"k={k:<3} bfc_merge: {timed(bfc_merge, shards):.4f}s  "
+        f"heapq.merge: {timed(heapq.merge, shards):.4f}s  "
+        f"with key: {timed(bfc_merge, shards, key=abs):.4f}s / "
+        f"{timed(heapq.merge, shards, key=abs):.4f}s"
+    )
+
+
+# Output :
+# k=2   bfc_merge: 0.0357s  heapq.merge: 0.0616s  with key: 0.0680s / 0.0665s
+# k=4   bfc_merge: 0.0700s  heapq.merge: 0.0855s  with key: 0.0936s / 0.0869s
+# k=8   bfc_merge: 0.0922s  heapq.merge: 0.1271s  with key: 0.1285s / 0.1309s
+# k=16  bfc_merge: 0.1205s  heapq.merge: 0.1342s  with key: 0.1253s / 0.1356s
+# k=64  bfc_merge: 0.1688s  heapq.merge: 0.1650s  with key: 0.1637s / 0.1734s
+#
+# With a key, or above 32 inputs, bfc_merge hands over to heapq.merge.
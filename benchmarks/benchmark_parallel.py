@@ -0,0 +1,26 @@
+import os
+import sys
+import time
+import random
+from bifurcated_sort import bfc_sort
+
+# usage: python benchmarks/benchmark_parallel.py [n] [max_workers]
+n = int(sys.argv[1]) if len(sys.argv) > 1 else 400000
+max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+arr = [random.randint(0, 10**9) for _ in range(n)]
+baseline = None
+print(f"n={n} cpus={os.cpu_count()}")
+for workers in range(1, max_workers + 1):
+    copy = arr.copy()
+    start = time.perf_counter()
+    bfc_sort(copy, workers=workers)
+    elapsed = time.perf_counter() - start
+    baseline = baseline or elapsed
+    print(f"workers={workers:<3} time: {elapsed:.2f}s  speedup: {baseline / elapsed:.2f}x")
+
+
+
+# No output is recorded: the numbers are only meaningful on a machine with
+# several cores, and it has only been run on a single-core machine. Run it
+# with max_workers up to the core count to see the 1-N worker scaling.
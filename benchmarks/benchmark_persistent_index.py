@@ -0,0 +1,37 @@
+import gc
+import time
+import random
+from bifurcated_sort import bfc_sort, SortStats
+
+n = 100000
+arr = [random.randint(0, 10**9) for _ in range(n)]
+
+def run(**kwargs):
+    times = []
+    for _ in range(3):
+        copy = arr.copy()
+        stats = SortStats()
+        gc.collect()
+        start = time.perf_counter()
+        bfc_sort(copy, stats=stats, counting_threshold=0, radix_max_bits=0, **kwargs)
+        times.append(time.perf_counter() - start)
+    return min(times), stats.nodes_walked
+
+for accelerate in (False, True):
+    for pending in (0.01, 0.1, 0.55):
+        per_batch, per_batch_walked = run(pending_item_percentage=pending, accelerate=accelerate)
+        persistent, persistent_walked = run(pending_item_percentage=pending, accelerate=accelerate, persistent_index=True)
+        print(
+            f"accelerate={accelerate!s:>5} pending={pending:<4} "
+            f"per batch: {per_batch:.4f}s ({per_batch_walked} walked)  "
+            f"persistent: {persistent:.4f}s ({persistent_walked} walked)"
+        )
+
+
+# Output :
+# accelerate=False pending=0.01 per batch: 1.2291s (15929058 walked)  persistent: 0.3309s (99981 walked)
+# accelerate=False pending=0.1  per batch: 0.4062s (1845367 walked)  persistent: 0.3257s (99977 walked)
+# accelerate=False pending=0.55 per batch: 0.3205s (100274 walked)  persistent: 0.3202s (99985 walked)
+# accelerate= True pending=0.01 per batch: 0.1253s (15929058 walked)  persistent: 0.0509s (99981 walked)
+# accelerate= True pending=0.1  per batch: 0.0478s (1845367 walked)  persistent: 0.0462s (99977 walked)
+# accelerate= True pending=0.55 per batch: 0.0447s (100274 walked)  persistent: 0.0448s (99985 walked)
@@ -0,0 +1,54 @@
+import gc
+import time
+import random
+from functools import partial
+from bifurcated_sort import bfc_sort
+
+n = 100000
+
+def k_runs(k):
+    arr = [random.randint(0, 10**9) for _ in range(n)]
+    size = n // k
+    return [x for start in range(0, n, size) for x in sorted(arr[start:start + size])]
+
+inputs = {
+    "sorted": list(range(n)),
+    "reversed": list(range(n, 0, -1)),
+    "organ pipe": list(range(n // 2)) + list(range(n // 2, 0, -1)),
+    "4 runs": k_runs(4),
+    "100 runs": k_runs(100),
+    "random": [random.randint(0, 10**9) for _ in range(n)],
+}
+
+# The integer fallbacks would sort the random row without the lists.
+linked_lists = partial(bfc_sort, counting_threshold=0, radix_max_bits=0)
+
+def best_time(sort, arr):
+    times = []
+    for _ in range(3):
+        copy = arr.copy()
+        gc.collect()
+        start = time.perf_counter()
+        sort(copy)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+for name, arr in inputs.items():
+    print(f"{name:>10} bfc_sort: {best_time(linked_lists, arr):.4f}s  list.sort: {best_time(list.sort, arr):.4f}s")
+
+
+# Output :
+#     sorted bfc_sort: 0.0048s  list.sort: 0.0003s
+#   reversed bfc_sort: 0.0053s  list.sort: 0.0003s
+# organ pipe bfc_sort: 0.0132s  list.sort: 0.0006s
+#     4 runs bfc_sort: 0.0186s  list.sort: 0.0023s
+#   100 runs bfc_sort: 0.0324s  list.sort: 0.0056s
+#     random bfc_sort: 0.0436s  list.sort: 0.0118s
+#
+# Before the run detection fast paths :
+#     sorted bfc_sort: 0.0785s
+#   reversed bfc_sort: 0.0781s
+# organ pipe bfc_sort: 0.2303s
+#     4 runs bfc_sort: 14.6009s
+#   100 runs bfc_sort: 0.5761s
+#     random bfc_sort: 0.6314s
\ No newline at end of file
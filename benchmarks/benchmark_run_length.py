@@ -0,0 +1,36 @@
+import gc
+import time
+import random
+import tracemalloc
+from bifurcated_sort import bfc_sort
+
+# Inputs with few distinct values, like status codes or bucketed latencies.
+n = 50000
+
+def run(arr, **kwargs):
+    copy = arr.copy()
+    gc.collect()
+    start = time.perf_counter()
+    bfc_sort(copy, accelerate=False, counting_threshold=0, radix_max_bits=0, **kwargs)
+    elapsed = time.perf_counter() - start
+    copy = arr.copy()
+    tracemalloc.start()
+    bfc_sort(copy, accelerate=False, counting_threshold=0, radix_max_bits=0, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / len(arr)
+
+for distinct in (10, 1000, n):
+    arr = [random.randint(0, distinct - 1) for _ in range(n)]
+    for engine in ("node", "rle"):
+        elapsed, per_item = run(arr, engine=engine)
+        print(f"distinct={distinct:<7} engine={engine:<5} {elapsed:.3f}s  peak bytes/element: {per_item:.1f}")
+
+
+# Output :
+# distinct=10      engine=node  4.288s  peak bytes/element: 127.3
+# distinct=10      engine=rle   0.029s  peak bytes/element: 16.5
+# distinct=1000    engine=node  0.220s  peak bytes/element: 144.8
+# distinct=1000    engine=rle   0.050s  peak bytes/element: 25.7
+# distinct=50000   engine=node  0.142s  peak bytes/element: 144.9
+# distinct=50000   engine=rle   0.124s  peak bytes/element: 135.1
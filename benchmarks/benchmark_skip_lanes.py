@@ -0,0 +1,52 @@
+import gc
+import time
+import random
+from bifurcated_sort import bfc_sort, SortStats
+
+def worst_case_pending(n):
+    # test_worst_case_pending scaled up: a shuffled middle between the extremes
+    middle = list(range(1, n - 1))
+    random.shuffle(middle)
+    return [0] + middle + [n]
+
+def duplicates(n, unique):
+    return [random.randint(0, unique - 1) for _ in range(n)]
+
+inputs = {
+    "worst case pending": (worst_case_pending, 0.55),
+    "worst case pending, small batches": (worst_case_pending, 0.01),
+    "100 unique values": (lambda n: duplicates(n, 100), 0.55),
+    "10 unique values": (lambda n: duplicates(n, 10), 0.55),
+}
+
+def run(arr, **kwargs):
+    times = []
+    for _ in range(3):
+        copy = arr.copy()
+        stats = SortStats()
+        gc.collect()
+        start = time.perf_counter()
+        bfc_sort(copy, stats=stats, accelerate=False, counting_threshold=0, radix_max_bits=0, **kwargs)
+        times.append(time.perf_counter() - start)
+    return min(times), stats
+
+for name, (make, pending) in inputs.items():
+    for n in (10000, 40000):
+        arr = make(n)
+        node, node_stats = run(arr, pending_item_percentage=pending)
+        skip, skip_stats = run(arr, pending_item_percentage=pending, engine='skip')
+        print(
+            f"{name:>34} n={n:<6} node: {node:.4f}s {node_stats.comparisons:>10} cmp  "
+            f"skip: {skip:.4f}s {skip_stats.comparisons:>10} cmp"
+        )
+
+
+# Output :
+#                 worst case pending n=10000  node: 0.0210s      85071 cmp  skip: 0.0448s      88317 cmp
+#                 worst case pending n=40000  node: 0.0947s     340146 cmp  skip: 0.2295s     352890 cmp
+#  worst case pending, small batches n=10000  node: 0.0657s    1115304 cmp  skip: 0.0663s     220484 cmp
+#  worst case pending, small batches n=40000  node: 0.3669s    5891192 cmp  skip: 0.3276s     884563 cmp
+#                  100 unique values n=10000  node: 0.0400s     487846 cmp  skip: 0.0674s     217984 cmp
+#                  100 unique values n=40000  node: 0.3896s    6871778 cmp  skip: 0.3595s    1128200 cmp
+#                   10 unique values n=10000  node: 0.2336s    4760829 cmp  skip: 0.0702s     269511 cmp
+#                   10 unique values n=40000  node: 3.6466s   75818602 cmp  skip: 0.3665s    1446546 cmp
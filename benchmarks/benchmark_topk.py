@@ -0,0 +1,45 @@
+import gc
+import time
+import heapq
+import random
+from bifurcated_sort import bfc_sort, bfc_iter, bfc_topk
+
+n = 200000
+k = 10
+arr = [random.randint(0, 10**9) for _ in range(n)]
+
+def timed(label, fn):
+    gc.collect()
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<30} {time.perf_counter() - start:.4f}s")
+    return result
+
+expected = sorted(arr)[:k]
+assert timed("bfc_sort()[:k]", lambda: bfc_sort(arr, inplace=False)[:k]) == expected
+assert timed("next(bfc_iter()) only", lambda: [next(bfc_iter(arr))]) == expected[:1]
+# Pure-Python linked lists, where only the merge is left to run lazily
+python = dict(accelerate=False, counting_threshold=0, radix_max_bits=0)
+assert timed("python bfc_sort()[:k]", lambda: bfc_sort(arr, inplace=False, **python)[:k]) == expected
+assert timed("python next(bfc_iter()) only", lambda: [next(bfc_iter(arr, **python))]) == expected[:1]
+assert timed("bfc_topk", lambda: bfc_topk(arr, k)) == expected
+assert timed("heapq.nsmallest", lambda: heapq.nsmallest(k, arr)) == expected
+
+
+# Output :
+# bfc_sort()[:k]                 0.1144s
+# next(bfc_iter()) only          0.1124s
+# python bfc_sort()[:k]          0.8006s
+# python next(bfc_iter()) only   0.7742s
+# bfc_topk                       0.0041s
+# heapq.nsmallest                0.0020s
+#
+# bfc_iter distributes like bfc_sort, so by default the compiled module sorts
+# the input and the first item comes as soon as the full sort; on the
+# pure-Python lists only the merge, a few percent of the time, is saved.
+#
+# Before, when bfc_iter went through the pure-Python BifurcatedSorter :
+# bfc_sort()[:k]               0.1487s
+# next(bfc_iter()) only        1.0072s
+# bfc_topk                     0.0053s
+# heapq.nsmallest              0.0025s
@@ -1,4 +1,11 @@
-from .sorter import bfc_sort, bfc_sorted
+from .sorter import bfc_sort, bfc_sorted, bfc_argsort
+from .stats import SortStats
+from .merge import bfc_merge
+from .sortedlist import SortedList
+from .streaming import BifurcatedSorter, bfc_iter, bfc_topk
+from .async_sort import bfc_sort_async
+from .vectorized import bfc_sort_array
+from .external import bfc_sort_file
 
 __version__ = "0.2.1"
-__all__ = ["bfc_sort", "bfc_sorted"]
\ No newline at end of file
+__all__ = ["bfc_sort", "bfc_sorted", "bfc_argsort", "bfc_sort_array", "bfc_sort_file", "bfc_iter", "bfc_topk", "bfc_merge", "bfc_sort_async", "BifurcatedSorter", "SortedList", "SortStats"]
\ No newline at end of file
@@ -0,0 +1,648 @@
+/*
+ * Compiled accelerator for bifurcated_sort.
+ *
+ * Implements the distribute, pending insert and merge phases of
+ * sorter._bifurcated_sort over array-backed linked lists (the same layout
+ * as linkedlist.ArrayLinkedList) with an AVL tree for the per-batch
+ * nearest-value lookups. Items are compared with the same operators, in
+ * the same operand order, as the pure-Python path, so both make the same
+ * sequence of list comparisons and produce identical output.
+ *
+ * Nodes and tree entries refer to items by their input index. When the
+ * caller passes the items again as an array('q') or array('d'), every
+ * comparison reads those unboxed values instead of calling rich compare;
+ * the items themselves are still what gets written back.
+ *
+ *   distribute(items, min_ind, max_ind, pending_item_size, collect_depths,
+ *              keys=None, persistent_index=False)
+ *       -> (state, walked, inserted_into_asc, inserted_into_dsc, asc_len, dsc_len, depths)
+ *   merge(state, items, reverse) -> comparisons
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#define NIL (-1)
+
+enum { KEYS_OBJECT, KEYS_INT64, KEYS_DOUBLE };
+
+#define COMPARE(x, y, op) \
+    ((op) == Py_LT ? (x) < (y) : (op) == Py_LE ? (x) <= (y) : (op) == Py_GT ? (x) > (y) : (x) >= (y))
+
+typedef struct {
+    Py_ssize_t n;
+    PyObject **items;       /* owned references to every input item */
+    int kind;               /* KEYS_* */
+    Py_buffer keys;         /* unboxed copies of items unless KEYS_OBJECT */
+    Py_ssize_t *data;       /* node data, an index into items */
+    Py_ssize_t *next;
+    Py_ssize_t *prev;
+    Py_ssize_t size;
+    Py_ssize_t asc_head, asc_tail, asc_len;
+    Py_ssize_t dsc_head, dsc_tail, dsc_len;
+} Lists;
+
+typedef struct {
+    Py_ssize_t *value;
+    Py_ssize_t *reference;
+    Py_ssize_t *left;
+    Py_ssize_t *right;
+    int *height;
+    Py_ssize_t size;
+    Py_ssize_t root;
+} Tree;
+
+static const char *STATE_NAME = "bifurcated_sort._speedups.state";
+
+static void
+lists_free(Lists *lists)
+{
+    if (lists == NULL) {
+        return;
+    }
+    if (lists->items != NULL) {
+        for (Py_ssize_t i = 0; i < lists->n; i++) {
+            Py_XDECREF(lists->items[i]);
+        }
+    }
+    PyMem_Free(lists->items);
+    if (lists->kind != KEYS_OBJECT) {
+        PyBuffer_Release(&lists->keys);
+    }
+    PyMem_Free(lists->data);
+    PyMem_Free(lists->next);
+    PyMem_Free(lists->prev);
+    PyMem_Free(lists);
+}
+
+static void
+state_destructor(PyObject *capsule)
+{
+    lists_free((Lists *)PyCapsule_GetPointer(capsule, STATE_NAME));
+}
+
+/* Compares items a and b: 1 or 0, or -1 if a rich comparison raised. */
+static inline int
+compare(Lists *lists, Py_ssize_t a, Py_ssize_t b, int op)
+{
+    switch (lists->kind) {
+    case KEYS_INT64: {
+        const long long *keys = (const long long *)lists->keys.buf;
+        return COMPARE(keys[a], keys[b], op);
+    }
+    case KEYS_DOUBLE: {
+        const double *keys = (const double *)lists->keys.buf;
+        return COMPARE(keys[a], keys[b], op);
+    }
+    default:
+        return PyObject_RichCompareBool(lists->items[a], lists->items[b], op);
+    }
+}
+
+static Py_ssize_t
+new_node(Lists *lists, Py_ssize_t item)
+{
+    Py_ssize_t node = lists->size++;
+    lists->data[node] = item;
+    lists->next[node] = NIL;
+    lists->prev[node] = NIL;
+    return node;
+}
+
+/* ---------------------------------------------------------------- tree */
+
+static void
+tree_free(Tree *tree)
+{
+    PyMem_Free(tree->value);
+    PyMem_Free(tree->reference);
+    PyMem_Free(tree->left);
+    PyMem_Free(tree->right);
+    PyMem_Free(tree->height);
+    memset(tree, 0, sizeof(Tree));
+}
+
+static int
+tree_alloc(Tree *tree, Py_ssize_t capacity)
+{
+    tree->value = PyMem_New(Py_ssize_t, capacity);
+    tree->reference = PyMem_New(Py_ssize_t, capacity);
+    tree->left = PyMem_New(Py_ssize_t, capacity);
+    tree->right = PyMem_New(Py_ssize_t, capacity);
+    tree->height = PyMem_New(int, capacity);
+    tree->size = 0;
+    tree->root = NIL;
+    if (!tree->value || !tree->reference || !tree->left || !tree->right || !tree->height) {
+        tree_free(tree);
+        PyErr_NoMemory();
+        return -1;
+    }
+    return 0;
+}
+
+static int
+height_of(Tree *tree, Py_ssize_t node)
+{
+    return node == NIL ? 0 : tree->height[node];
+}
+
+static void
+update_height(Tree *tree, Py_ssize_t node)
+{
+    int left = height_of(tree, tree->left[node]);
+    int right = height_of(tree, tree->right[node]);
+    tree->height[node] = (left > right ? left : right) + 1;
+}
+
+static Py_ssize_t
+rotate_left(Tree *tree, Py_ssize_t node)
+{
+    Py_ssize_t pivot = tree->right[node];
+    tree->right[node] = tree->left[pivot];
+    tree->left[pivot] = node;
+    update_height(tree, node);
+    update_height(tree, pivot);
+    return pivot;
+}
+
+static Py_ssize_t
+rotate_right(Tree *tree, Py_ssize_t node)
+{
+    Py_ssize_t pivot = tree->left[node];
+    tree->left[node] = tree->right[pivot];
+    tree->right[pivot] = node;
+    update_height(tree, node);
+    update_height(tree, pivot);
+    return pivot;
+}
+
+/* Inserts new_node below node and returns the new subtree root, or -2 if a
+ * comparison raised. */
+static Py_ssize_t
+tree_insert_at(Lists *lists, Tree *tree, Py_ssize_t node, Py_ssize_t new_node)
+{
+    if (node == NIL) {
+        return new_node;
+    }
+    int less = compare(lists, tree->value[new_node], tree->value[node], Py_LT);
+    if (less < 0) {
+        return -2;
+    }
+    Py_ssize_t child = tree_insert_at(lists, tree, less ? tree->left[node] : tree->right[node], new_node);
+    if (child == -2) {
+        return -2;
+    }
+    if (less) {
+        tree->left[node] = child;
+    }
+    else {
+        tree->right[node] = child;
+    }
+    update_height(tree, node);
+
+    int balance = height_of(tree, tree->left[node]) - height_of(tree, tree->right[node]);
+    if (balance > 1) {
+        Py_ssize_t left = tree->left[node];
+        if (height_of(tree, tree->left[left]) < height_of(tree, tree->right[left])) {
+            tree->left[node] = rotate_left(tree, left);
+        }
+        return rotate_right(tree, node);
+    }
+    if (balance < -1) {
+        Py_ssize_t right = tree->right[node];
+        if (height_of(tree, tree->right[right]) < height_of(tree, tree->left[right])) {
+            tree->right[node] = rotate_right(tree, right);
+        }
+        return rotate_left(tree, node);
+    }
+    return node;
+}
+
+static int
+tree_insert(Lists *lists, Tree *tree, Py_ssize_t value, Py_ssize_t reference)
+{
+    Py_ssize_t node = tree->size++;
+    tree->value[node] = value;
+    tree->reference[node] = reference;
+    tree->left[node] = NIL;
+    tree->right[node] = NIL;
+    tree->height[node] = 1;
+    Py_ssize_t root = tree_insert_at(lists, tree, tree->root, node);
+    if (root == -2) {
+        return -1;
+    }
+    tree->root = root;
+    return 0;
+}
+
+/* Reference of the nearest strictly smaller (or greater) value, NIL if
+ * there is none, -2 on error. */
+static Py_ssize_t
+tree_find_nearest(Lists *lists, Tree *tree, Py_ssize_t value, int find_smaller)
+{
+    Py_ssize_t nearest = NIL;
+    Py_ssize_t node = tree->root;
+    while (node != NIL) {
+        int found = find_smaller ? compare(lists, tree->value[node], value, Py_LT)
+                                 : compare(lists, tree->value[node], value, Py_GT);
+        if (found < 0) {
+            return -2;
+        }
+        if (found) {
+            nearest = node;
+            node = find_smaller ? tree->right[node] : tree->left[node];
+        }
+        else {
+            node = find_smaller ? tree->left[node] : tree->right[node];
+        }
+    }
+    return nearest == NIL ? NIL : tree->reference[nearest];
+}
+
+/* ---------------------------------------------------------------- lists */
+
+/* Mirrors LinkedList.insert for one batch. The tree is emptied first
+ * unless it is the list's persistent index. Returns 0, or -1 on error. */
+static int
+insert_batch(Lists *lists, int ascending, Py_ssize_t *batch, Py_ssize_t count,
+             Tree *tree, int persistent, Py_ssize_t *walked)
+{
+    Py_ssize_t *head = ascending ? &lists->asc_head : &lists->dsc_head;
+    Py_ssize_t *tail = ascending ? &lists->asc_tail : &lists->dsc_tail;
+    Py_ssize_t *length = ascending ? &lists->asc_len : &lists->dsc_len;
+
+    if (!persistent) {
+        tree->size = 0;
+        tree->root = NIL;
+    }
+
+    for (Py_ssize_t i = 0; i < count; i++) {
+        Py_ssize_t item = batch[i];
+        Py_ssize_t node;
+
+        int before_head = ascending ? compare(lists, lists->data[*head], item, Py_GE)
+                                    : compare(lists, lists->data[*head], item, Py_LE);
+        if (before_head < 0) {
+            return -1;
+        }
+        if (before_head) {
+            node = new_node(lists, item);
+            lists->next[node] = *head;
+            lists->prev[*head] = node;
+            *head = node;
+        }
+        else {
+            Py_ssize_t curr = tree_find_nearest(lists, tree, item, !ascending);
+            if (curr == -2) {
+                return -1;
+            }
+            if (curr == NIL) {
+                curr = *tail;
+            }
+            for (;;) {
+                int keep_walking = ascending ? compare(lists, lists->data[curr], item, Py_GE)
+                                             : compare(lists, lists->data[curr], item, Py_LE);
+                if (keep_walking < 0) {
+                    return -1;
+                }
+                if (!keep_walking) {
+                    break;
+                }
+                curr = lists->prev[curr];
+                (*walked)++;
+            }
+            node = new_node(lists, item);
+            Py_ssize_t following = lists->next[curr];
+            lists->next[node] = following;
+            lists->prev[node] = curr;
+            if (following == NIL) {
+                *tail = node;
+            }
+            else {
+                lists->prev[following] = node;
+            }
+            lists->next[curr] = node;
+        }
+        (*length)++;
+        if (tree_insert(lists, tree, item, node) < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/* Appends item to a list, adding it to the list's index unless that is
+ * NULL. Returns 0, or -1 on error. */
+static int
+append_node(Lists *lists, int ascending, Py_ssize_t item, Tree *index)
+{
+    Py_ssize_t node = new_node(lists, item);
+    if (ascending) {
+        lists->next[lists->asc_tail] = node;
+        lists->prev[node] = lists->asc_tail;
+        lists->asc_tail = node;
+        lists->asc_len++;
+    }
+    else {
+        lists->next[lists->dsc_tail] = node;
+        lists->prev[node] = lists->dsc_tail;
+        lists->dsc_tail = node;
+        lists->dsc_len++;
+    }
+    return index == NULL ? 0 : tree_insert(lists, index, item, node);
+}
+
+/* Inserts the pending batch into the shorter list, as the flushes in
+ * sorter._bifurcated_sort do. trees[0] is the per-batch tree, or with a
+ * persistent index trees[0] and trees[1] index the descending and
+ * ascending lists. Returns 0, or -1 on error. */
+static int
+flush(Lists *lists, Py_ssize_t *pending, Py_ssize_t count, Tree *trees, int persistent,
+      Py_ssize_t *walked, Py_ssize_t *inserted, PyObject *depths)
+{
+    int ascending = lists->asc_len < lists->dsc_len;
+    Tree *tree = persistent ? &trees[ascending] : &trees[0];
+    if (insert_batch(lists, ascending, pending, count, tree, persistent, walked) < 0) {
+        return -1;
+    }
+    if (depths != NULL) {
+        PyObject *depth = PyLong_FromLong(height_of(tree, tree->root));
+        if (depth == NULL || PyList_Append(depths, depth) < 0) {
+            Py_XDECREF(depth);
+            return -1;
+        }
+        Py_DECREF(depth);
+    }
+    inserted[ascending] += count;
+    return 0;
+}
+
+static PyObject *
+distribute(PyObject *module, PyObject *args, PyObject *kwargs)
+{
+    static char *keywords[] = {
+        "items", "min_ind", "max_ind", "pending_item_size", "collect_depths",
+        "keys", "persistent_index", NULL,
+    };
+    PyObject *list, *keys = Py_None;
+    Py_ssize_t min_ind, max_ind, pending_item_size;
+    int collect_depths, persistent = 0;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!nnnp|Op:distribute", keywords,
+                                     &PyList_Type, &list, &min_ind, &max_ind, &pending_item_size,
+                                     &collect_depths, &keys, &persistent)) {
+        return NULL;
+    }
+
+    Py_ssize_t n = PyList_GET_SIZE(list);
+    if (min_ind < 0 || min_ind >= n || max_ind < 0 || max_ind >= n || min_ind == max_ind) {
+        PyErr_SetString(PyExc_ValueError, "min_ind and max_ind must be distinct indices into items");
+        return NULL;
+    }
+
+    Lists *lists = PyMem_New(Lists, 1);
+    if (lists == NULL) {
+        return PyErr_NoMemory();
+    }
+    memset(lists, 0, sizeof(Lists));
+    lists->n = n;
+    lists->items = PyMem_New(PyObject *, n);
+    lists->data = PyMem_New(Py_ssize_t, n);
+    lists->next = PyMem_New(Py_ssize_t, n);
+    lists->prev = PyMem_New(Py_ssize_t, n);
+    Py_ssize_t *pending = PyMem_New(Py_ssize_t, n);
+    Tree trees[2];
+    memset(trees, 0, sizeof(trees));
+    PyObject *depths = NULL;
+
+    if (!lists->items || !lists->data || !lists->next || !lists->prev || !pending) {
+        PyErr_NoMemory();
+        goto error;
+    }
+    /* Own a reference to every item, so user comparison code that mutates
+     * the list cannot free anything the lists point at. */
+    for (Py_ssize_t i = 0; i < n; i++) {
+        lists->items[i] = PyList_GET_ITEM(list, i);
+        Py_INCREF(lists->items[i]);
+    }
+    if (keys != Py_None) {
+        if (PyObject_GetBuffer(keys, &lists->keys, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) < 0) {
+            goto error;
+        }
+        const char *format = lists->keys.format;
+        lists->kind = strcmp(format, "q") == 0 ? KEYS_INT64 : KEYS_DOUBLE;
+        if ((strcmp(format, "q") != 0 && strcmp(format, "d") != 0)
+            || lists->keys.itemsize != 8 || lists->keys.len != n * 8) {
+            PyErr_SetString(PyExc_ValueError, "keys must be an array('q') or array('d') as long as items");
+            goto error;
+        }
+    }
+    if (tree_alloc(&trees[0], n) < 0 || (persistent && tree_alloc(&trees[1], n) < 0)) {
+        goto error;
+    }
+    if (collect_depths && (depths = PyList_New(0)) == NULL) {
+        goto error;
+    }
+
+    lists->asc_head = lists->asc_tail = new_node(lists, min_ind);
+    lists->dsc_head = lists->dsc_tail = new_node(lists, max_ind);
+    lists->asc_len = lists->dsc_len = 1;
+    Tree *dsc_index = persistent ? &trees[0] : NULL;
+    Tree *asc_index = persistent ? &trees[1] : NULL;
+    if (persistent && (tree_insert(lists, asc_index, min_ind, lists->asc_head) < 0
+                       || tree_insert(lists, dsc_index, max_ind, lists->dsc_head) < 0)) {
+        goto error;
+    }
+
+    Py_ssize_t pending_count = 0;
+    Py_ssize_t walked = 0;
+    Py_ssize_t inserted[2] = {0, 0};  /* into the descending, ascending list */
+    Py_ssize_t asc_last = min_ind;
+    Py_ssize_t dsc_last = max_ind;
+
+    for (Py_ssize_t item = 0; item < n; item++) {
+        if (item == min_ind || item == max_ind) {
+            continue;
+        }
+
+        int fits_asc = compare(lists, asc_last, item, Py_LE);
+        if (fits_asc < 0) {
+            goto error;
+        }
+        if (fits_asc) {
+            int fits_dsc = compare(lists, item, dsc_last, Py_LE);
+            if (fits_dsc < 0) {
+                goto error;
+            }
+            if (fits_dsc && lists->dsc_len <= lists->asc_len) {
+                if (append_node(lists, 0, item, dsc_index) < 0) {
+                    goto error;
+                }
+                dsc_last = item;
+            }
+            else {
+                if (append_node(lists, 1, item, asc_index) < 0) {
+                    goto error;
+                }
+                asc_last = item;
+            }
+            continue;
+        }
+
+        int fits_dsc = compare(lists, item, dsc_last, Py_LE);
+        if (fits_dsc < 0) {
+            goto error;
+        }
+        if (fits_dsc) {
+            if (append_node(lists, 0, item, dsc_index) < 0) {
+                goto error;
+            }
+            dsc_last = item;
+            continue;
+        }
+
+        pending[pending_count++] = item;
+        if (pending_count == pending_item_size) {
+            if (flush(lists, pending, pending_count, trees, persistent, &walked, inserted, depths) < 0) {
+                goto error;
+            }
+            pending_count = 0;
+        }
+    }
+
+    if (pending_count != 0
+        && flush(lists, pending, pending_count, trees, persistent, &walked, inserted, depths) < 0) {
+        goto error;
+    }
+
+    tree_free(&trees[0]);
+    tree_free(&trees[1]);
+    PyMem_Free(pending);
+
+    PyObject *state = PyCapsule_New(lists, STATE_NAME, state_destructor);
+    if (state == NULL) {
+        lists_free(lists);
+        Py_XDECREF(depths);
+        return NULL;
+    }
+    if (depths == NULL) {
+        depths = Py_None;
+        Py_INCREF(depths);
+    }
+    return Py_BuildValue("(NnnnnnN)", state, walked, inserted[1], inserted[0],
+                         lists->asc_len, lists->dsc_len, depths);
+
+error:
+    tree_free(&trees[0]);
+    tree_free(&trees[1]);
+    PyMem_Free(pending);
+    lists_free(lists);
+    Py_XDECREF(depths);
+    return NULL;
+}
+
+static int
+store(PyObject *list, Py_ssize_t n, Py_ssize_t idx, PyObject *item)
+{
+    if (PyList_GET_SIZE(list) != n) {
+        PyErr_SetString(PyExc_ValueError, "list modified during sort");
+        return -1;
+    }
+    /* Every item the list holds is also owned by the state, so dropping
+     * the old reference here can never run a destructor. */
+    PyObject *old = PyList_GET_ITEM(list, idx);
+    Py_INCREF(item);
+    PyList_SET_ITEM(list, idx, item);
+    Py_DECREF(old);
+    return 0;
+}
+
+static PyObject *
+merge(PyObject *module, PyObject *args)
+{
+    PyObject *capsule, *list;
+    int reverse;
+
+    if (!PyArg_ParseTuple(args, "OO!p:merge", &capsule, &PyList_Type, &list, &reverse)) {
+        return NULL;
+    }
+    Lists *lists = (Lists *)PyCapsule_GetPointer(capsule, STATE_NAME);
+    if (lists == NULL) {
+        return NULL;
+    }
+    Py_ssize_t n = lists->n;
+    if (PyList_GET_SIZE(list) != n) {
+        PyErr_SetString(PyExc_ValueError, "list size does not match the distributed items");
+        return NULL;
+    }
+
+    /* Ascending order walks the ascending list from its head and the
+     * descending list from its tail; reverse order the other way round. */
+    Py_ssize_t asc = reverse ? lists->asc_tail : lists->asc_head;
+    Py_ssize_t dsc = reverse ? lists->dsc_head : lists->dsc_tail;
+    Py_ssize_t *asc_step = reverse ? lists->prev : lists->next;
+    Py_ssize_t *dsc_step = reverse ? lists->next : lists->prev;
+    Py_ssize_t idx = 0;
+
+    while (asc != NIL && dsc != NIL) {
+        int take_asc = reverse ? compare(lists, lists->data[asc], lists->data[dsc], Py_GT)
+                               : compare(lists, lists->data[asc], lists->data[dsc], Py_LT);
+        if (take_asc < 0) {
+            return NULL;
+        }
+        if (take_asc) {
+            if (store(list, n, idx, lists->items[lists->data[asc]]) < 0) {
+                return NULL;
+            }
+            asc = asc_step[asc];
+        }
+        else {
+            if (store(list, n, idx, lists->items[lists->data[dsc]]) < 0) {
+                return NULL;
+            }
+            dsc = dsc_step[dsc];
+        }
+        idx++;
+    }
+    Py_ssize_t comparisons = idx;
+
+    for (; asc != NIL; asc = asc_step[asc], idx++) {
+        if (store(list, n, idx, lists->items[lists->data[asc]]) < 0) {
+            return NULL;
+        }
+    }
+    for (; dsc != NIL; dsc = dsc_step[dsc], idx++) {
+        if (store(list, n, idx, lists->items[lists->data[dsc]]) < 0) {
+            return NULL;
+        }
+    }
+    return PyLong_FromSsize_t(comparisons);
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"distribute", (PyCFunction)(void (*)(void))distribute, METH_VARARGS | METH_KEYWORDS,
+     "distribute(items, min_ind, max_ind, pending_item_size, collect_depths,\n"
+     "           keys=None, persistent_index=False)\n"
+     "--\n\n"
+     "Build the ascending and descending lists from items, inserting pending batches.\n"
+     "keys, an array('q') or array('d') copy of items, makes every comparison unboxed.\n"
+     "persistent_index keeps one tree per list over all its nodes instead of one per batch."},
+    {"merge", merge, METH_VARARGS,
+     "merge(state, items, reverse)\n"
+     "--\n\n"
+     "Merge the lists built by distribute() back into items; returns the comparison count."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "bifurcated_sort._speedups",
+    "Compiled distribute, insert and merge phases for bifurcated_sort.",
+    -1,
+    speedups_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    return PyModule_Create(&speedups_module);
+}
@@ -0,0 +1,154 @@
+import asyncio
+import heapq
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+from time import perf_counter
+
+from .sorter import bfc_sort, _sequence_target, _write_back
+
+# Items merged between two checks of the slice clock.
+ASYNC_CHECK_EVERY = 256
+
+# Size of the first chunk the cooperative path sorts with one bfc_sort call,
+# and the smallest one; later chunks are sized from the time the last took.
+ASYNC_MIN_CHUNK = 256
+
+async def _yield_to_loop(loop):
+    # asyncio.sleep(0) resumes this coroutine on the very next loop pass,
+    # before tasks whose timer or I/O just fired have been woken, which
+    # takes a pass for the callback and one for the task. Waiting on a timer
+    # as well puts the sort behind them.
+    waiter = loop.create_future()
+    loop.call_later(0, waiter.set_result, None)
+    await waiter
+
+async def bfc_sort_async(array, inplace=True, reverse=False, key=None, max_slice=0.005, executor=None, **kwargs):
+    """
+    Sort without blocking the asyncio event loop.
+
+    By default the sort runs on the loop in cooperative slices. The input is
+    cut into chunks, each sorted by one ``bfc_sort`` call and sized so that
+    call takes about half of ``max_slice``, and the sorted chunks are then
+    k-way merged; whenever a slice has run for ``max_slice`` seconds the
+    coroutine yields to the loop. No linked list or tree outlives its chunk,
+    so between slices the sort holds only plain lists of items and the
+    garbage collector has no per-item nodes to traverse. With ``executor``
+    the whole ``bfc_sort`` call runs there instead and the coroutine awaits
+    it; a ``ProcessPoolExecutor`` also keeps the sort's CPU time off the
+    loop's process, while a thread pool shares the GIL with it.
+
+    Args:
+        array (list | MutableSequence | buffer): Items to sort, as for ``bfc_sort``
+        inplace (bool): Write the result into ``array`` if True, return a new sorted
+            list if False (default: True)
+        reverse (bool): Sort in descending order if True (default: False)
+        key (callable): One-argument function extracting a comparison key (default: None)
+        max_slice (float): Seconds the cooperative sort runs before yielding to
+            the loop (default: 0.005)
+        executor (concurrent.futures.Executor): Run ``bfc_sort`` in this thread or
+            process pool instead of slicing on the loop (default: None)
+        **kwargs: Other ``bfc_sort`` options, used for the whole sort with an
+            executor and for each chunk otherwise
+
+    Returns:
+        list: None if inplace=True, else a new sorted list
+
+    Raises:
+        TypeError: If array is not a list, mutable sequence or 1-D buffer, max_slice is
+            not a number or executor is not an Executor, or as ``bfc_sort``
+        ValueError: If max_slice is not positive, or as ``bfc_sort``
+
+    Examples:
+        >>> import asyncio
+        >>> from bifurcated_sort import bfc_sort_async
+        >>> arr = [5, 2, 8, 1, 9]
+        >>> asyncio.run(bfc_sort_async(arr))
+        >>> arr
+        [1, 2, 5, 8, 9]
+    """
+    if not isinstance(max_slice, (int, float)) or isinstance(max_slice, bool):
+        raise TypeError(
+            f"max_slice must be a number, got {type(max_slice).__name__}"
+        )
+
+    if not max_slice > 0:
+        raise ValueError(f"max_slice must be positive, got {max_slice}")
+
+    if executor is not None and not isinstance(executor, Executor):
+        raise TypeError(
+            f"executor must be a concurrent.futures.Executor or None, got {type(executor).__name__}"
+        )
+
+    if not isinstance(inplace, bool):
+        raise TypeError(
+            f"inplace must be a boolean (True or False), "
+            f"got {type(inplace).__name__}: {inplace}"
+        )
+
+    target = array if isinstance(array, list) else _sequence_target(array)
+    if target is None:
+        raise TypeError(
+            f"array must be a list or another mutable sequence, got {type(array).__name__}"
+        )
+    if isinstance(target, memoryview) and target.ndim != 1:
+        raise TypeError(f"array must be one-dimensional, got {target.ndim} dimensions")
+    if isinstance(target, memoryview) and inplace and target.readonly:
+        raise ValueError("array is read-only, pass inplace=False to get a sorted copy")
+
+    loop = asyncio.get_running_loop()
+
+    if executor is not None:
+        # The worker sorts a list of its own: a process pool could not write
+        # into the caller's array, and a thread must not while the loop runs.
+        items = target.tolist() if isinstance(target, memoryview) else list(target)
+        result = await loop.run_in_executor(
+            executor, partial(bfc_sort, items, inplace=False, reverse=reverse, key=key, **kwargs),
+        )
+    else:
+        # Options are checked before any chunk is sorted, so bad ones fail
+        # on an empty input too.
+        bfc_sort([], reverse=reverse, key=key, **kwargs)
+
+        items = iter(target)
+        if key is not None:
+            # Same decoration as bfc_sort, once for the whole input, so the
+            # chunks and the merge order equal keys by input index.
+            step = -1 if reverse else 1
+            items = ((key(item), i * step, item) for i, item in enumerate(items))
+
+        chunks = []
+        chunk_items = ASYNC_MIN_CHUNK
+        slice_start = perf_counter()
+        while True:
+            chunk_start = perf_counter()
+            chunk = list(islice(items, chunk_items))
+            if not chunk:
+                break
+            bfc_sort(chunk, reverse=reverse, **kwargs)
+            chunks.append(chunk)
+            now = perf_counter()
+            chunk_time = now - chunk_start
+            # Aim each chunk at half a slice, growing at most twofold a step,
+            # and yield unless another chunk like this one still fits.
+            target_items = chunk_items * max_slice / 2 / max(chunk_time, 1e-9)
+            chunk_items = max(ASYNC_MIN_CHUNK, min(2 * chunk_items, int(target_items)))
+            if now - slice_start + chunk_time >= max_slice:
+                await _yield_to_loop(loop)
+                slice_start = perf_counter()
+
+        merged = heapq.merge(*chunks, reverse=reverse)
+        if key is not None:
+            merged = (entry[2] for entry in merged)
+        result = []
+        append = result.append
+        for i, item in enumerate(merged, 1):
+            append(item)
+            if i % ASYNC_CHECK_EVERY == 0 and perf_counter() - slice_start >= max_slice:
+                await _yield_to_loop(loop)
+                slice_start = perf_counter()
+
+    if not inplace:
+        return result
+    _write_back(target, result)
+    return None
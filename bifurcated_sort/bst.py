@@ -1,16 +1,22 @@
+import random
+
 from .node import TreeNode as Node
+from .node import AVLTreeNode, OrderStatisticNode, RedBlackTreeNode, TreapNode
 
 class BST:
     def __init__(self):
         self.root = None
+        self._insert_depth = 0
     
     def insert(self, value, reference=None):
         new_node = Node(value, reference)
         if not self.root:
             self.root = new_node
+            self._insert_depth = 1
             return
 
         current_node = self.root
+        depth = 2
         while True:
             if value < current_node.value:
                 if current_node.left:
@@ -24,6 +30,9 @@ class BST:
                 else:
                     current_node.right = new_node
                     break
+            depth += 1
+        if depth > self._insert_depth:
+            self._insert_depth = depth
     
     def find_nearest(self, value, find_smaller=True):
         if find_smaller:
@@ -51,4 +60,384 @@ class BST:
                 node = node.left
             else:
                 node = node.right
-        return nearest.reference if nearest else None
\ No newline at end of file
+        return nearest.reference if nearest else None
+
+    def depth(self):
+        depth = 0
+        level = [self.root] if self.root else []
+        while level:
+            depth += 1
+            level = [child for node in level for child in (node.left, node.right) if child]
+        return depth
+
+    def max_insert_depth(self):
+        """
+        Deepest level any insert placed a node at, tracked during the
+        inserts, so O(1). Equals ``depth()`` for this tree; the rotations of
+        the balanced subclasses move nodes after they are placed.
+        """
+        return self._insert_depth
+
+
+class AVLTree(BST):
+    """
+    Height-balanced BST. Lookups stay O(log n) even when values arrive
+    already sorted, which degrades the plain BST into a linked chain.
+    """
+
+    def insert(self, value, reference=None):
+        new_node = AVLTreeNode(value, reference)
+        if not self.root:
+            self.root = new_node
+            return
+
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self._retrace(path)
+
+    def _retrace(self, path):
+        # Walk back up from the new leaf's parent, fixing heights until one
+        # is unchanged or a single rotation restores the balance.
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            left_height = node.left.height if node.left else 0
+            right_height = node.right.height if node.right else 0
+            height = (left_height if left_height > right_height else right_height) + 1
+            balance = left_height - right_height
+
+            if -1 <= balance <= 1:
+                if node.height == height:
+                    return
+                node.height = height
+                continue
+
+            subtree = self._rebalance(node, balance)
+            if i == 0:
+                self.root = subtree
+            elif path[i - 1].left is node:
+                path[i - 1].left = subtree
+            else:
+                path[i - 1].right = subtree
+            return
+
+    def _rebalance(self, node, balance):
+        if balance > 1:
+            child = node.left
+            if self._balance(child) < 0:
+                node.left = self._rotate_left(child)
+            return self._rotate_right(node)
+
+        child = node.right
+        if self._balance(child) > 0:
+            node.right = self._rotate_right(child)
+        return self._rotate_left(node)
+
+    def depth(self):
+        return self._height(self.root)
+
+    def max_insert_depth(self):
+        # The stored height is exact and already O(1).
+        return self._height(self.root)
+
+    @staticmethod
+    def _height(node):
+        return node.height if node else 0
+
+    def _balance(self, node):
+        return self._height(node.left) - self._height(node.right)
+
+    def _update_height(self, node):
+        node.height = max(self._height(node.left), self._height(node.right)) + 1
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+
+
+class OrderStatisticTree(AVLTree):
+    """
+    AVL tree whose nodes also count the size of their subtree, so values
+    can be looked up by rank and deleted in O(log n). Equal values keep
+    their insertion order, as in the other trees.
+    """
+
+    @classmethod
+    def from_sorted(cls, pairs):
+        """Build a balanced tree in O(n) from sorted (value, reference) pairs."""
+        def build(lo, hi):
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = OrderStatisticNode(*pairs[mid])
+            node.left = build(lo, mid)
+            node.right = build(mid + 1, hi)
+            tree._update_height(node)
+            return node
+
+        tree = cls()
+        tree.root = build(0, len(pairs))
+        return tree
+
+    def __len__(self):
+        return self.root.size if self.root else 0
+
+    def insert(self, value, reference=None):
+        new_node = OrderStatisticNode(value, reference)
+        if not self.root:
+            self.root = new_node
+            return
+
+        path = []
+        node = self.root
+        while node:
+            node.size += 1
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self._retrace(path)
+
+    def bisect_left(self, value):
+        """Number of values smaller than ``value``."""
+        rank = 0
+        node = self.root
+        while node:
+            if node.value < value:
+                rank += (node.left.size if node.left else 0) + 1
+                node = node.right
+            else:
+                node = node.left
+        return rank
+
+    def bisect_right(self, value):
+        """Number of values smaller than or equal to ``value``."""
+        rank = 0
+        node = self.root
+        while node:
+            if value < node.value:
+                node = node.left
+            else:
+                rank += (node.left.size if node.left else 0) + 1
+                node = node.right
+        return rank
+
+    def select(self, index):
+        """Node holding the value of rank ``index`` (0 <= index < len)."""
+        node = self.root
+        while True:
+            left_size = node.left.size if node.left else 0
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def delete_at(self, index):
+        """Remove the value of rank ``index`` and return its (value, reference)."""
+        self.root, removed = self._delete_at(self.root, index)
+        return removed
+
+    def _delete_at(self, node, index):
+        left_size = node.left.size if node.left else 0
+        if index < left_size:
+            node.left, removed = self._delete_at(node.left, index)
+        elif index > left_size:
+            node.right, removed = self._delete_at(node.right, index - left_size - 1)
+        else:
+            removed = (node.value, node.reference)
+            if node.left is None:
+                return node.right, removed
+            if node.right is None:
+                return node.left, removed
+            # Take over the successor's value, which keeps the order of equal values.
+            node.right, (node.value, node.reference) = self._delete_at(node.right, 0)
+
+        self._update_height(node)
+        balance = self._balance(node)
+        if -1 <= balance <= 1:
+            return node, removed
+        return self._rebalance(node, balance), removed
+
+    def _update_height(self, node):
+        left, right = node.left, node.right
+        node.height = max(left.height if left else 0, right.height if right else 0) + 1
+        node.size = (left.size if left else 0) + (right.size if right else 0) + 1
+
+
+class RedBlackTree(BST):
+    """
+    Red-black BST. Cheaper to maintain than AVL (at most two rotations
+    per insert) at the cost of a slightly taller tree.
+    """
+
+    def insert(self, value, reference=None):
+        new_node = RedBlackTreeNode(value, reference)
+        if not self.root:
+            new_node.red = False
+            self.root = new_node
+            self._insert_depth = 1
+            return
+
+        parent = None
+        node = self.root
+        depth = 1
+        while node:
+            parent = node
+            node = node.left if value < node.value else node.right
+            depth += 1
+        if depth > self._insert_depth:
+            self._insert_depth = depth
+
+        new_node.parent = parent
+        if value < parent.value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        self._fix_insert(new_node)
+
+    def _fix_insert(self, node):
+        parent = node.parent
+        while parent and parent.red:
+            grandparent = parent.parent
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if uncle and uncle.red:
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                else:
+                    if node is parent.right:
+                        self._rotate_left(parent)
+                        node, parent = parent, node
+                    parent.red = False
+                    grandparent.red = True
+                    self._rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+                if uncle and uncle.red:
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                else:
+                    if node is parent.left:
+                        self._rotate_right(parent)
+                        node, parent = parent, node
+                    parent.red = False
+                    grandparent.red = True
+                    self._rotate_left(grandparent)
+            parent = node.parent
+        self.root.red = False
+
+    def _replace_child(self, node, pivot):
+        parent = node.parent
+        pivot.parent = parent
+        if parent is None:
+            self.root = pivot
+        elif parent.left is node:
+            parent.left = pivot
+        else:
+            parent.right = pivot
+        node.parent = pivot
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left:
+            pivot.left.parent = node
+        self._replace_child(node, pivot)
+        pivot.left = node
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right:
+            pivot.right.parent = node
+        self._replace_child(node, pivot)
+        pivot.right = node
+
+
+class Treap(BST):
+    """
+    Randomised BST: each node gets a random heap priority, which keeps the
+    expected depth logarithmic for any insertion order.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._random = random.random
+
+    def insert(self, value, reference=None):
+        new_node = TreapNode(value, reference, self._random())
+        if not self.root:
+            self.root = new_node
+            self._insert_depth = 1
+            return
+
+        path = []
+        node = self.root
+        while node:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        if len(path) >= self._insert_depth:
+            self._insert_depth = len(path) + 1
+
+        parent = path[-1]
+        if value < parent.value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+
+        for i in range(len(path) - 1, -1, -1):
+            parent = path[i]
+            if parent.priority <= new_node.priority:
+                return
+
+            if parent.left is new_node:
+                parent.left = new_node.right
+                new_node.right = parent
+            else:
+                parent.right = new_node.left
+                new_node.left = parent
+
+            if i == 0:
+                self.root = new_node
+            elif path[i - 1].left is parent:
+                path[i - 1].left = new_node
+            else:
+                path[i - 1].right = new_node
+
+
+TREE_TYPES = {
+    'bst': BST,
+    'avl': AVLTree,
+    'rb': RedBlackTree,
+    'treap': Treap,
+}
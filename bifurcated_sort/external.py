@@ -0,0 +1,176 @@
+import heapq
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+
+from .sorter import bfc_sort
+
+NUMERIC_TYPECODES = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q', 'f', 'd')
+
+# Rough peak cost of sorting a chunk per item, including the int or float
+# objects of the chunk list. Measured on the costliest path, pure-Python
+# float chunks; int chunks that take the counting or radix sort fallbacks
+# and chunks sorted by the compiled module stay well below it. Used to turn
+# a byte budget into a chunk size.
+BYTES_PER_SORTED_ITEM = 180
+
+# Items buffered before each write of the merged output.
+OUTPUT_BLOCK_ITEMS = 1 << 16
+
+
+def _read_runs(input_path, typecode, chunk_items, reverse, tmp_dir):
+    runs = []
+    try:
+        with open(input_path, 'rb') as source:
+            while True:
+                chunk = array(typecode)
+                try:
+                    chunk.fromfile(source, chunk_items)
+                except EOFError:
+                    pass  # short final chunk, whatever was read is kept
+                if not chunk:
+                    break
+
+                items = chunk.tolist()
+                del chunk
+                bfc_sort(items, reverse=reverse)
+
+                fd, run_path = tempfile.mkstemp(prefix='bfc_run_', suffix='.bin', dir=tmp_dir)
+                runs.append(run_path)
+                with os.fdopen(fd, 'wb') as run_file:
+                    array(typecode, items).tofile(run_file)
+
+                if len(items) < chunk_items:
+                    break
+    except BaseException:
+        for run_path in runs:
+            os.unlink(run_path)
+        raise
+    return runs
+
+
+def _iter_run(run_file, typecode):
+    # Memory-mapped so a run is paged in as the merge reaches it instead
+    # of being read back whole.
+    with mmap.mmap(run_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped).cast(typecode)
+        try:
+            yield from view
+        finally:
+            view.release()
+
+
+def _merge_runs(runs, output_path, typecode, reverse):
+    run_files = [open(run_path, 'rb') for run_path in runs]
+    try:
+        merged = heapq.merge(
+            *(_iter_run(run_file, typecode) for run_file in run_files),
+            reverse=reverse,
+        )
+        with open(output_path, 'wb') as output:
+            block = array(typecode)
+            for item in merged:
+                block.append(item)
+                if len(block) == OUTPUT_BLOCK_ITEMS:
+                    block.tofile(output)
+                    block = array(typecode)
+            block.tofile(output)
+    finally:
+        for run_file in run_files:
+            run_file.close()
+
+
+def bfc_sort_file(
+    input_path,
+    output_path=None,
+    typecode='q',
+    memory_limit=256 * 2**20,
+    reverse=False,
+    tmp_dir=None,
+):
+    """
+    Sort a binary file of fixed-width numbers that may be larger than RAM.
+
+    The file is read in chunks sized to ``memory_limit``, each chunk is sorted
+    with ``bfc_sort`` and spilled to a temporary run file, then the runs are
+    k-way merged through memory-mapped reads into ``output_path``.
+
+    Args:
+        input_path (str | PathLike): File of native-endian values in ``typecode`` format
+        output_path (str | PathLike): Destination file; the input is replaced if None (default: None)
+        typecode (str): ``array`` typecode of the stored values (default: 'q', 64-bit signed int)
+        memory_limit (int): Approximate bytes of memory the chunk sort may use (default: 256 MiB)
+        reverse (bool): Sort in descending order if True (default: False)
+        tmp_dir (str | PathLike): Directory for run files, the system default if None
+
+    Returns:
+        int: Number of runs the input was split into
+
+    Raises:
+        TypeError: If memory_limit is not an integer or reverse is not a boolean
+        ValueError: If typecode is not numeric, memory_limit is too small, or the
+            file size is not a multiple of the item size
+
+    Examples:
+        >>> from bifurcated_sort import bfc_sort_file
+        >>> bfc_sort_file("ids.bin", "ids.sorted.bin", memory_limit=512 * 2**20)
+    """
+
+    if typecode not in NUMERIC_TYPECODES:
+        raise ValueError(
+            f"typecode must be one of {', '.join(repr(code) for code in NUMERIC_TYPECODES)}, "
+            f"got {typecode!r}"
+        )
+
+    if not isinstance(memory_limit, int) or isinstance(memory_limit, bool):
+        raise TypeError(
+            f"memory_limit must be an integer, got {type(memory_limit).__name__}"
+        )
+
+    if memory_limit < BYTES_PER_SORTED_ITEM:
+        raise ValueError(
+            f"memory_limit must be at least {BYTES_PER_SORTED_ITEM} bytes, got {memory_limit}"
+        )
+
+    if not isinstance(reverse, bool):
+        raise TypeError(
+            f"reverse must be a boolean (True or False), "
+            f"got {type(reverse).__name__}: {reverse}"
+        )
+
+    itemsize = array(typecode).itemsize
+    file_size = os.path.getsize(input_path)
+    if file_size % itemsize:
+        raise ValueError(
+            f"file size {file_size} is not a multiple of the {itemsize}-byte item size"
+        )
+
+    if output_path is None:
+        output_path = input_path
+
+    chunk_items = memory_limit // BYTES_PER_SORTED_ITEM
+    runs = _read_runs(input_path, typecode, chunk_items, reverse, tmp_dir)
+    run_count = len(runs)
+    try:
+        if not runs:
+            open(output_path, 'wb').close()
+        elif len(runs) == 1:
+            shutil.move(runs.pop(), output_path)
+        else:
+            fd, merged_path = tempfile.mkstemp(
+                prefix='bfc_merged_', suffix='.bin',
+                dir=os.path.dirname(os.path.abspath(output_path)),
+            )
+            os.close(fd)
+            try:
+                _merge_runs(runs, merged_path, typecode, reverse)
+                os.replace(merged_path, output_path)
+            except BaseException:
+                os.unlink(merged_path)
+                raise
+        return run_count
+    finally:
+        for run_path in runs:
+            os.unlink(run_path)
@@ -1,12 +1,28 @@
+from random import getrandbits
+
 from .node import LinkedListNode as Node
+from .node import NodeArrays, RunLengthNode, SkipListNode
 from .bst import BST
 
 class LinkedList:
-  def __init__(self, data, order = 'ASC'):
+  """
+  Doubly linked list kept in ``order``. Pending items are placed with a
+  nearest-value tree built per ``insert`` batch or, with
+  ``persistent_index=True``, with one tree over every node that append,
+  prepend and insert keep up to date, so a walk only crosses equal values.
+  """
+  def __init__(self, data, order = 'ASC', tree_class = BST, persistent_index = False):
     self.tail = self.head = Node(data)
     self.sum_of_t = 0
     self.length = 1
     self.order = order
+    self.tree_class = tree_class
+    self.walked = 0
+    self.walk_comparisons = 0
+    self.index = None
+    if persistent_index:
+        self.index = tree_class()
+        self.index.insert(data, self.head)
     if order == 'ASC':
         self.find_smaller = False
         self.compare = lambda x, y: x >= y
@@ -47,23 +63,51 @@ class LinkedList:
     node.prev = self.tail
     self.tail = node
     self.length += 1
+    if self.index is not None:
+        self.index.insert(data, node)
 
   def last(self):
     return self.tail.data
+
+  def first(self):
+    return self.head.data
+
+  def prepend(self, data):
+    node = Node(data)
+    node.next = self.head
+    self.head.prev = node
+    self.head = node
+    self.length += 1
+    if self.index is not None:
+        self.index.insert(data, node)
+    return node
   
   def insert(self, data_list):
-      processed_item = BST()
+      index = self.index
+      processed_item = index if index is not None else self.tree_class()
+      compare = self.compare
 
       for data in data_list:
-        inserted_node_ref = processed_item.find_nearest(data, self.find_smaller)
-        ptr = inserted_node_ref if inserted_node_ref is not None else self.tail
-        inserted_node = self.insert_in_order(data, ptr)
-        processed_item.insert(data, inserted_node)
+        if compare(self.head.data, data):
+          # Belongs in front of the head: only possible when the list was not
+          # seeded with the overall min/max, as in BifurcatedSorter.
+          inserted_node = self.prepend(data)
+        else:
+          inserted_node_ref = processed_item.find_nearest(data, self.find_smaller)
+          ptr = inserted_node_ref if inserted_node_ref is not None else self.tail
+          inserted_node = self.insert_in_order(data, ptr)
+        if index is None:
+          processed_item.insert(data, inserted_node)
+      return processed_item
 
 
   def insert_in_order(self, data, curr_item):
+      walked = 0
       while self.compare(curr_item.data, data):
           curr_item = curr_item.prev
+          walked += 1
+      self.walked += walked
+      self.walk_comparisons += walked + 1
 
       node = Node(data)
       node.next = curr_item.next
@@ -71,4 +115,403 @@ class LinkedList:
       curr_item.next.prev = node
       curr_item.next = node
       self.length += 1
-      return node
\ No newline at end of file
+      if self.index is not None:
+          self.index.insert(data, node)
+      return node
+
+
+class ArrayLinkedList:
+  """
+  Doubly linked list whose nodes live in a shared NodeArrays pool instead
+  of one LinkedListNode object per element. Nodes are referred to by their
+  integer index, so the BST references stored during insert are ints too.
+  Same interface as LinkedList.
+  """
+  def __init__(self, data, order = 'ASC', tree_class = BST, pool = None, persistent_index = False):
+    self.pool = pool if pool is not None else NodeArrays()
+    self.tail = self.head = self.pool.new(data)
+    self.length = 1
+    self.order = order
+    self.tree_class = tree_class
+    self.walked = 0
+    self.walk_comparisons = 0
+    self.index = None
+    if persistent_index:
+        self.index = tree_class()
+        self.index.insert(data, self.head)
+    if order == 'ASC':
+        self.find_smaller = False
+        self.compare = lambda x, y: x >= y
+        self.iterator_function = self.__iter_from_head__
+        self.reverse_iterator_function = self.__iter_from_tail__
+    else:
+        self.find_smaller = True
+        self.compare = lambda x, y: x <= y
+        self.iterator_function = self.__iter_from_tail__
+        self.reverse_iterator_function = self.__iter_from_head__
+
+  def __len__(self):
+    return self.length
+
+  def __iter__(self):
+      return self.iterator_function()
+
+  def __reversed__(self):
+      return self.reverse_iterator_function()
+
+  def __iter_from_head__(self):
+      data, next_ = self.pool.data, self.pool.next
+      current = self.head
+      while current != -1:
+          yield data[current]
+          current = next_[current]
+      return None
+
+  def __iter_from_tail__(self):
+      data, prev = self.pool.data, self.pool.prev
+      current = self.tail
+      while current != -1:
+          yield data[current]
+          current = prev[current]
+      return None
+
+  def append(self, data):
+    pool = self.pool
+    node = pool.new(data)
+    pool.next[self.tail] = node
+    pool.prev[node] = self.tail
+    self.tail = node
+    self.length += 1
+    if self.index is not None:
+        self.index.insert(data, node)
+
+  def last(self):
+    return self.pool.data[self.tail]
+
+  def first(self):
+    return self.pool.data[self.head]
+
+  def prepend(self, data):
+    pool = self.pool
+    node = pool.new(data)
+    pool.next[node] = self.head
+    pool.prev[self.head] = node
+    self.head = node
+    self.length += 1
+    if self.index is not None:
+        self.index.insert(data, node)
+    return node
+
+  def insert(self, data_list):
+      index = self.index
+      processed_item = index if index is not None else self.tree_class()
+      compare = self.compare
+
+      for data in data_list:
+        if compare(self.pool.data[self.head], data):
+          # Belongs in front of the head: only possible when the list was not
+          # seeded with the overall min/max, as in BifurcatedSorter.
+          inserted_node = self.prepend(data)
+        else:
+          inserted_node_ref = processed_item.find_nearest(data, self.find_smaller)
+          ptr = inserted_node_ref if inserted_node_ref is not None else self.tail
+          inserted_node = self.insert_in_order(data, ptr)
+        if index is None:
+          processed_item.insert(data, inserted_node)
+      return processed_item
+
+  def insert_in_order(self, data, curr_item):
+      pool = self.pool
+      values, prev = pool.data, pool.prev
+      compare = self.compare
+      walked = 0
+      while compare(values[curr_item], data):
+          curr_item = prev[curr_item]
+          walked += 1
+      self.walked += walked
+      self.walk_comparisons += walked + 1
+
+      node = pool.new(data)
+      # new() may have grown the pool and replaced the index arrays
+      prev, next_ = pool.prev, pool.next
+      following = next_[curr_item]
+      next_[node] = following
+      prev[node] = curr_item
+      prev[following] = node
+      next_[curr_item] = node
+      self.length += 1
+      if self.index is not None:
+          self.index.insert(data, node)
+      return node
+
+
+class RunLengthLinkedList(LinkedList):
+  """
+  LinkedList that stores a run of equal items as one node: the first
+  item is the node's ``data`` and the others go to its ``dups`` list, so
+  memory grows with the number of distinct values and a walk steps over
+  each value once. ``len`` still counts items. Deciding whether an item
+  joins a run costs one ``==`` comparison per append or insert, counted
+  in ``walk_comparisons``. Same interface as LinkedList.
+
+  With ``decorated=True`` the items are ``(key, index, item)`` tuples as
+  ``bfc_sort`` builds them for ``key``: runs form on the key and keep their
+  items in arrival order, for the merge to put in index order.
+  """
+  def __init__(self, data, order = 'ASC', tree_class = BST, persistent_index = False, decorated = False):
+    super().__init__(data, order, tree_class)
+    self.tail = self.head = RunLengthNode(data)
+    self.nodes = 1
+    self.decorated = decorated
+    if persistent_index:
+        self.index = tree_class()
+        self.index.insert(data, self.head)
+
+  def __iter_from_head__(self):
+      current = self.head
+      while current:
+          yield current.data
+          if current.dups:
+              yield from current.dups
+          current = current.next
+
+  def __iter_from_tail__(self):
+      current = self.tail
+      while current:
+          yield current.data
+          if current.dups:
+              yield from current.dups
+          current = current.prev
+
+  def iter_nodes(self, reverse = False):
+      """Yield the nodes in ascending order of their values, descending if ``reverse``."""
+      forward = (self.order == 'ASC') != reverse
+      current = self.head if forward else self.tail
+      while current:
+          yield current
+          current = current.next if forward else current.prev
+
+  def _same_run(self, node, data):
+      self.walk_comparisons += 1
+      if self.decorated:
+          return node.data[0] == data[0]
+      return node.data == data
+
+  def _absorb(self, node, data):
+      if node.dups is None:
+          node.dups = [data]
+      else:
+          node.dups.append(data)
+      self.length += 1
+      return node
+
+  def append(self, data):
+    if self._same_run(self.tail, data):
+        self._absorb(self.tail, data)
+        return
+    node = RunLengthNode(data)
+    self.tail.next = node
+    node.prev = self.tail
+    self.tail = node
+    self.length += 1
+    self.nodes += 1
+    if self.index is not None:
+        self.index.insert(data, node)
+
+  def prepend(self, data):
+    if self._same_run(self.head, data):
+        return self._absorb(self.head, data)
+    node = RunLengthNode(data)
+    node.next = self.head
+    self.head.prev = node
+    self.head = node
+    self.length += 1
+    self.nodes += 1
+    if self.index is not None:
+        self.index.insert(data, node)
+    return node
+
+  def insert(self, data_list):
+      index = self.index
+      processed_item = index if index is not None else self.tree_class()
+      compare = self.compare
+
+      for data in data_list:
+        nodes = self.nodes
+        if compare(self.head.data, data):
+          inserted_node = self.prepend(data)
+        else:
+          inserted_node_ref = processed_item.find_nearest(data, self.find_smaller)
+          ptr = inserted_node_ref if inserted_node_ref is not None else self.tail
+          inserted_node = self.insert_in_order(data, ptr)
+        # Items that joined an existing run are found through its neighbours.
+        if index is None and self.nodes != nodes:
+          processed_item.insert(data, inserted_node)
+      return processed_item
+
+  def insert_in_order(self, data, curr_item):
+      walked = 0
+      while self.compare(curr_item.data, data):
+          curr_item = curr_item.prev
+          walked += 1
+      self.walked += walked
+      self.walk_comparisons += walked + 1
+
+      # The last node stepped over is the only one that can hold data's run.
+      # Decorated items also compare by index within a key, so there the
+      # walk can stop on the node of data's run instead.
+      if self.decorated and self._same_run(curr_item, data):
+          return self._absorb(curr_item, data)
+      following = curr_item.next
+      if self._same_run(following, data):
+          return self._absorb(following, data)
+      node = RunLengthNode(data)
+      node.next = following
+      node.prev = curr_item
+      following.prev = node
+      curr_item.next = node
+      self.length += 1
+      self.nodes += 1
+      if self.index is not None:
+          self.index.insert(data, node)
+      return node
+
+
+class SkipLinkedList(LinkedList):
+  """
+  LinkedList with skip list express lanes over its nodes. Node heights
+  are random (lane ``i`` holds about 1 in 4**(i + 1) nodes) and every lane
+  link records its width in list positions, so ``insert_in_order`` finger
+  searches back from the tree hint in O(log d) comparisons for a distance
+  of d nodes while ``walked`` still counts the d positions passed.
+  Same interface as LinkedList.
+  """
+  def __init__(self, data, order = 'ASC', tree_class = BST, persistent_index = False):
+    super().__init__(data, order, tree_class)
+    self.tail = self.head = SkipListNode(data)
+    if persistent_index:
+        self.index = tree_class()
+        self.index.insert(data, self.head)
+    # Sentinel in front of the head (rank -1) that starts every lane.
+    self.lanes_head = SkipListNode(None)
+    self.lanes_head.lane_next = []
+    self.lane_tails = []
+    self.lane_tail_ranks = []
+
+  @staticmethod
+  def _height():
+      # Two trailing zero bits per lane: each lane keeps 1 in 4 nodes of the one below.
+      bits = getrandbits(32)
+      return ((bits & -bits).bit_length() - 1) // 2 if bits else 0
+
+  def _add_lanes(self, height):
+      while len(self.lane_tails) < height:
+          self.lane_tails.append(self.lanes_head)
+          self.lane_tail_ranks.append(-1)
+          self.lanes_head.lane_next.append(None)
+
+  def append(self, data):
+    height = self._height()
+    node = SkipListNode(data, height)
+    self.tail.next = node
+    node.prev = self.tail
+    self.tail = node
+    rank = self.length
+    self.length += 1
+    if height:
+        self._add_lanes(height)
+        lane_tails, lane_tail_ranks = self.lane_tails, self.lane_tail_ranks
+        for i in range(height):
+            pred = lane_tails[i]
+            node.lane_prev[i] = pred
+            node.lane_width[i] = rank - lane_tail_ranks[i]
+            pred.lane_next[i] = node
+            lane_tails[i] = node
+            lane_tail_ranks[i] = rank
+    if self.index is not None:
+        self.index.insert(data, node)
+
+  def prepend(self, data):
+    node = SkipListNode(data)
+    node.next = self.head
+    self.head.prev = node
+    self.head = node
+    self.length += 1
+    # Every position moves up by one: the first link of each lane widens.
+    for i, first in enumerate(self.lanes_head.lane_next):
+        if first is not None:
+            first.lane_width[i] += 1
+            self.lane_tail_ranks[i] += 1
+    if self.index is not None:
+        self.index.insert(data, node)
+    return node
+
+  def insert_in_order(self, data, curr_item):
+      compare = self.compare
+      sentinel = self.lanes_head
+      walked = 0
+      compared = 1
+      if compare(curr_item.data, data):
+          # Every node curr_item reaches still belongs after data. Take the
+          # highest lane whose target does too, else step back one node.
+          while True:
+              lanes = curr_item.lane_prev
+              for i in range(len(lanes) - 1, -1, -1):
+                  target = lanes[i]
+                  if target is not sentinel:
+                      compared += 1
+                      if compare(target.data, data):
+                          walked += curr_item.lane_width[i]
+                          curr_item = target
+                          break
+              else:
+                  curr_item = curr_item.prev
+                  walked += 1
+                  compared += 1
+                  if not compare(curr_item.data, data):
+                      break
+      self.walked += walked
+      self.walk_comparisons += compared
+
+      height = self._height()
+      node = SkipListNode(data, height)
+      node.next = curr_item.next
+      node.prev = curr_item
+      curr_item.next.prev = node
+      curr_item.next = node
+      self.length += 1
+
+      self._add_lanes(height)
+      lane_tails, lane_tail_ranks = self.lane_tails, self.lane_tail_ranks
+      # Climb from curr_item to the nearest node on each lane, counting the
+      # positions between it and the new node, and fix the link across it.
+      pred = curr_item
+      distance = 1
+      for i in range(len(lane_tails)):
+          while pred is not sentinel and len(pred.lane_prev) <= i:
+              if i == 0:
+                  pred = pred.prev if pred.prev is not None else sentinel
+                  distance += 1
+              else:
+                  distance += pred.lane_width[i - 1]
+                  pred = pred.lane_prev[i - 1]
+          succ = pred.lane_next[i]
+          if i < height:
+              node.lane_prev[i] = pred
+              node.lane_next[i] = succ
+              node.lane_width[i] = distance
+              pred.lane_next[i] = node
+              if succ is None:
+                  lane_tails[i] = node
+                  lane_tail_ranks[i] += distance
+              else:
+                  succ.lane_prev[i] = node
+                  succ.lane_width[i] -= distance - 1
+                  lane_tail_ranks[i] += 1
+          elif succ is not None:
+              succ.lane_width[i] += 1
+              lane_tail_ranks[i] += 1
+
+      if self.index is not None:
+          self.index.insert(data, node)
+      return node
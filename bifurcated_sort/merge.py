@@ -0,0 +1,118 @@
+import heapq
+
+_EXHAUSTED = object()
+
+# Above this many inputs the log2(k) generator levels of the pair tree cost
+# more than heapq.merge's C heap operations.
+MERGE_TREE_MAX_INPUTS = 32
+
+def _merge_pair(left, right, reverse):
+    """
+    The two-iterator merge at the end of ``bfc_sort``, streaming. Ties go
+    to ``left`` so merging neighbouring inputs keeps the merge stable.
+    """
+    left, right = iter(left), iter(right)
+    x = next(left, _EXHAUSTED)
+    y = next(right, _EXHAUSTED)
+    if x is _EXHAUSTED:
+        if y is not _EXHAUSTED:
+            yield y
+            yield from right
+        return
+    if y is _EXHAUSTED:
+        yield x
+        yield from left
+        return
+
+    if reverse:
+        while True:
+            if y > x:
+                yield y
+                y = next(right, _EXHAUSTED)
+                if y is _EXHAUSTED:
+                    yield x
+                    yield from left
+                    return
+            else:
+                yield x
+                x = next(left, _EXHAUSTED)
+                if x is _EXHAUSTED:
+                    yield y
+                    yield from right
+                    return
+    else:
+        while True:
+            if y < x:
+                yield y
+                y = next(right, _EXHAUSTED)
+                if y is _EXHAUSTED:
+                    yield x
+                    yield from left
+                    return
+            else:
+                yield x
+                x = next(left, _EXHAUSTED)
+                if x is _EXHAUSTED:
+                    yield y
+                    yield from right
+                    return
+
+def bfc_merge(*sorted_iterables, reverse=False, key=None):
+    """
+    Merge already sorted iterables (such as ``bfc_sort`` shard outputs) into
+    one sorted stream, like ``heapq.merge``.
+
+    The inputs are paired into a balanced tree of the two-iterator merge
+    used by ``bfc_sort``, so each item takes about log2(k) comparisons for
+    k inputs and nothing is read before the consumer pulls. With a key, or
+    more than ``MERGE_TREE_MAX_INPUTS`` inputs, a heap merge is faster and
+    ``heapq.merge`` is used instead. Equal items come out in input order:
+    earlier iterables first.
+
+    Args:
+        *sorted_iterables (iterable): Inputs, each sorted in the output order
+        reverse (bool): Inputs and output are in descending order if True (default: False)
+        key (callable): One-argument function extracting a comparison key, called
+            once per item (default: None)
+
+    Returns:
+        iterator: The merged items
+
+    Raises:
+        TypeError: If reverse is not a boolean or key is not callable
+
+    Examples:
+        >>> from bifurcated_sort import bfc_merge
+        >>> list(bfc_merge([1, 4, 7], [2, 5], [3, 6]))
+        [1, 2, 3, 4, 5, 6, 7]
+        >>> list(bfc_merge([9, 2], [5, 1], reverse=True))
+        [9, 5, 2, 1]
+    """
+    if not isinstance(reverse, bool):
+        raise TypeError(
+            f"reverse must be a boolean (True or False), "
+            f"got {type(reverse).__name__}: {reverse}"
+        )
+
+    if key is not None and not callable(key):
+        raise TypeError(
+            f"key must be callable or None, got {type(key).__name__}"
+        )
+
+    inputs = list(sorted_iterables)
+    if key is not None or len(inputs) > MERGE_TREE_MAX_INPUTS:
+        return heapq.merge(*inputs, key=key, reverse=reverse)
+
+    if not inputs:
+        return iter(())
+
+    while len(inputs) > 1:
+        paired = [
+            _merge_pair(inputs[i], inputs[i + 1], reverse)
+            for i in range(0, len(inputs) - 1, 2)
+        ]
+        if len(inputs) % 2:
+            paired.append(inputs[-1])
+        inputs = paired
+
+    return iter(inputs[0])
@@ -1,12 +1,108 @@
+from array import array
+
 class LinkedListNode:
+  __slots__ = ('data', 'next', 'prev')
+
   def __init__(self, data):
     self.data = data
     self.next = None
     self.prev = None
 
+class RunLengthNode(LinkedListNode):
+  """LinkedListNode standing for ``data`` followed by the equal items in ``dups``."""
+  __slots__ = ('dups',)
+
+  def __init__(self, data):
+    super().__init__(data)
+    self.dups = None
+
+class SkipListNode(LinkedListNode):
+  """
+  Linked list node with express lanes. Lane ``i`` links the node to the
+  nearest nodes on either side whose height is above ``i``; ``lane_width[i]``
+  is the number of list positions back to ``lane_prev[i]``.
+  """
+  __slots__ = ('lane_prev', 'lane_next', 'lane_width')
+
+  def __init__(self, data, height = 0):
+    super().__init__(data)
+    if height:
+        self.lane_prev = [None] * height
+        self.lane_next = [None] * height
+        self.lane_width = [0] * height
+    else:
+        self.lane_prev = self.lane_next = self.lane_width = ()
+
 class TreeNode:
+    __slots__ = ('value', 'reference', 'left', 'right')
+
     def __init__(self, value, reference = None):
         self.value = value
         self.reference = reference
         self.left = None
-        self.right = None
\ No newline at end of file
+        self.right = None
+
+class AVLTreeNode(TreeNode):
+    __slots__ = ('height',)
+
+    def __init__(self, value, reference = None):
+        super().__init__(value, reference)
+        self.height = 1
+
+class OrderStatisticNode(AVLTreeNode):
+    __slots__ = ('size',)
+
+    def __init__(self, value, reference = None):
+        super().__init__(value, reference)
+        self.size = 1
+
+class RedBlackTreeNode(TreeNode):
+    __slots__ = ('parent', 'red')
+
+    def __init__(self, value, reference = None):
+        super().__init__(value, reference)
+        self.parent = None
+        self.red = True
+
+class TreapNode(TreeNode):
+    __slots__ = ('priority',)
+
+    def __init__(self, value, reference = None, priority = 0.0):
+        super().__init__(value, reference)
+        self.priority = priority
+
+class NodeArrays:
+    """
+    Parallel array storage for linked list nodes. A node is an integer
+    index into ``data``/``next``/``prev`` instead of an object, and -1
+    stands in for ``None``. Several lists may share one pool.
+    """
+    def __init__(self, capacity = 16):
+        capacity = max(capacity, 1)
+        typecode = 'i' if capacity < 2**31 else 'q'
+        self.data = [None] * capacity
+        self.next = array(typecode, [-1]) * capacity
+        self.prev = array(typecode, [-1]) * capacity
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def new(self, data):
+        index = self.size
+        if index == len(self.data):
+            self.grow()
+        self.data[index] = data
+        self.next[index] = -1
+        self.prev[index] = -1
+        self.size = index + 1
+        return index
+
+    def grow(self):
+        capacity = len(self.data)
+        if self.next.typecode == 'i' and 2 * capacity >= 2**31:
+            self.next = array('q', self.next)
+            self.prev = array('q', self.prev)
+        self.data.extend([None] * capacity)
+        self.next.extend(array(self.next.typecode, [-1]) * capacity)
+        self.prev.extend(array(self.prev.typecode, [-1]) * capacity)
@@ -0,0 +1,120 @@
+import random
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .stats import SortStats
+
+# Inputs shorter than this are sorted in the calling process, the cost of
+# starting workers outweighs anything they could save.
+PARALLEL_MIN_ITEMS = 50000
+
+# Sampled items per worker used to choose the partition pivots.
+SAMPLES_PER_WORKER = 64
+
+INT64_MIN = -2**63
+INT64_MAX = 2**63 - 1
+
+
+def _shared_typecode(items):
+    """'q' or 'd' if every item can live unboxed in shared memory, else None."""
+    first_type = type(items[0])
+    if first_type is int:
+        if all(type(x) is int for x in items) and INT64_MIN <= min(items) and max(items) <= INT64_MAX:
+            return 'q'
+    elif first_type is float:
+        if all(type(x) is float for x in items):
+            return 'd'
+    return None
+
+
+def _choose_pivots(items, workers):
+    sample = random.sample(items, min(len(items), workers * SAMPLES_PER_WORKER))
+    sample.sort()
+    step = len(sample) / workers
+    return [sample[int(step * i)] for i in range(1, workers)]
+
+
+def _partition(items, pivots):
+    buckets = [[] for _ in range(len(pivots) + 1)]
+    appenders = [bucket.append for bucket in buckets]
+    for x in items:
+        appenders[bisect_right(pivots, x)](x)
+    return buckets
+
+
+def _sort_chunk(items, sort_kwargs, collect_stats):
+    from .sorter import bfc_sort
+    stats = SortStats() if collect_stats else None
+    bfc_sort(items, stats=stats, **sort_kwargs)
+    return items, stats
+
+
+def _sort_shared_segment(shm_name, typecode, start, stop, sort_kwargs, collect_stats):
+    from .sorter import bfc_sort
+    stats = SortStats() if collect_stats else None
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf.cast(typecode)
+        segment = view[start:stop]
+        items = segment.tolist()
+        bfc_sort(items, stats=stats, **sort_kwargs)
+        segment[:] = memoryview(array(typecode, items))
+        segment.release()
+        view.release()
+    finally:
+        shm.close()
+    return stats
+
+
+def parallel_sort(work_array, workers, sort_kwargs, stats=None):
+    """
+    Sort ``work_array`` in place (ascending) across ``workers`` processes.
+
+    Items are range partitioned on sampled pivots, so sorted partitions only
+    need concatenating. ``int`` (64-bit) and ``float`` lists are handed to the
+    workers through one shared memory buffer that each worker sorts a slice
+    of; anything else is pickled to the workers per partition. Worker stats
+    are merged into ``stats``, so its phase times are summed across workers.
+    """
+    collect_stats = stats is not None
+    buckets = _partition(work_array, _choose_pivots(work_array, workers))
+    typecode = _shared_typecode(work_array)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if typecode is None:
+            start = 0
+            for bucket, bucket_stats in executor.map(
+                _sort_chunk, buckets, [sort_kwargs] * len(buckets), [collect_stats] * len(buckets),
+            ):
+                work_array[start:start + len(bucket)] = bucket
+                start += len(bucket)
+                if collect_stats:
+                    stats.merge(bucket_stats)
+            return
+
+        itemsize = array(typecode).itemsize
+        shm = shared_memory.SharedMemory(create=True, size=len(work_array) * itemsize)
+        try:
+            view = shm.buf.cast(typecode)
+            futures = []
+            start = 0
+            for bucket in buckets:
+                stop = start + len(bucket)
+                view[start:stop] = memoryview(array(typecode, bucket))
+                futures.append(executor.submit(
+                    _sort_shared_segment, shm.name, typecode, start, stop, sort_kwargs, collect_stats,
+                ))
+                start = stop
+            del buckets
+
+            for future in futures:
+                segment_stats = future.result()
+                if collect_stats:
+                    stats.merge(segment_stats)
+            work_array[:] = view.tolist()
+            view.release()
+        finally:
+            shm.close()
+            shm.unlink()
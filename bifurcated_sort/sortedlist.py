@@ -0,0 +1,196 @@
+from .bst import OrderStatisticTree
+from .linkedlist import LinkedList
+from .node import LinkedListNode
+from .sorter import bfc_sort
+
+def _insert_after(linked_list, data, curr_item):
+    """Link a node for ``data`` right after ``curr_item``, without walking."""
+    node = LinkedListNode(data)
+    node.prev = curr_item
+    node.next = curr_item.next
+    if curr_item.next is None:
+        linked_list.tail = node
+    else:
+        curr_item.next.prev = node
+    curr_item.next = node
+    linked_list.length += 1
+    return node
+
+def _unlink(linked_list, node):
+    """Remove ``node`` from the list; the list must keep at least one node."""
+    if node.prev is None:
+        linked_list.head = node.next
+    else:
+        node.prev.next = node.next
+    if node.next is None:
+        linked_list.tail = node.prev
+    else:
+        node.next.prev = node.prev
+    node.prev = node.next = None
+    linked_list.length -= 1
+
+class SortedList:
+    """
+    Ordered collection kept sorted across inserts and deletes. Values live
+    in a ``LinkedList``, and an ``OrderStatisticTree`` maps every rank to its
+    list node, so ``add``, ``remove``, ``bisect_*``, ``in``, ``index`` and
+    indexing are O(log n) and range iteration walks the list from the first
+    match. Equal values keep their insertion order.
+
+    Args:
+        iterable (iterable): Initial values, sorted with ``bfc_sort`` (default: empty)
+
+    Examples:
+        >>> from bifurcated_sort import SortedList
+        >>> sl = SortedList([5, 1, 4])
+        >>> sl.add(3)
+        >>> list(sl), sl[0], sl.bisect_left(4)
+        ([1, 3, 4, 5], 1, 2)
+        >>> list(sl.irange(2, 4))
+        [3, 4]
+        >>> sl.remove(4)
+        >>> 4 in sl
+        False
+    """
+
+    def __init__(self, iterable=()):
+        self._list = None
+        self._tree = OrderStatisticTree()
+        values = bfc_sort(list(iterable), inplace=False)
+        if not values:
+            return
+        self._list = LinkedList(values[0])
+        for value in values[1:]:
+            self._list.append(value)
+        nodes = []
+        node = self._list.head
+        while node:
+            nodes.append((node.data, node))
+            node = node.next
+        self._tree = OrderStatisticTree.from_sorted(nodes)
+
+    def __len__(self):
+        return len(self._tree)
+
+    def __iter__(self):
+        return iter(self._list) if self._list is not None else iter(())
+
+    def __reversed__(self):
+        return reversed(self._list) if self._list is not None else iter(())
+
+    def __contains__(self, value):
+        i = self._tree.bisect_left(value)
+        return i < len(self._tree) and self._tree.select(i).value == value
+
+    def __getitem__(self, index):
+        return self._tree.select(self._position(index)).value
+
+    def __repr__(self):
+        return f"SortedList({list(self)!r})"
+
+    def _position(self, index):
+        if not isinstance(index, int):
+            raise TypeError(
+                f"SortedList indices must be integers, got {type(index).__name__}"
+            )
+        size = len(self._tree)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("SortedList index out of range")
+        return index
+
+    def add(self, value):
+        """Insert ``value`` after any equal values."""
+        tree = self._tree
+        if self._list is None:
+            self._list = LinkedList(value)
+            tree.insert(value, self._list.head)
+            return
+        i = tree.bisect_right(value)
+        if i == 0:
+            node = self._list.prepend(value)
+        else:
+            node = _insert_after(self._list, value, tree.select(i - 1).reference)
+        tree.insert(value, node)
+
+    def update(self, iterable):
+        """Add every value from ``iterable``."""
+        for value in iterable:
+            self.add(value)
+
+    def _remove_at(self, index):
+        _, node = self._tree.delete_at(index)
+        if len(self._list) == 1:
+            self._list = None
+        else:
+            _unlink(self._list, node)
+        return node.data
+
+    def remove(self, value):
+        """Remove the first occurrence of ``value``, ValueError if missing."""
+        i = self._tree.bisect_left(value)
+        if i == len(self._tree) or self._tree.select(i).value != value:
+            raise ValueError(f"{value!r} not in SortedList")
+        self._remove_at(i)
+
+    def discard(self, value):
+        """Remove the first occurrence of ``value`` if present."""
+        if value in self:
+            self.remove(value)
+
+    def pop(self, index=-1):
+        """Remove and return the value at ``index`` (default: the largest)."""
+        if not self._tree.root:
+            raise IndexError("pop from empty SortedList")
+        return self._remove_at(self._position(index))
+
+    def bisect_left(self, value):
+        """Index where ``value`` would be inserted before any equal values."""
+        return self._tree.bisect_left(value)
+
+    def bisect_right(self, value):
+        """Index where ``value`` would be inserted after any equal values."""
+        return self._tree.bisect_right(value)
+
+    bisect = bisect_right
+
+    def count(self, value):
+        return self._tree.bisect_right(value) - self._tree.bisect_left(value)
+
+    def index(self, value):
+        """Index of the first occurrence of ``value``, ValueError if missing."""
+        i = self._tree.bisect_left(value)
+        if i == len(self._tree) or self._tree.select(i).value != value:
+            raise ValueError(f"{value!r} not in SortedList")
+        return i
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        """
+        Iterate over the values between ``minimum`` and ``maximum``; None
+        leaves that side open. ``inclusive`` says whether each bound itself
+        is included. Costs O(log n) to find the first value, then O(1) per
+        value yielded.
+        """
+        tree = self._tree
+        if minimum is None:
+            start = 0
+        else:
+            start = tree.bisect_left(minimum) if inclusive[0] else tree.bisect_right(minimum)
+        if maximum is None:
+            stop = len(tree)
+        else:
+            stop = tree.bisect_right(maximum) if inclusive[1] else tree.bisect_left(maximum)
+        if start >= stop:
+            return
+
+        if reverse:
+            node = tree.select(stop - 1).reference
+            for _ in range(stop - start):
+                yield node.data
+                node = node.prev
+        else:
+            node = tree.select(start).reference
+            for _ in range(stop - start):
+                yield node.data
+                node = node.next
@@ -1,114 +1,752 @@
-from .linkedlist import LinkedList
+import heapq
+from array import array, typecodes
+from collections import Counter, deque
+from collections.abc import MutableSequence, Sequence
+from time import perf_counter
 
-def bfc_sort(
-    array, 
-    pending_item_percentage=0.55,
-    inplace=True,
-    reverse=False,
-):
+from bisect import bisect_left, bisect_right
+from itertools import chain, islice, repeat
+from math import log2
+from operator import itemgetter
+
+from .bst import TREE_TYPES
+from .linkedlist import LinkedList, ArrayLinkedList, RunLengthLinkedList, SkipLinkedList
+from .node import NodeArrays
+from .stats import SortStats
+from .merge import bfc_merge
+from . import parallel
+
+try:
+    from . import _speedups
+except ImportError:  # built without a C compiler
+    _speedups = None
+
+ENGINES = ('node', 'array', 'skip', 'rle')
+
+# The compiled module builds node lists over its own AVL tree; any other
+# tree or engine passed explicitly is only built by the pure-Python path.
+ACCELERATED_TREE = 'avl'
+ACCELERATED_ENGINE = 'node'
+
+LIST_CLASSES = {'node': LinkedList, 'skip': SkipLinkedList, 'rle': RunLengthLinkedList}
+
+# pending_item_percentage='auto' uses small batches (0.1) when more than this
+# fraction of neighbouring items are equal: the insert walks are then
+# dominated by stretches of equal values, which grow with the lists.
+AUTO_DUPLICATE_RATIO = 0.01
+
+# pending_item_percentage='auto' otherwise compares this many evenly spaced
+# pairs of items AUTO_INVERSION_DISTANCE apart. Inputs reaching the lists
+# have short runs, so neighbouring items look alike for random and for
+# locally jittered data; pairs further apart tell them apart.
+AUTO_INVERSION_SAMPLES = 256
+AUTO_INVERSION_DISTANCE = 64
+
+# Inputs whose sampled pairs are at most this fraction out of order, or in
+# order, are only disordered locally and are flushed once at the end (1.0):
+# 1.5 to 2.5 times faster than 0.55 on items jittered by up to 50 places,
+# while random input stays faster at 0.55.
+AUTO_LOCAL_DISORDER = 0.3
+
+# Inputs whose natural runs average at least this many items skip the linked
+# lists and are sorted by merging the runs directly.
+FAST_PATH_MIN_RUN = 8
+
+# Integer inputs spanning at most this many values per item are counting
+# sorted without building the linked lists (bfc_sort's counting_threshold
+# default). Counting sort beats the linked lists up to a range of about 10n
+# but loses to a radix sort from about n/2 on.
+COUNTING_SORT_THRESHOLD = 0.5
+
+# Integer inputs whose max - min fits in this many bits are LSD radix sorted
+# when counting sort does not apply (bfc_sort's radix_max_bits default).
+RADIX_MAX_BITS = 64
+
+# With the default radix_max_bits, max - min must also fit in this many bits
+# per bit of log2(n): the passes and their buckets grow with bits / log2(n).
+# Radix sort beats the pure-Python lists up to about 8 at every n measured,
+# the compiled accelerator only up to about 1.5 (26 bits at n = 200,000).
+RADIX_MAX_BITS_PER_LOG2_N = 8
+RADIX_MAX_BITS_PER_LOG2_N_ACCELERATED = 1.5
+
+# The compiled accelerator sorts shorter int lists faster than counting or
+# radix sort, so with the default thresholds they keep the linked lists.
+INTEGER_SORT_MIN_ITEMS_ACCELERATED = 2048
+
+# array.array typecodes (and native buffer formats) holding ints.
+INTEGER_TYPECODES = 'bBhHiIlLqQ'
+
+# Sorted items are written back into arrays and buffers this many at a time,
+# so only one chunk is ever held as a second typed copy.
+WRITE_BACK_CHUNK = 65536
+
+# Widest radix digit; wider ranges take ceil(bits / 16) passes, each over
+# 2**16 buckets at most.
+RADIX_DIGIT_BITS = 16
+
+def _sequence_target(array):
     """
-    Sort an array of integers using bifurcated insertion sort.
-    
-    Args:
-        array (list): List of numbers to sort
-        pending_item_percentage (float): Threshold for batch processing (0 < value <= 1, default: 0.55)
-        inplace (bool): Modify array in-place if True, return new sorted list if False (default: True)
-        reverse (bool): Sort in descending order if True, ascending if False (default: False)
-    
-    Returns:
-        list: The sorted array (same reference if inplace=True, new list if inplace=False)
-    
-    Raises:
-        TypeError: If array contains non-integer values
-        ValueError: If pending_item_percentage is not between 0 and 1
-    
-    Examples:
-        >>> from bifurcated_sort import bfc_sort
-        >>> arr = [5, 2, 8, 1, 9]
-        >>> bfc_sort(arr)
-        [1, 2, 5, 8, 9]
+    What ``bfc_sort`` writes the result into for an ``array`` that is not a
+    list: the mutable sequence itself, or a memoryview over a buffer such
+    as a NumPy array. None if neither applies.
+    """
+    if isinstance(array, MutableSequence):
+        return array
+    try:
+        return memoryview(array)
+    except TypeError:
+        return None
 
-        >>> result = bfc_sort([5, 2, 8], inplace=False, reverse=True)
-        >>> result
-        [8, 5, 2]
+def _write_back(target, items):
     """
+    Store the sorted ``items``, a list or an iterator, into the original
+    storage of ``target``. Arrays and buffers are written
+    ``WRITE_BACK_CHUNK`` items at a time, each chunk as one buffer copy.
+    """
+    if isinstance(target, deque):
+        target.clear()
+        target.extend(items)
+        return
+    if isinstance(target, (array, memoryview)):
+        typecode = target.typecode if isinstance(target, array) else target.format
+        # memoryview formats without an array typecode, e.g. '?' or '<q',
+        # are stored item by item below.
+        if typecode in typecodes:
+            items = iter(items)
+            start = 0
+            while True:
+                chunk = array(typecode, islice(items, WRITE_BACK_CHUNK))
+                if not chunk:
+                    return
+                target[start:start + len(chunk)] = chunk
+                start += len(chunk)
+    else:
+        try:
+            target[:] = items
+            return
+        except TypeError:
+            pass
+    for i, item in enumerate(items):
+        target[i] = item
 
-    if not isinstance(array, list):
-        raise TypeError(
-            f"array must be a list, got {type(array).__name__}"
-        )
+def _counting_sort_buffer(target, reverse, counting_threshold, accelerate, stats):
+    """
+    Counting sort of an int ``array.array`` or buffer read straight from its
+    storage into an ``array('q')`` of counts, so no list of its items is
+    built. Returns an iterator over the sorted items, or None if counting
+    sort does not apply. Only min and max are scanned, so ``stats`` gets no
+    run count.
+    """
+    if isinstance(target, array):
+        typecode = target.typecode
+    elif isinstance(target, memoryview):
+        typecode = target.format
+    else:
+        return None
+    n = len(target)
+    if typecode not in INTEGER_TYPECODES or n < 2 or counting_threshold == 0:
+        return None
+    if stats is not None:
+        phase_start = perf_counter()
+    min_value, max_value = min(target), max(target)
+    counting_threshold, _ = _integer_sort_limits(n, accelerate, counting_threshold, 0)
+    if max_value - min_value + 1 > counting_threshold * n:
+        return None
+    if stats is not None:
+        stats.items += n
+        stats.comparisons += 2 * (n - 1)
+        stats.fast_path = 'counting'
+        stats.phase_times['scan'] += perf_counter() - phase_start
+        phase_start = perf_counter()
 
-    if not isinstance(pending_item_percentage, (int, float)):
-        raise TypeError(
-            f"pending_item_percentage must be a number, "
-            f"got {type(pending_item_percentage).__name__}"
-        )
+    counts = array('q', bytes(8 * (max_value - min_value + 1)))
+    if min_value:
+        for x in target:
+            counts[x - min_value] += 1
+    else:
+        for x in target:
+            counts[x] += 1
 
-    if not 0 < pending_item_percentage <= 1:
-        raise ValueError(
-            f"pending_item_percentage must be between 0 and 1 (exclusive of 0), "
-            f"got {pending_item_percentage}"
-        )
+    if stats is not None:
+        stats.phase_times['distribute'] += perf_counter() - phase_start
+    offsets = range(len(counts) - 1, -1, -1) if reverse else range(len(counts))
+    return chain.from_iterable(repeat(i + min_value, counts[i]) for i in offsets if counts[i])
 
-    if not isinstance(inplace, bool):
-        raise TypeError(
-            f"inplace must be a boolean (True or False), "
-            f"got {type(inplace).__name__}: {inplace}"
-        )
+def _merge_natural_runs(work_array, run_starts, reverse):
+    """
+    Merge the natural runs starting at ``run_starts`` back into
+    ``work_array``. Decreasing runs are strictly decreasing, so reversing
+    them keeps equal items in input order and the merge stays stable.
+    """
+    run_bounds = zip(run_starts, run_starts[1:] + [len(work_array)])
+    sorted_runs = []
+    for start, stop in run_bounds:
+        run = work_array[start:stop]
+        if stop - start > 1 and run[1] < run[0]:
+            run.reverse()
+        sorted_runs.append(run)
 
-    if not isinstance(reverse, bool):
-        raise TypeError(
-            f"reverse must be a boolean (True or False), "
-            f"got {type(reverse).__name__}: {reverse}"
+    merged = list(heapq.merge(*sorted_runs))
+    if reverse:
+        merged.reverse()
+    work_array[:] = merged
+
+def _unboxed_keys(work_array, min_value, max_value):
+    """
+    An ``array('q')`` or ``array('d')`` copy of ``work_array`` if every item
+    is an int that fits in 64 bits, or every item is a float; None for mixed,
+    bool, tuple or any other data. The scan's min and max bound the ints.
+    """
+    item_types = set(map(type, work_array))
+    if item_types == {int}:
+        if parallel.INT64_MIN <= min_value and max_value <= parallel.INT64_MAX:
+            return array('q', work_array)
+    elif item_types == {float}:
+        return array('d', work_array)
+    return None
+
+def _counting_sort(work_array, min_value, max_value, reverse):
+    """Counting sort of ints in [min_value, max_value], O(n + range)."""
+    counts = Counter(work_array)
+    values = range(max_value, min_value - 1, -1) if reverse else range(min_value, max_value + 1)
+    result = []
+    extend = result.extend
+    get = counts.get
+    for value in values:
+        count = get(value)
+        if count:
+            extend(repeat(value, count))
+    work_array[:] = result
+
+def _radix_sort(work_array, min_value, bits, reverse):
+    """
+    LSD radix sort of ints offset by ``min_value``, whose offsets fit in
+    ``bits`` bits: ceil(bits / width) stable bucket passes with equal-width
+    digits, so 24 bits take two 12-bit passes, not 16 + 8. The digit width
+    is at most RADIX_DIGIT_BITS and at most log2(n), so short inputs do not
+    allocate more buckets per pass than they have items.
+    """
+    widest = min(RADIX_DIGIT_BITS, max(len(work_array).bit_length() - 1, 1))
+    passes = -(-bits // widest)
+    digit_bits = -(-bits // passes)
+    mask = (1 << digit_bits) - 1
+    items = [x - min_value for x in work_array] if min_value else work_array
+    for shift in range(0, passes * digit_bits, digit_bits):
+        buckets = [[] for _ in range(mask + 1)]
+        for x in items:
+            buckets[(x >> shift) & mask].append(x)
+        items = list(chain.from_iterable(buckets))
+    if reverse:
+        items.reverse()
+    work_array[:] = [x + min_value for x in items] if min_value else items
+
+def _integer_sort_limits(n, accelerate, counting_threshold, radix_max_bits):
+    """
+    ``counting_threshold`` and ``radix_max_bits`` for a list of ``n`` items,
+    with None replaced by the defaults measured for the path sorting it.
+    """
+    small = accelerate and n < INTEGER_SORT_MIN_ITEMS_ACCELERATED
+    if counting_threshold is None:
+        counting_threshold = 0 if small else COUNTING_SORT_THRESHOLD
+    if radix_max_bits is None:
+        if small:
+            radix_max_bits = 0
+        else:
+            per_log2_n = RADIX_MAX_BITS_PER_LOG2_N_ACCELERATED if accelerate else RADIX_MAX_BITS_PER_LOG2_N
+            radix_max_bits = min(RADIX_MAX_BITS, int(per_log2_n * log2(n)))
+    return counting_threshold, radix_max_bits
+
+def _integer_sort(work_array, min_value, max_value, reverse, counting_threshold, radix_max_bits):
+    """
+    Sort ``work_array`` without comparisons if it holds only ints (not
+    bools) in a narrow enough range. Returns 'counting' or 'radix' for the
+    sort used, None if neither applies and nothing was done.
+    """
+    if type(min_value) is not int or type(max_value) is not int:
+        return None
+    span = max_value - min_value
+    if span + 1 <= counting_threshold * len(work_array):
+        method = 'counting'
+    elif span.bit_length() <= radix_max_bits:
+        method = 'radix'
+    else:
+        return None
+    if set(map(type, work_array)) != {int}:
+        return None
+    if method == 'counting':
+        _counting_sort(work_array, min_value, max_value, reverse)
+    else:
+        _radix_sort(work_array, min_value, span.bit_length(), reverse)
+    return method
+
+def _accelerated_sort(
+    work_array, min_value, max_value, min_value_ind, max_value_ind, pending_item_size, reverse, stats,
+    persistent_index=False,
+):
+    """
+    Distribute, insert and merge phases of ``_bifurcated_sort`` in the
+    compiled ``_speedups`` module. Makes the same list comparisons as the
+    pure-Python path, so the result and the counters are identical; only
+    the per-batch tree differs (always AVL) and insert time is reported as
+    part of 'distribute'. Homogeneous int and float lists are compared
+    through an unboxed copy.
+    """
+    if stats is not None:
+        phase_start = perf_counter()
+
+    keys = _unboxed_keys(work_array, min_value, max_value)
+    state, walked, inserted_into_asc, inserted_into_dsc, asc_len, dsc_len, depths = _speedups.distribute(
+        work_array, min_value_ind, max_value_ind, pending_item_size, stats is not None, keys, persistent_index,
+    )
+
+    if stats is not None:
+        stats.asc_appends += asc_len - 1 - inserted_into_asc
+        stats.dsc_appends += dsc_len - 1 - inserted_into_dsc
+        stats.pending_items += inserted_into_asc + inserted_into_dsc
+        stats.pending_flushes += len(depths)
+        stats.tree_depths.extend(depths)
+        stats.nodes_walked += walked
+        stats.comparisons += (
+            2 * (len(work_array) - 2)
+            + 2 * (inserted_into_asc + inserted_into_dsc)
+            + walked
         )
+        stats.phase_times['distribute'] += perf_counter() - phase_start
+        phase_start = perf_counter()
 
-    input_arr_len = len(array)
-    if input_arr_len == 0:
-        return None if inplace else []
+    comparisons = _speedups.merge(state, work_array, reverse)
 
-    if input_arr_len == 1:
-        return None if inplace else array.copy()
+    if stats is not None:
+        stats.comparisons += comparisons
+        stats.phase_times['merge'] += perf_counter() - phase_start
+
+def _kway_sort(work_array, run_limit, sort_pending, reverse, stats=None):
+    """
+    Distribute ``work_array`` over up to ``run_limit`` ascending and
+    descending runs, patience sort style: each item is appended to the
+    ascending run with the greatest tail <= item, else the descending run
+    with the smallest tail >= item, found by bisecting the run tails. Items
+    that fit no run start a new one while there is room, the rest are
+    sorted with ``sort_pending`` and all runs are merged with ``bfc_merge``.
+    """
+    if stats is not None:
+        phase_start = perf_counter()
+    # Both tail lists stay sorted ascending: appending x to the run found by
+    # bisect keeps x between its neighbouring tails.
+    asc_tails, asc_runs = [], []
+    dsc_tails, dsc_runs = [], []
+    asc_limit = (run_limit + 1) // 2
+    dsc_limit = run_limit // 2
+    pending_items = []
+
+    for x in work_array:
+        i = bisect_right(asc_tails, x)
+        if i:
+            asc_tails[i - 1] = x
+            asc_runs[i - 1].append(x)
+            continue
+        i = bisect_left(dsc_tails, x)
+        if i < len(dsc_tails):
+            dsc_tails[i] = x
+            dsc_runs[i].append(x)
+            continue
+        # x is below every ascending tail and above every descending tail.
+        if len(asc_runs) < asc_limit and len(asc_runs) <= len(dsc_runs):
+            asc_tails.insert(0, x)
+            asc_runs.insert(0, [x])
+        elif len(dsc_runs) < dsc_limit:
+            dsc_tails.append(x)
+            dsc_runs.append([x])
+        elif len(asc_runs) < asc_limit:
+            asc_tails.insert(0, x)
+            asc_runs.insert(0, [x])
+        else:
+            pending_items.append(x)
+
+    if stats is not None:
+        stats.asc_appends += sum(map(len, asc_runs))
+        stats.dsc_appends += sum(map(len, dsc_runs))
+        stats.phase_times['distribute'] += perf_counter() - phase_start
+
+    if len(pending_items) > 1:
+        if stats is not None:
+            phase_start = perf_counter()
+            stats.pending_items += len(pending_items)
+            stats.pending_flushes += 1
+        sort_pending(pending_items)
+        if stats is not None:
+            stats.phase_times['insert'] += perf_counter() - phase_start
+
+    if stats is not None:
+        phase_start = perf_counter()
+    for run in dsc_runs:
+        run.reverse()
+    merged = list(bfc_merge(*asc_runs, *dsc_runs, pending_items))
+    if reverse:
+        merged.reverse()
+    work_array[:] = merged
+    if stats is not None:
+        stats.phase_times['merge'] += perf_counter() - phase_start
+
+def _auto_pending_percentage(work_array, duplicates):
+    """
+    The pending_item_percentage 'auto' picks for ``work_array``, from the
+    scan's count of equal neighbours and a sample of inversions between
+    items AUTO_INVERSION_DISTANCE apart. Returns it with the number of
+    comparisons the sample made.
+    """
+    n = len(work_array)
+    if duplicates > n * AUTO_DUPLICATE_RATIO:
+        return 0.1, 0
+    pairs = n - AUTO_INVERSION_DISTANCE
+    if pairs < AUTO_INVERSION_SAMPLES:
+        return 0.55, 0
+    step = pairs // AUTO_INVERSION_SAMPLES
+    inversions = 0
+    for i in range(0, step * AUTO_INVERSION_SAMPLES, step):
+        if work_array[i + AUTO_INVERSION_DISTANCE] < work_array[i]:
+            inversions += 1
+    ratio = inversions / AUTO_INVERSION_SAMPLES
+    if min(ratio, 1 - ratio) <= AUTO_LOCAL_DISORDER:
+        return 1.0, AUTO_INVERSION_SAMPLES
+    return 0.55, AUTO_INVERSION_SAMPLES
+
+def _write_run(work_array, idx, node):
+    work_array[idx] = node.data
+    dups = node.dups
+    if not dups:
+        return idx + 1
+    work_array[idx + 1:idx + 1 + len(dups)] = dups
+    return idx + 1 + len(dups)
+
+def _write_keyed_run(work_array, idx, nodes, reverse):
+    # Decorated runs hold their items in arrival order; the index puts
+    # equal keys in the order the sort direction needs.
+    run = []
+    for node in nodes:
+        run.append(node.data)
+        if node.dups:
+            run.extend(node.dups)
+    run.sort(key=itemgetter(1), reverse=reverse)
+    work_array[idx:idx + len(run)] = run
+    return idx + len(run)
+
+def _merge_run_lists(work_array, asc_array, dsc_array, reverse, decorated=False):
+    """
+    Two-iterator merge of RunLengthLinkedLists, one comparison per pair of
+    nodes; each run of equal items is written with one slice assignment.
+    With ``decorated`` lists, runs compare on the key, each is written in
+    index order and two runs of the same key are written as one.
+    Returns the number of comparisons.
+    """
+    asc_nodes = asc_array.iter_nodes(reverse)
+    dsc_nodes = dsc_array.iter_nodes(reverse)
+    if reverse:
+        compare_op = lambda a, b: a > b
+    else:
+        compare_op = lambda a, b: a < b
+    if decorated:
+        write_run = lambda work_array, idx, node: _write_keyed_run(work_array, idx, (node,), reverse)
+    else:
+        write_run = _write_run
 
-    work_array = array if inplace else array.copy()
-    pending_item_size = int(input_arr_len * pending_item_percentage)    
-    min_value = max_value = work_array[0]
+    asc_node = next(asc_nodes, None)
+    dsc_node = next(dsc_nodes, None)
+    idx = comparisons = 0
+
+    while asc_node is not None and dsc_node is not None:
+        comparisons += 1
+        if decorated:
+            asc_key, dsc_key = asc_node.data[0], dsc_node.data[0]
+            if asc_key == dsc_key:
+                idx = _write_keyed_run(work_array, idx, (asc_node, dsc_node), reverse)
+                asc_node = next(asc_nodes, None)
+                dsc_node = next(dsc_nodes, None)
+                continue
+            comparisons += 1
+            asc_first = compare_op(asc_key, dsc_key)
+        else:
+            asc_first = compare_op(asc_node.data, dsc_node.data)
+        if asc_first:
+            idx = write_run(work_array, idx, asc_node)
+            asc_node = next(asc_nodes, None)
+        else:
+            idx = write_run(work_array, idx, dsc_node)
+            dsc_node = next(dsc_nodes, None)
+
+    for node, rest in ((asc_node, asc_nodes), (dsc_node, dsc_nodes)):
+        if node is not None:
+            idx = write_run(work_array, idx, node)
+            for node in rest:
+                idx = write_run(work_array, idx, node)
+
+    return comparisons
+
+def _iter_merged(asc_array, dsc_array, reverse, stats=None):
+    """
+    Generator form of the final merge in ``_bifurcated_sort``: yields the
+    items of both linked lists in order as they are pulled. The merge
+    comparisons are added to ``stats`` once both lists are exhausted.
+    """
+    if reverse:
+        asc_iter = reversed(asc_array)
+        dsc_iter = reversed(dsc_array)
+        compare_op = lambda a, b: a > b
+    else:
+        asc_iter = iter(asc_array)
+        dsc_iter = iter(dsc_array)
+        compare_op = lambda a, b: a < b
+
+    asc_val = next(asc_iter, None)
+    dsc_val = next(dsc_iter, None)
+    comparisons = 0
+
+    while asc_val is not None and dsc_val is not None:
+        comparisons += 1
+        if compare_op(asc_val, dsc_val):
+            yield asc_val
+            asc_val = next(asc_iter, None)
+        else:
+            yield dsc_val
+            dsc_val = next(dsc_iter, None)
+
+    if stats is not None:
+        stats.comparisons += comparisons
+
+    while asc_val is not None:
+        yield asc_val
+        asc_val = next(asc_iter, None)
+
+    while dsc_val is not None:
+        yield dsc_val
+        dsc_val = next(dsc_iter, None)
+
+def _bifurcated_sort(
+    work_array, pending_item_percentage, reverse, tree_class, engine, stats=None, accelerate=False,
+    persistent_index=False, run_limit=2, counting_threshold=0, radix_max_bits=0, decorated=False, lazy=False,
+):
+    """
+    Sort ``work_array`` in place. Expects validated arguments and at least
+    two items. Counters and phase times are added to ``stats`` if given.
+    The compiled module does the linked list phases if ``accelerate``.
+    Narrow int ranges are counting or radix sorted after the scan (None
+    thresholds pick the defaults for the input's length), and more than two
+    runs go through ``_kway_sort``. ``decorated`` marks items built by the
+    ``key`` decoration, whose runs the 'rle' engine forms on the key. With
+    ``lazy``, the merge of the 'node', 'array' or 'skip' linked lists is
+    returned as a generator from ``_iter_merged`` instead of written back.
+    """
+    if stats is not None:
+        phase_start = perf_counter()
+    input_arr_len = len(work_array)
+    min_value = max_value = prev = work_array[0]
     min_value_ind = max_value_ind = 0
 
-    for i, x in enumerate(work_array[1:], start=1):
-        if x < min_value:
-            min_value = x
-            min_value_ind = i
-        elif x > max_value:
-            max_value = x
-            max_value_ind = i
+    # One pass finds min/max and splits the input into natural runs, each
+    # non-decreasing or strictly decreasing. Run starts are only kept while
+    # the runs are long enough on average for the run merge fast path.
+    max_recorded_runs = input_arr_len // FAST_PATH_MIN_RUN
+    run_starts = [0]
+    runs = 1
+    direction = 0
+    duplicates = descents = max_updates = 0
+    for i in range(1, input_arr_len):
+        x = work_array[i]
+        if x < prev:
+            descents += 1
+            if x < min_value:
+                min_value = x
+                min_value_ind = i
+            if direction == 0:
+                direction = -1
+            elif direction == 1:
+                runs += 1
+                direction = 0
+                if runs <= max_recorded_runs:
+                    run_starts.append(i)
+        else:
+            if x > max_value:
+                max_value = x
+                max_value_ind = i
+                max_updates += 1
+            elif x == prev:
+                duplicates += 1
+            if direction == 0:
+                direction = 1
+            elif direction == -1:
+                runs += 1
+                direction = 0
+                if runs <= max_recorded_runs:
+                    run_starts.append(i)
+        prev = x
+
+    if stats is not None:
+        stats.items += input_arr_len
+        stats.runs += runs
+        # x < prev on every step, then x < min after a descent, or x > max
+        # and (unless a new max was found) x == prev otherwise; plus min == max.
+        stats.comparisons += 3 * (input_arr_len - 1) - descents - max_updates + 1
+        stats.phase_times['scan'] += perf_counter() - phase_start
 
     if min_value == max_value:
-        return None if inplace else work_array
+        if stats is not None:
+            stats.fast_path = 'equal'
+        return
+
+    if runs == 1:
+        if (direction == -1) != reverse:
+            work_array.reverse()
+        if stats is not None:
+            stats.fast_path = 'reversed' if direction == -1 else 'sorted'
+        return
+
+    if runs <= max_recorded_runs:
+        if stats is not None:
+            phase_start = perf_counter()
+        _merge_natural_runs(work_array, run_starts, reverse)
+        if stats is not None:
+            stats.fast_path = 'runs'
+            stats.phase_times['merge'] += perf_counter() - phase_start
+        return
 
-    asc_array = LinkedList(min_value)
-    dsc_array = LinkedList(max_value, 'DESC')
+    if counting_threshold is None or radix_max_bits is None:
+        counting_threshold, radix_max_bits = _integer_sort_limits(
+            input_arr_len, accelerate, counting_threshold, radix_max_bits,
+        )
+    if counting_threshold or radix_max_bits:
+        if stats is not None:
+            phase_start = perf_counter()
+        method = _integer_sort(work_array, min_value, max_value, reverse, counting_threshold, radix_max_bits)
+        if method is not None:
+            if stats is not None:
+                stats.fast_path = method
+                stats.phase_times['distribute'] += perf_counter() - phase_start
+            return
+
+    if run_limit > 2:
+        if stats is not None:
+            stats.fast_path = None
+        def sort_pending(items):
+            _bifurcated_sort(
+                items, pending_item_percentage, False, tree_class, engine, None, accelerate, persistent_index,
+                decorated=decorated,
+            )
+        _kway_sort(work_array, run_limit, sort_pending, reverse, stats)
+        return
+
+    if pending_item_percentage == 'auto':
+        pending_item_percentage, sampled = _auto_pending_percentage(work_array, duplicates)
+        if stats is not None:
+            stats.comparisons += sampled
+
+    if stats is not None:
+        stats.fast_path = None
+
+    pending_item_size = int(input_arr_len * pending_item_percentage)
+
+    if accelerate:
+        _accelerated_sort(
+            work_array, min_value, max_value, min_value_ind, max_value_ind,
+            pending_item_size, reverse, stats, persistent_index,
+        )
+        return
+
+    if stats is not None:
+        phase_start = perf_counter()
+        insert_time = 0.0
+        inserted_into_asc = inserted_into_dsc = 0
+
+    if engine == 'array':
+        pool = NodeArrays(input_arr_len)
+        asc_array = ArrayLinkedList(min_value, tree_class=tree_class, pool=pool, persistent_index=persistent_index)
+        dsc_array = ArrayLinkedList(
+            max_value, 'DESC', tree_class=tree_class, pool=pool, persistent_index=persistent_index,
+        )
+    elif engine == 'rle':
+        asc_array = RunLengthLinkedList(
+            min_value, tree_class=tree_class, persistent_index=persistent_index, decorated=decorated,
+        )
+        dsc_array = RunLengthLinkedList(
+            max_value, 'DESC', tree_class=tree_class, persistent_index=persistent_index, decorated=decorated,
+        )
+    else:
+        list_class = LIST_CLASSES[engine]
+        asc_array = list_class(min_value, tree_class=tree_class, persistent_index=persistent_index)
+        dsc_array = list_class(max_value, 'DESC', tree_class=tree_class, persistent_index=persistent_index)
+    asc_last, dsc_last = min_value, max_value
     pending_items = []
 
+    # Every item costs exactly two comparisons against the run tails. The
+    # tails only move on append: pending items never land past a tail.
     for curr_ind in range(input_arr_len):
         if curr_ind == min_value_ind or curr_ind == max_value_ind:
             continue
 
         curr_item = work_array[curr_ind]
 
-        if asc_array.last() <= curr_item <= dsc_array.last():
-            (asc_array if len(asc_array) < len(dsc_array) else dsc_array).append(curr_item)
-        elif asc_array.last() <= curr_item:
-            asc_array.append(curr_item)
-        elif dsc_array.last() >= curr_item:
+        if asc_last <= curr_item:
+            if curr_item <= dsc_last and len(dsc_array) <= len(asc_array):
+                dsc_array.append(curr_item)
+                dsc_last = curr_item
+            else:
+                asc_array.append(curr_item)
+                asc_last = curr_item
+        elif curr_item <= dsc_last:
             dsc_array.append(curr_item)
+            dsc_last = curr_item
         else:
             pending_items.append(curr_item)
             if len(pending_items) == pending_item_size:
-                (asc_array if len(asc_array) < len(dsc_array) else dsc_array).insert(pending_items)
+                target = asc_array if len(asc_array) < len(dsc_array) else dsc_array
+                if stats is not None:
+                    insert_start = perf_counter()
+                tree = target.insert(pending_items)
+                if stats is not None:
+                    insert_time += perf_counter() - insert_start
+                    stats.record_flush(len(pending_items), tree)
+                    if target is asc_array:
+                        inserted_into_asc += len(pending_items)
+                    else:
+                        inserted_into_dsc += len(pending_items)
                 pending_items = []
 
     if len(pending_items) != 0:
-        (asc_array if len(asc_array) < len(dsc_array) else dsc_array).insert(pending_items)
+        target = asc_array if len(asc_array) < len(dsc_array) else dsc_array
+        if stats is not None:
+            insert_start = perf_counter()
+        tree = target.insert(pending_items)
+        if stats is not None:
+            insert_time += perf_counter() - insert_start
+            stats.record_flush(len(pending_items), tree)
+            if target is asc_array:
+                inserted_into_asc += len(pending_items)
+            else:
+                inserted_into_dsc += len(pending_items)
+
+    if stats is not None:
+        stats.asc_appends += len(asc_array) - 1 - inserted_into_asc
+        stats.dsc_appends += len(dsc_array) - 1 - inserted_into_dsc
+        stats.nodes_walked += asc_array.walked + dsc_array.walked
+        # Two per dispatched item, one head check per pending item, plus
+        # whatever the lists spent finding each insert position.
+        stats.comparisons += (
+            2 * (input_arr_len - 2)
+            + inserted_into_asc + inserted_into_dsc
+            + asc_array.walk_comparisons + dsc_array.walk_comparisons
+        )
+        stats.phase_times['distribute'] += perf_counter() - phase_start - insert_time
+        stats.phase_times['insert'] += insert_time
+        phase_start = perf_counter()
+
+    if engine == 'rle':
+        comparisons = _merge_run_lists(work_array, asc_array, dsc_array, reverse, decorated)
+        if stats is not None:
+            stats.comparisons += comparisons
+            stats.phase_times['merge'] += perf_counter() - phase_start
+        return
+
+    if lazy:
+        return _iter_merged(asc_array, dsc_array, reverse, stats)
 
     if reverse:
         asc_iter = reversed(asc_array)
@@ -134,6 +772,9 @@ def bfc_sort(
             dsc_val = next(dsc_iter, None)
         idx += 1
 
+    if stats is not None:
+        stats.comparisons += idx
+
     while asc_val is not None:
         work_array[idx] = asc_val
         asc_val = next(asc_iter, None)
@@ -143,7 +784,383 @@ def bfc_sort(
         work_array[idx] = dsc_val
         dsc_val = next(dsc_iter, None)
         idx += 1
-        
+
+    if stats is not None:
+        stats.phase_times['merge'] += perf_counter() - phase_start
+
+def bfc_sort(
+    array, 
+    pending_item_percentage=None,
+    inplace=True,
+    reverse=False,
+    tree=None,
+    engine=None,
+    key=None,
+    workers=None,
+    stats=None,
+    accelerate=None,
+    persistent_index=None,
+    runs=None,
+    counting_threshold=None,
+    radix_max_bits=None,
+):
+    """
+    Sort an array of integers using bifurcated insertion sort.
+    
+    Args:
+        array (list | MutableSequence | buffer): Items to sort. Other mutable
+            sequences (``array.array``, ``bytearray``, ``collections.deque``) and
+            1-D objects exposing the buffer protocol (``memoryview``, NumPy arrays)
+            are sorted through a list of their items and the result is written
+            back into their own storage in chunks. Int arrays and buffers that
+            qualify for counting sort are counted straight from their storage
+            without the list
+        pending_item_percentage (float | str): Threshold for batch processing (0 < value <= 1,
+            default: 0.55). 'auto' picks 0.1 when the min/max scan sees many
+            adjacent duplicates, 1.0 when a sample of items ``AUTO_INVERSION_DISTANCE``
+            apart shows the input is only disordered locally (or reversed), and
+            0.55 otherwise.
+        inplace (bool): Modify array in-place if True, return new sorted list if False (default: True)
+        reverse (bool): Sort in descending order if True, ascending if False (default: False)
+        tree (str): Index used to place pending items: 'rb', 'avl', 'treap' or the
+            unbalanced 'bst' (default: 'rb'). The balanced trees keep each pending
+            insert O(log n) even when a batch arrives sorted or nearly sorted.
+        engine (str): Linked list storage: 'node' allocates one node object per
+            element, 'array' keeps data and links in preallocated parallel arrays,
+            which uses far less memory on large inputs, 'rle' stores each run of
+            equal items as one node, so inputs with few distinct values use memory
+            per distinct value and walk each value once, and 'skip' adds skip list
+            express lanes to the nodes so each pending insert walks O(log d) nodes
+            instead of d, e.g. across long runs of duplicates (default: 'node')
+        key (callable): One-argument function extracting a comparison key from each
+            item, called exactly once per item (default: None, compare items directly)
+        workers (int): Number of processes to sort with. Inputs of at least
+            ``parallel.PARALLEL_MIN_ITEMS`` items are range partitioned on sampled
+            pivots and the partitions sorted in a process pool; int and float
+            lists are shared with the workers instead of pickled. Items (and
+            keys) must be picklable otherwise (default: None, sort in this process)
+        stats (SortStats): Collects counters and per-phase times for this call,
+            added to whatever the object already holds (default: None)
+        accelerate (bool): Run the linked list phases in the compiled ``_speedups``
+            module, which builds 'node' lists indexed by its own AVL tree. True
+            requires the module, False forces the pure-Python path (default: None,
+            use it when it was built and neither a tree other than 'avl' nor an
+            engine other than 'node' is passed).
+            Lists of only ints within 64 bits, or only floats, are compared
+            unboxed through an ``array('q')``/``array('d')`` copy
+        persistent_index (bool): Keep one tree per linked list over every node, updated
+            on each append, instead of building a tree per pending batch. Pending
+            inserts then only walk across equal values, which pays off with small
+            pending batches; appends get slower (default: False)
+        runs (int): Number of runs items are distributed over. 2 is the classic
+            ascending/descending pair. More splits them between ascending and
+            descending runs chosen by binary search over the run tails, patience
+            sort style; only items fitting no run once all exist are pending, and
+            the runs are merged k-way at the end. The pending items are sorted
+            with the options above (default: 2)
+        counting_threshold (float): Lists of only ints (not bools) whose
+            ``max - min + 1`` is at most this many times their length are counting
+            sorted in O(n + range), skipping the linked lists; 0 turns it off
+            (default: None, ``COUNTING_SORT_THRESHOLD`` (0.5), see Integer input)
+        radix_max_bits (int): Lists of only ints too wide for counting sort whose
+            ``max - min`` fits in this many bits are LSD radix sorted, at most 16
+            bits per pass; 0 turns it off (default: None, see Integer input)
+    
+    Returns:
+        list: None if inplace=True, else a new sorted list
+    
+    Raises:
+        TypeError: If array is not a list, mutable sequence or 1-D buffer, contains
+            items that cannot be compared, key is not callable, workers is not an
+            integer, stats is not a SortStats, accelerate is not a boolean or None,
+            persistent_index is not a boolean, runs or radix_max_bits is not an
+            integer, or counting_threshold is not a number
+        ImportError: If accelerate=True and the compiled module is not available
+        ValueError: If pending_item_percentage is not between 0 and 1, tree/engine is unknown,
+            workers < 1, runs < 2, counting_threshold or radix_max_bits is negative,
+            accelerate=True is combined with a tree other than 'avl' or an
+            engine other than 'node', or
+            array is a read-only buffer and inplace=True
+    
+    Examples:
+        >>> from bifurcated_sort import bfc_sort
+        >>> arr = [5, 2, 8, 1, 9]
+        >>> bfc_sort(arr)
+        [1, 2, 5, 8, 9]
+
+        >>> result = bfc_sort([5, 2, 8], inplace=False, reverse=True)
+        >>> result
+        [8, 5, 2]
+
+        >>> records = [('b', 2), ('a', 1), ('c', 2)]
+        >>> bfc_sort(records, key=lambda r: r[1])
+        >>> records
+        [('a', 1), ('b', 2), ('c', 2)]
+
+    Presorted input:
+        The min/max scan also splits the input into natural ascending and
+        descending runs. Sorted and reversed inputs are finished in O(n), and
+        inputs whose runs average ``FAST_PATH_MIN_RUN`` items or more are merged
+        run by run without building the linked lists.
+
+    Integer input:
+        Integers spanning a narrow range are sorted by counting sort or LSD
+        radix sort right after the scan, which already found min and max. By
+        default radix sort takes ranges of up to ``RADIX_MAX_BITS`` (64) bits and
+        ``RADIX_MAX_BITS_PER_LOG2_N`` (8) bits per bit of log2(n); with the
+        compiled module only lists of ``INTEGER_SORT_MIN_ITEMS_ACCELERATED`` (2048)
+        items or more take either fallback, radix sort up to
+        ``RADIX_MAX_BITS_PER_LOG2_N_ACCELERATED`` (1.5) bits per bit of log2(n).
+        The defaults only apply while none of ``pending_item_percentage``,
+        ``tree``, ``engine``, ``persistent_index`` and ``runs`` is passed, even at
+        its default value, since the fallbacks never build the lists those
+        options shape; pass
+        ``counting_threshold`` or ``radix_max_bits`` explicitly to combine them.
+        Set ``counting_threshold=0, radix_max_bits=0`` to always use the linked lists.
+
+    Stability:
+        When ``key`` is given the sort is stable: items with equal keys keep their
+        input order, for ``reverse=True`` as well, matching ``sorted(array, key=key)``.
+        Without a key, items that compare equal may be reordered.
+    """
+    return _bfc_sort(
+        array, pending_item_percentage, inplace, reverse, tree, engine, key, workers, stats, accelerate,
+        persistent_index, runs, counting_threshold, radix_max_bits,
+    )
+
+def _bfc_sort(
+    array,
+    pending_item_percentage=None,
+    inplace=True,
+    reverse=False,
+    tree=None,
+    engine=None,
+    key=None,
+    workers=None,
+    stats=None,
+    accelerate=None,
+    persistent_index=None,
+    runs=None,
+    counting_threshold=None,
+    radix_max_bits=None,
+    lazy=False,
+):
+    """
+    ``bfc_sort``. With ``lazy`` and an in-place list, a sort that ends in the
+    pure-Python merge of the two linked lists returns a generator over that
+    merge instead of writing it back; every other path sorts ``array`` in
+    place and returns None as usual.
+    """
+    target = None
+    if not isinstance(array, list):
+        target = _sequence_target(array)
+        if target is None:
+            raise TypeError(
+                f"array must be a list or another mutable sequence, got {type(array).__name__}"
+            )
+        if isinstance(target, memoryview):
+            if target.ndim != 1:
+                raise TypeError(f"array must be one-dimensional, got {target.ndim} dimensions")
+            if inplace is True and target.readonly:
+                raise ValueError("array is read-only, pass inplace=False to get a sorted copy")
+
+    # Options shaping the linked lists default to None, so that passing any
+    # of them, even at its default value, keeps the integer fallbacks off.
+    list_options = dict(
+        pending_item_percentage=pending_item_percentage, tree=tree, engine=engine,
+        persistent_index=persistent_index, runs=runs,
+    )
+    lists_configured = any(option is not None for option in list_options.values())
+    if pending_item_percentage is None:
+        pending_item_percentage = 0.55
+    if tree is None:
+        tree = 'rb'
+    if engine is None:
+        engine = 'node'
+    if persistent_index is None:
+        persistent_index = False
+    if runs is None:
+        runs = 2
+
+    if pending_item_percentage == 'auto':
+        pass
+    elif not isinstance(pending_item_percentage, (int, float)):
+        raise TypeError(
+            f"pending_item_percentage must be a number or 'auto', "
+            f"got {type(pending_item_percentage).__name__}"
+        )
+    elif not 0 < pending_item_percentage <= 1:
+        raise ValueError(
+            f"pending_item_percentage must be between 0 and 1 (exclusive of 0), "
+            f"got {pending_item_percentage}"
+        )
+
+    if not isinstance(inplace, bool):
+        raise TypeError(
+            f"inplace must be a boolean (True or False), "
+            f"got {type(inplace).__name__}: {inplace}"
+        )
+
+    if not isinstance(reverse, bool):
+        raise TypeError(
+            f"reverse must be a boolean (True or False), "
+            f"got {type(reverse).__name__}: {reverse}"
+        )
+
+    if key is not None and not callable(key):
+        raise TypeError(
+            f"key must be callable or None, got {type(key).__name__}"
+        )
+
+    if tree not in TREE_TYPES:
+        raise ValueError(
+            f"tree must be one of {', '.join(repr(name) for name in TREE_TYPES)}, "
+            f"got {tree!r}"
+        )
+
+    if engine not in ENGINES:
+        raise ValueError(
+            f"engine must be one of {', '.join(repr(name) for name in ENGINES)}, "
+            f"got {engine!r}"
+        )
+
+    if workers is not None:
+        if not isinstance(workers, int) or isinstance(workers, bool):
+            raise TypeError(
+                f"workers must be an integer or None, got {type(workers).__name__}"
+            )
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+    if stats is not None and not isinstance(stats, SortStats):
+        raise TypeError(
+            f"stats must be a SortStats or None, got {type(stats).__name__}"
+        )
+
+    if accelerate is not None and not isinstance(accelerate, bool):
+        raise TypeError(
+            f"accelerate must be a boolean or None, got {type(accelerate).__name__}"
+        )
+
+    if list_options['engine'] not in (None, ACCELERATED_ENGINE):
+        python_only = f"engine={engine!r}"
+    elif list_options['tree'] not in (None, ACCELERATED_TREE):
+        python_only = f"tree={tree!r}"
+    else:
+        python_only = None
+
+    if accelerate and python_only is not None:
+        raise ValueError(f"{python_only} is not available with accelerate=True")
+
+    if accelerate and _speedups is None:
+        raise ImportError(
+            "accelerate=True needs the compiled bifurcated_sort._speedups module, "
+            "reinstall bifurcated_sort with a C compiler available"
+        )
+
+    if accelerate is None:
+        accelerate = _speedups is not None and python_only is None
+
+    if not isinstance(persistent_index, bool):
+        raise TypeError(
+            f"persistent_index must be a boolean (True or False), "
+            f"got {type(persistent_index).__name__}: {persistent_index}"
+        )
+
+    if not isinstance(runs, int) or isinstance(runs, bool):
+        raise TypeError(f"runs must be an integer, got {type(runs).__name__}")
+
+    if runs < 2:
+        raise ValueError(f"runs must be at least 2, got {runs}")
+
+    if counting_threshold is None:
+        if lists_configured:
+            counting_threshold = 0
+    elif not isinstance(counting_threshold, (int, float)) or isinstance(counting_threshold, bool):
+        raise TypeError(
+            f"counting_threshold must be a number or None, got {type(counting_threshold).__name__}"
+        )
+    elif not counting_threshold >= 0:
+        raise ValueError(f"counting_threshold must be at least 0, got {counting_threshold}")
+
+    if radix_max_bits is None:
+        if lists_configured:
+            radix_max_bits = 0
+    elif not isinstance(radix_max_bits, int) or isinstance(radix_max_bits, bool):
+        raise TypeError(
+            f"radix_max_bits must be an integer or None, got {type(radix_max_bits).__name__}"
+        )
+    elif radix_max_bits < 0:
+        raise ValueError(f"radix_max_bits must be at least 0, got {radix_max_bits}")
+
+    if target is not None and key is None and (workers is None or workers == 1):
+        sorted_items = _counting_sort_buffer(target, reverse, counting_threshold, accelerate, stats)
+        if sorted_items is not None:
+            if not inplace:
+                return list(sorted_items)
+            _write_back(target, sorted_items)
+            return None
+
+    if target is None:
+        pass
+    elif not isinstance(target, memoryview):
+        array = list(target)
+    else:
+        try:
+            array = target.tolist()
+        except NotImplementedError:
+            raise TypeError(f"array buffer format {target.format!r} is not supported") from None
+
+    input_arr_len = len(array)
+    if input_arr_len == 0:
+        return None if inplace else []
+
+    if input_arr_len == 1:
+        return None if inplace else array.copy()
+
+    # A non-list array was already copied into a fresh list above.
+    work_array = array if inplace or target is not None else array.copy()
+
+    if workers is not None and workers > 1 and input_arr_len >= parallel.PARALLEL_MIN_ITEMS:
+        # The list options go as given, so partitions make the same
+        # choice of integer fallbacks as this call.
+        sort_kwargs = dict(
+            list_options, accelerate=accelerate, counting_threshold=counting_threshold,
+            radix_max_bits=radix_max_bits,
+        )
+        def sort_items(items):
+            # Partitions are sorted ascending; reading the result backwards
+            # gives the descending order, also for the keyed tie-break below.
+            parallel.parallel_sort(items, workers, sort_kwargs, stats)
+            if reverse:
+                items.reverse()
+    else:
+        tree_class = TREE_TYPES[tree]
+        def sort_items(items):
+            return _bifurcated_sort(
+                items, pending_item_percentage, reverse, tree_class, engine, stats, accelerate, persistent_index,
+                runs, counting_threshold, radix_max_bits, key is not None, lazy,
+            )
+
+    if key is None:
+        merged = sort_items(work_array)
+        if merged is not None:
+            return merged
+    else:
+        # Decorate once so every key is computed exactly once. The original
+        # index breaks ties, which makes the sort stable and means the items
+        # themselves are never compared. Negating it under reverse keeps equal
+        # keys in input order once the ascending result is read backwards.
+        step = -1 if reverse else 1
+        decorated = [(key(item), i * step, item) for i, item in enumerate(work_array)]
+        merged = sort_items(decorated)
+        if merged is not None:
+            return (entry[2] for entry in merged)
+        work_array[:] = [entry[2] for entry in decorated]
+
+    if target is not None and inplace:
+        _write_back(target, work_array)
+
     return None if inplace else work_array
 
 def bfc_sorted(array, **kwargs):
@@ -158,3 +1175,103 @@ def bfc_sorted(array, **kwargs):
         [5, 2, 8, 1]  # unchanged
     """
     return bfc_sort(array, inplace=False, **kwargs)
+
+
+ARGSORT_OUTPUTS = ('list', 'array', 'numpy')
+
+def _index_array(indices):
+    # Module level because bfc_argsort's ``array`` argument shadows the type.
+    return array('q', indices)
+
+def bfc_argsort(array, reverse=False, output='list', key=None, **kwargs):
+    """
+    Return the permutation of indices that sorts ``array``, so that
+    ``[array[i] for i in bfc_argsort(array)]`` is sorted. Useful to reorder
+    several parallel columns by one of them.
+
+    Each item travels through the linked lists together with its index, the
+    same decoration ``bfc_sort`` uses for ``key``, so the permutation is
+    stable: equal items keep their input order, for ``reverse=True`` too.
+
+    Args:
+        array (Sequence | buffer): Items to rank; it is not modified
+        reverse (bool): Order for a descending sort if True (default: False)
+        output (str): 'list' for a list of ints, 'array' for an ``array('q')`` or
+            'numpy' for an ``intp`` ndarray; the last two keep memory flat on
+            large inputs (default: 'list')
+        key (callable): One-argument function extracting a comparison key, called
+            once per item (default: None)
+        **kwargs: Other ``bfc_sort`` options (pending_item_percentage, tree, engine,
+            workers, stats, accelerate, persistent_index), but not inplace
+
+    Returns:
+        list | array.array | numpy.ndarray: The index permutation
+
+    Raises:
+        TypeError: If array is not a sequence or buffer, reverse is not a boolean,
+            key is not callable or inplace is given, or as ``bfc_sort`` for the
+            other options
+        ValueError: If output is unknown
+        ImportError: If output='numpy' and NumPy is not installed
+
+    Examples:
+        >>> from bifurcated_sort import bfc_argsort
+        >>> bfc_argsort([30, 10, 20])
+        [1, 2, 0]
+        >>> bfc_argsort([30, 10, 20], reverse=True)
+        [0, 2, 1]
+    """
+    if isinstance(array, list):
+        values = array
+    elif isinstance(array, Sequence) and not isinstance(array, str):
+        values = list(array)
+    else:
+        target = _sequence_target(array)
+        if target is None:
+            raise TypeError(
+                f"array must be a list or another sequence, got {type(array).__name__}"
+            )
+        values = target.tolist() if isinstance(target, memoryview) else list(target)
+
+    if not isinstance(reverse, bool):
+        raise TypeError(
+            f"reverse must be a boolean (True or False), "
+            f"got {type(reverse).__name__}: {reverse}"
+        )
+
+    if output not in ARGSORT_OUTPUTS:
+        raise ValueError(
+            f"output must be one of {', '.join(repr(name) for name in ARGSORT_OUTPUTS)}, "
+            f"got {output!r}"
+        )
+
+    if key is not None and not callable(key):
+        raise TypeError(
+            f"key must be callable or None, got {type(key).__name__}"
+        )
+
+    if output == 'numpy':
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "output='numpy' requires NumPy, install it with `pip install numpy`"
+            ) from None
+
+    # The signed index breaks ties exactly as in bfc_sort's key decoration,
+    # and the pairs are unique, so items are only compared by value.
+    step = -1 if reverse else 1
+    if key is None:
+        decorated = [(item, i * step) for i, item in enumerate(values)]
+    else:
+        decorated = [(key(item), i * step) for i, item in enumerate(values)]
+    # inplace is passed explicitly so a caller's inplace=False is rejected
+    # instead of sorting a copy and returning the identity permutation.
+    bfc_sort(decorated, inplace=True, reverse=reverse, **kwargs)
+    indices = [entry[1] * step for entry in decorated]
+
+    if output == 'array':
+        return _index_array(indices)
+    if output == 'numpy':
+        return np.array(indices, dtype=np.intp)
+    return indices
@@ -0,0 +1,98 @@
+class SortStats:
+    """
+    Counters collected by ``bfc_sort(..., stats=SortStats())``.
+
+    Every counter is either derived after the fact (list lengths, walk
+    totals) or updated once per flush or phase, so collecting stats adds
+    no work per item. Passing the same object to several calls accumulates
+    their totals; call ``reset()`` to start over.
+
+    Attributes:
+        items (int): Items sorted (decorated items when a key is used)
+        runs (int): Natural runs found by the min/max scan
+        fast_path (str | None): How the last sort finished early: 'equal', 'sorted',
+            'reversed', 'runs', or 'counting'/'radix' for narrow int ranges; None
+            if it went through the linked lists
+        asc_appends (int): Items appended to the ascending list's tail (or runs' tails)
+        dsc_appends (int): Items appended to the descending list's tail (or runs' tails)
+        pending_items (int): Items that fitted neither tail and were inserted later
+        pending_flushes (int): Pending batches inserted into a list
+        nodes_walked (int): Nodes stepped over by ``LinkedList.insert_in_order``
+        tree_depths (list): Depth of the nearest-value tree after each batch: its
+            height for 'avl', else the deepest level an insert placed a node at
+            before the 'rb' and 'treap' rotations moved it
+        comparisons (int): Item comparisons in the scan, distribute, list walk
+            and merge phases. Lookups in the per-batch tree are not counted, and
+            with ``runs`` > 2 only the scan is
+        phase_times (dict): Seconds spent in 'scan', 'distribute', 'insert' and 'merge'.
+            The compiled accelerator inserts batches inside its distribute loop,
+            so their time is reported under 'distribute'
+
+    Examples:
+        >>> from bifurcated_sort import bfc_sort, SortStats
+        >>> stats = SortStats()
+        >>> bfc_sort([5, 2, 8, 1, 9, 3, 7], stats=stats, radix_max_bits=0)
+        >>> stats.pending_items, stats.nodes_walked
+        (1, 2)
+    """
+
+    PHASES = ('scan', 'distribute', 'insert', 'merge')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.items = 0
+        self.runs = 0
+        self.fast_path = None
+        self.asc_appends = 0
+        self.dsc_appends = 0
+        self.pending_items = 0
+        self.pending_flushes = 0
+        self.nodes_walked = 0
+        self.tree_depths = []
+        self.comparisons = 0
+        self.phase_times = dict.fromkeys(self.PHASES, 0.0)
+
+    def record_flush(self, batch_size, tree):
+        self.pending_items += batch_size
+        self.pending_flushes += 1
+        self.tree_depths.append(tree.max_insert_depth())
+
+    def merge(self, other):
+        """Add the counters of ``other`` into this object."""
+        self.items += other.items
+        self.runs += other.runs
+        self.fast_path = other.fast_path
+        self.asc_appends += other.asc_appends
+        self.dsc_appends += other.dsc_appends
+        self.pending_items += other.pending_items
+        self.pending_flushes += other.pending_flushes
+        self.nodes_walked += other.nodes_walked
+        self.tree_depths.extend(other.tree_depths)
+        self.comparisons += other.comparisons
+        for phase in self.PHASES:
+            self.phase_times[phase] += other.phase_times[phase]
+
+    def as_dict(self):
+        return {
+            'items': self.items,
+            'runs': self.runs,
+            'fast_path': self.fast_path,
+            'asc_appends': self.asc_appends,
+            'dsc_appends': self.dsc_appends,
+            'pending_items': self.pending_items,
+            'pending_flushes': self.pending_flushes,
+            'nodes_walked': self.nodes_walked,
+            'tree_depths': list(self.tree_depths),
+            'comparisons': self.comparisons,
+            'phase_times': dict(self.phase_times),
+        }
+
+    def __repr__(self):
+        return (
+            f"SortStats(items={self.items}, fast_path={self.fast_path!r}, "
+            f"asc_appends={self.asc_appends}, dsc_appends={self.dsc_appends}, "
+            f"pending_items={self.pending_items}, pending_flushes={self.pending_flushes}, "
+            f"nodes_walked={self.nodes_walked}, comparisons={self.comparisons})"
+        )
@@ -0,0 +1,340 @@
+import heapq
+from itertools import islice
+
+from .bst import TREE_TYPES
+from .linkedlist import ArrayLinkedList
+from .node import NodeArrays
+from .sorter import ENGINES, LIST_CLASSES, _bfc_sort, bfc_sort
+
+# Items pulled from the input per pruning pass in bfc_topk.
+TOPK_CHUNK_SIZE = 4096
+
+class BifurcatedSorter:
+    """
+    Incremental bifurcated sort. Items are pushed one at a time onto the
+    ascending and descending runs, or parked in the pending buffer, exactly
+    as ``bfc_sort`` distributes a list, so a stream can be sorted without
+    holding a copy of the input.
+
+    Iterating merges the two runs lazily. The pending buffer is flushed
+    first, so iteration reflects every item pushed so far; pushing while an
+    iteration is in progress is not supported.
+
+    Args:
+        iterable (iterable): Items to push straight away (default: empty)
+        pending_item_percentage (float): Pending items are flushed once they reach this
+            fraction of the items pushed so far (0 < value <= 1, default: 0.55)
+        reverse (bool): Iterate in descending order if True (default: False)
+        tree (str): Tree type used to place pending items, see ``bfc_sort`` (default: 'rb')
+        engine (str): Linked list storage, see ``bfc_sort`` (default: 'node')
+        key (callable): One-argument function extracting a comparison key, called
+            once per item. Ordering is stable when a key is given (default: None)
+        persistent_index (bool): Index every node of each run in one tree instead of
+            one tree per flush, see ``bfc_sort`` (default: False)
+
+    Examples:
+        >>> from bifurcated_sort import BifurcatedSorter
+        >>> sorter = BifurcatedSorter([5, 2, 8])
+        >>> sorter.extend([1, 9])
+        >>> sorter.min(), sorter.max()
+        (1, 9)
+        >>> list(sorter)
+        [1, 2, 5, 8, 9]
+    """
+
+    def __init__(
+        self,
+        iterable=(),
+        pending_item_percentage=0.55,
+        reverse=False,
+        tree='rb',
+        engine='node',
+        key=None,
+        persistent_index=False,
+    ):
+        if not isinstance(pending_item_percentage, (int, float)):
+            raise TypeError(
+                f"pending_item_percentage must be a number, "
+                f"got {type(pending_item_percentage).__name__}"
+            )
+
+        if not 0 < pending_item_percentage <= 1:
+            raise ValueError(
+                f"pending_item_percentage must be between 0 and 1 (exclusive of 0), "
+                f"got {pending_item_percentage}"
+            )
+
+        if not isinstance(reverse, bool):
+            raise TypeError(
+                f"reverse must be a boolean (True or False), "
+                f"got {type(reverse).__name__}: {reverse}"
+            )
+
+        if key is not None and not callable(key):
+            raise TypeError(
+                f"key must be callable or None, got {type(key).__name__}"
+            )
+
+        if not isinstance(persistent_index, bool):
+            raise TypeError(
+                f"persistent_index must be a boolean (True or False), "
+                f"got {type(persistent_index).__name__}: {persistent_index}"
+            )
+
+        if tree not in TREE_TYPES:
+            raise ValueError(
+                f"tree must be one of {', '.join(repr(name) for name in TREE_TYPES)}, "
+                f"got {tree!r}"
+            )
+
+        if engine not in ENGINES:
+            raise ValueError(
+                f"engine must be one of {', '.join(repr(name) for name in ENGINES)}, "
+                f"got {engine!r}"
+            )
+
+        self.pending_item_percentage = pending_item_percentage
+        self.reverse = reverse
+        self.key = key
+        self.tree_class = TREE_TYPES[tree]
+        self.pool = NodeArrays() if engine == 'array' else None
+        self.list_class = LIST_CLASSES.get(engine)
+        self.persistent_index = persistent_index
+        self.asc_array = None
+        self.dsc_array = None
+        self.pending_items = []
+        self.count = 0
+
+        self.extend(iterable)
+
+    def __len__(self):
+        return self.count
+
+    def _new_list(self, data, order):
+        if self.pool is not None:
+            return ArrayLinkedList(
+                data, order, tree_class=self.tree_class, pool=self.pool, persistent_index=self.persistent_index,
+            )
+        return self.list_class(data, order, tree_class=self.tree_class, persistent_index=self.persistent_index)
+
+    def _decorate(self, item):
+        if self.key is None:
+            return item
+        # Same decoration as bfc_sort: the arrival index breaks ties.
+        return (self.key(item), -self.count if self.reverse else self.count, item)
+
+    def _undecorate(self, data):
+        return data if self.key is None else data[2]
+
+    def push(self, item):
+        """Add one item."""
+        curr_item = self._decorate(item)
+        asc_array, dsc_array = self.asc_array, self.dsc_array
+        self.count += 1
+
+        if asc_array is None:
+            self.asc_array = self._new_list(curr_item, 'ASC')
+        elif dsc_array is None:
+            if asc_array.last() <= curr_item:
+                asc_array.append(curr_item)
+            else:
+                self.dsc_array = self._new_list(curr_item, 'DESC')
+        elif asc_array.last() <= curr_item <= dsc_array.last():
+            (asc_array if len(asc_array) < len(dsc_array) else dsc_array).append(curr_item)
+        elif asc_array.last() <= curr_item:
+            asc_array.append(curr_item)
+        elif dsc_array.last() >= curr_item:
+            dsc_array.append(curr_item)
+        else:
+            self.pending_items.append(curr_item)
+            if len(self.pending_items) >= self.count * self.pending_item_percentage:
+                self.flush()
+
+    def extend(self, iterable):
+        """Add every item from ``iterable``, consuming it lazily."""
+        push = self.push
+        for item in iterable:
+            push(item)
+
+    def flush(self):
+        """Insert the pending buffer into the shorter run."""
+        if not self.pending_items:
+            return
+        asc_array, dsc_array = self.asc_array, self.dsc_array
+        (asc_array if len(asc_array) < len(dsc_array) else dsc_array).insert(self.pending_items)
+        self.pending_items = []
+
+    def min(self):
+        """Return the smallest item in O(1)."""
+        if self.asc_array is None:
+            raise ValueError("min() of an empty BifurcatedSorter")
+        smallest = self.asc_array.first()
+        if self.dsc_array is not None and self.dsc_array.last() < smallest:
+            smallest = self.dsc_array.last()
+        return self._undecorate(smallest)
+
+    def max(self):
+        """Return the largest item in O(1)."""
+        if self.asc_array is None:
+            raise ValueError("max() of an empty BifurcatedSorter")
+        largest = self.asc_array.last()
+        if self.dsc_array is not None and self.dsc_array.first() > largest:
+            largest = self.dsc_array.first()
+        return self._undecorate(largest)
+
+    def __iter__(self):
+        if self.asc_array is None:
+            return
+        self.flush()
+        undecorate = self._undecorate
+
+        if self.dsc_array is None:
+            ordered = reversed(self.asc_array) if self.reverse else iter(self.asc_array)
+            for data in ordered:
+                yield undecorate(data)
+            return
+
+        if self.reverse:
+            asc_iter = reversed(self.asc_array)
+            dsc_iter = reversed(self.dsc_array)
+            compare_op = lambda a, b: a > b
+        else:
+            asc_iter = iter(self.asc_array)
+            dsc_iter = iter(self.dsc_array)
+            compare_op = lambda a, b: a < b
+
+        asc_val = next(asc_iter, None)
+        dsc_val = next(dsc_iter, None)
+
+        while asc_val is not None and dsc_val is not None:
+            if compare_op(asc_val, dsc_val):
+                yield undecorate(asc_val)
+                asc_val = next(asc_iter, None)
+            else:
+                yield undecorate(dsc_val)
+                dsc_val = next(dsc_iter, None)
+
+        while asc_val is not None:
+            yield undecorate(asc_val)
+            asc_val = next(asc_iter, None)
+
+        while dsc_val is not None:
+            yield undecorate(dsc_val)
+            dsc_val = next(dsc_iter, None)
+
+
+def bfc_iter(iterable, reverse=False, key=None, **kwargs):
+    """
+    Sort an iterable and yield its items as they come out of the final merge
+    of the ascending and descending linked lists. The input is read into a
+    list and distributed exactly as ``bfc_sort`` does it, with its fast paths,
+    integer fallbacks and compiled module, but the pure-Python merge runs
+    lazily as the consumer pulls, so the first item is available without
+    merging the rest. Paths that finish without that merge sort the list in
+    place and yield from it.
+
+    Args:
+        iterable (iterable): Items to sort
+        reverse (bool): Yield in descending order if True (default: False)
+        key (callable): One-argument function extracting a comparison key (default: None)
+        **kwargs: Other ``bfc_sort`` options (pending_item_percentage, tree, engine,
+            workers, stats, accelerate, persistent_index, runs, counting_threshold,
+            radix_max_bits), but not inplace
+
+    Returns:
+        iterator: The items in sorted order
+
+    Raises:
+        TypeError, ValueError, ImportError: As ``bfc_sort``, when the call is made
+
+    Examples:
+        >>> from bifurcated_sort import bfc_iter
+        >>> it = bfc_iter([5, 2, 8, 1])
+        >>> next(it)
+        1
+        >>> list(it)
+        [2, 5, 8]
+    """
+    items = list(iterable)
+    merged = _bfc_sort(items, reverse=reverse, key=key, lazy=True, **kwargs)
+    return iter(items) if merged is None else merged
+
+
+def bfc_topk(array, k, reverse=False, key=None):
+    """
+    Return the ``k`` smallest items (largest if ``reverse``) in sorted order,
+    the same as ``sorted(array, key=key, reverse=reverse)[:k]``.
+
+    The input is read in chunks. Only items that beat the current k-th item
+    are kept; each chunk's survivors are sorted with ``bfc_sort`` and merged
+    into the current top ``k``, stopping after ``k`` items, so the rest of
+    the input is never placed or merged.
+
+    Args:
+        array (iterable): Items to select from, consumed lazily
+        k (int): Number of items to return (>= 0)
+        reverse (bool): Select the largest items, in descending order (default: False)
+        key (callable): One-argument function extracting a comparison key, called
+            once per item. Selection is stable when a key is given (default: None)
+
+    Returns:
+        list: At most ``k`` items in sorted order
+
+    Raises:
+        TypeError: If k is not an integer, reverse is not a boolean or key is not callable
+        ValueError: If k is negative
+
+    Examples:
+        >>> from bifurcated_sort import bfc_topk
+        >>> bfc_topk([15, 3, 8, 1, 12, 6], 3)
+        [1, 3, 6]
+        >>> bfc_topk([15, 3, 8, 1, 12, 6], 2, reverse=True)
+        [15, 12]
+    """
+    if not isinstance(k, int) or isinstance(k, bool):
+        raise TypeError(f"k must be an integer, got {type(k).__name__}")
+
+    if k < 0:
+        raise ValueError(f"k must be at least 0, got {k}")
+
+    if not isinstance(reverse, bool):
+        raise TypeError(
+            f"reverse must be a boolean (True or False), "
+            f"got {type(reverse).__name__}: {reverse}"
+        )
+
+    if key is not None and not callable(key):
+        raise TypeError(
+            f"key must be callable or None, got {type(key).__name__}"
+        )
+
+    if k == 0:
+        return []
+
+    items = iter(array)
+    if key is not None:
+        # Same decoration as bfc_sort: the input index breaks ties.
+        step = -1 if reverse else 1
+        items = ((key(item), i * step, item) for i, item in enumerate(items))
+
+    best = list(islice(items, k))
+    bfc_sort(best, reverse=reverse)
+    chunk_size = max(k, TOPK_CHUNK_SIZE)
+
+    while len(best) == k:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            break
+        # Equal items keep the earlier one, as a stable sort would.
+        threshold = best[-1]
+        if reverse:
+            candidates = [item for item in chunk if item > threshold]
+        else:
+            candidates = [item for item in chunk if item < threshold]
+        if candidates:
+            bfc_sort(candidates, reverse=reverse)
+            best = list(islice(heapq.merge(best, candidates, reverse=reverse), k))
+
+    if key is not None:
+        return [data[2] for data in best]
+    return best
@@ -0,0 +1,110 @@
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "bfc_sort_array requires NumPy, install it with `pip install numpy`"
+        ) from None
+    return np
+
+
+def _merge_sorted(np, left, right):
+    # Each value's output slot is its own index plus the number of values
+    # from the other run that precede it; ties keep left before right.
+    merged = np.empty(len(left) + len(right), dtype=left.dtype)
+    merged[np.arange(len(left)) + np.searchsorted(right, left, side='left')] = left
+    merged[np.arange(len(right)) + np.searchsorted(left, right, side='right')] = right
+    return merged
+
+
+def bfc_sort_array(array, inplace=True, reverse=False):
+    """
+    Sort a 1-D numeric NumPy array (or any writable buffer) with a vectorized
+    bifurcated sort.
+
+    The running maximum picks out the ascending run and the running minimum
+    the descending run, exactly the items the linked-list version would
+    append to its two tails. Whatever fits neither is sorted as one pending
+    batch, and the three runs are merged with ``searchsorted``. The result is
+    written back into the caller's buffer, no Python objects are created per
+    element.
+
+    Args:
+        array (numpy.ndarray | buffer): 1-D numeric array, or an object exposing
+            the buffer protocol such as ``array.array`` or ``memoryview``
+        inplace (bool): Write into ``array`` if True, return a sorted copy if False (default: True)
+        reverse (bool): Sort in descending order if True, ascending if False (default: False)
+
+    Returns:
+        numpy.ndarray | None: None if inplace=True, else the sorted copy
+
+    Raises:
+        ImportError: If NumPy is not installed
+        TypeError: If array is not numeric or not one-dimensional
+        ValueError: If array contains NaN or is read-only with inplace=True
+
+    Examples:
+        >>> import numpy as np
+        >>> from bifurcated_sort import bfc_sort_array
+        >>> arr = np.array([5, 2, 8, 1, 9])
+        >>> bfc_sort_array(arr)
+        >>> arr
+        array([1, 2, 5, 8, 9])
+    """
+    np = _import_numpy()
+
+    if not isinstance(inplace, bool):
+        raise TypeError(
+            f"inplace must be a boolean (True or False), "
+            f"got {type(inplace).__name__}: {inplace}"
+        )
+
+    if not isinstance(reverse, bool):
+        raise TypeError(
+            f"reverse must be a boolean (True or False), "
+            f"got {type(reverse).__name__}: {reverse}"
+        )
+
+    if isinstance(array, np.ndarray):
+        values = array
+    else:
+        try:
+            values = np.asarray(memoryview(array))
+        except TypeError:
+            raise TypeError(
+                f"array must be a NumPy array or support the buffer protocol, "
+                f"got {type(array).__name__}"
+            ) from None
+
+    if values.ndim != 1:
+        raise TypeError(f"array must be one-dimensional, got {values.ndim} dimensions")
+
+    if values.dtype.kind not in 'biuf':
+        raise TypeError(f"array must be numeric, got dtype {values.dtype}")
+
+    if not inplace:
+        values = values.copy()
+    elif not values.flags.writeable:
+        raise ValueError("array is read-only, pass inplace=False to get a sorted copy")
+
+    if len(values) < 2:
+        return None if inplace else values
+
+    if values.dtype.kind == 'f' and np.isnan(values).any():
+        raise ValueError("array must not contain NaN")
+
+    if values.min() == values.max():
+        return None if inplace else values
+
+    asc_mask = values == np.maximum.accumulate(values)
+    dsc_mask = (values == np.minimum.accumulate(values)) & ~asc_mask
+    pending_mask = ~(asc_mask | dsc_mask)
+
+    asc_run = values[asc_mask]
+    dsc_run = values[dsc_mask][::-1]
+    pending = np.sort(values[pending_mask])
+
+    merged = _merge_sorted(np, _merge_sorted(np, asc_run, dsc_run), pending)
+    values[:] = merged[::-1] if reverse else merged
+
+    return None if inplace else values
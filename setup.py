@@ -0,0 +1,13 @@
+from setuptools import Extension, setup
+
+# The compiled accelerator is optional: when there is no C compiler the
+# build carries on and bfc_sort uses its pure-Python implementation.
+setup(
+    ext_modules=[
+        Extension(
+            "bifurcated_sort._speedups",
+            sources=["bifurcated_sort/_speedups.c"],
+            optional=True,
+        ),
+    ],
+)
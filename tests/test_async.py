@@ -0,0 +1,109 @@
+import asyncio
+import random
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import pytest
+from bifurcated_sort import bfc_sort_async
+
+# ============ COOPERATIVE TESTS ============
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sorts_in_place(reverse):
+    values = [random.randint(0, 10**6) for _ in range(5000)]
+    arr = list(values)
+    assert asyncio.run(bfc_sort_async(arr, reverse=reverse)) is None
+    assert arr == sorted(values, reverse=reverse)
+
+def test_not_inplace_and_key():
+    records = [(random.randint(0, 9), i) for i in range(3000)]
+    original = list(records)
+    result = asyncio.run(bfc_sort_async(records, inplace=False, key=lambda r: r[0], engine='array'))
+    assert result == sorted(original, key=lambda r: r[0])
+    assert records == original
+
+def test_other_sequences():
+    values = array('i', [random.randint(-100, 100) for _ in range(2000)])
+    expected = sorted(values)
+    asyncio.run(bfc_sort_async(values))
+    assert values.tolist() == expected
+    assert asyncio.run(bfc_sort_async(b"cab", inplace=False)) == [97, 98, 99]
+
+def test_yields_to_the_loop():
+    values = [random.randint(0, 10**9) for _ in range(50000)]
+    ticks = []
+
+    async def ticker(done):
+        while not done.is_set():
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0)
+
+    async def main():
+        done = asyncio.Event()
+        task = asyncio.create_task(ticker(done))
+        await asyncio.sleep(0)
+        await bfc_sort_async(values, max_slice=0.001)
+        done.set()
+        await task
+
+    asyncio.run(main())
+    assert values == sorted(values)
+    assert len(ticks) > 20
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_key_stable_across_chunks(reverse):
+    records = [(random.randint(0, 9), i) for i in range(20000)]
+    expected = sorted(records, key=lambda r: r[0], reverse=reverse)
+    asyncio.run(bfc_sort_async(records, key=lambda r: r[0], reverse=reverse, max_slice=0.0005))
+    assert records == expected
+
+def test_timer_tasks_run_between_slices():
+    """Tasks woken by a timer get the loop between slices, not only after the sort"""
+    values = [random.randint(0, 10**9) for _ in range(100000)]
+    ticks = []
+
+    async def ticker(done):
+        while not done.is_set():
+            await asyncio.sleep(0.0001)
+            ticks.append(time.perf_counter())
+
+    async def main():
+        done = asyncio.Event()
+        task = asyncio.create_task(ticker(done))
+        await asyncio.sleep(0.001)
+        start = time.perf_counter()
+        await bfc_sort_async(values, max_slice=0.001)
+        end = time.perf_counter()
+        done.set()
+        await task
+        return start, end
+
+    start, end = asyncio.run(main())
+    assert values == sorted(values)
+    assert len([t for t in ticks if start < t < end]) > 10
+
+# ============ EXECUTOR TESTS ============
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_executor(executor_class):
+    values = [random.randint(0, 10**6) for _ in range(3000)]
+    arr = list(values)
+    with executor_class(max_workers=1) as executor:
+        asyncio.run(bfc_sort_async(arr, reverse=True, executor=executor, runs=4))
+    assert arr == sorted(values, reverse=True)
+
+# ============ VALIDATION TESTS ============
+
+def test_invalid_arguments():
+    with pytest.raises(TypeError, match="max_slice must be a number"):
+        asyncio.run(bfc_sort_async([2, 1], max_slice='fast'))
+    with pytest.raises(ValueError, match="max_slice must be positive"):
+        asyncio.run(bfc_sort_async([2, 1], max_slice=0))
+    with pytest.raises(TypeError, match="executor must be"):
+        asyncio.run(bfc_sort_async([2, 1], executor=4))
+    with pytest.raises(TypeError, match="array must be a list"):
+        asyncio.run(bfc_sort_async((2, 1)))
+    with pytest.raises(ValueError, match="read-only"):
+        asyncio.run(bfc_sort_async(b"ba"))
+    with pytest.raises(TypeError, match="reverse must be a boolean"):
+        asyncio.run(bfc_sort_async([2, 1], reverse=1))
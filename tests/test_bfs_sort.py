@@ -1,66 +1,73 @@
+import array
+import collections
 import random
 import pytest
-from bifurcated_sort import bfc_sort
+from bifurcated_sort import bfc_sort, bfc_argsort, SortStats
+from bifurcated_sort import sorter
+
+# Keeps int inputs on the linked lists; test_integer_sort covers the
+# counting and radix sort fallbacks.
+LINKED_LISTS = dict(counting_threshold=0, radix_max_bits=0)
 
 # ============ BASIC TESTS ============
 
 def test_basic_sorting():
     arr = [3, 1, 2]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1, 2, 3]
 
 def test_duplicates():
     arr = [4, 4, 2, 1]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1, 2, 4, 4]
 
 def test_already_sorted():
     arr = [1, 2, 3, 4]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1, 2, 3, 4]
 
 def test_reverse_sorted():
     arr = [5, 4, 3, 2, 1]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1, 2, 3, 4, 5]
 
 def test_single():
     arr = [10]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [10]
 
 def test_empty():
     arr = []
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == []
 
 def test_two_elements():
     arr = [2, 1]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1, 2]
 
 def test_two_elements_sorted():
     arr = [1, 2]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1, 2]
 
 # ============ DUPLICATE TESTS ============
 
 def test_all_duplicates():
     arr = [5, 5, 5, 5, 5]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [5, 5, 5, 5, 5]
 
 def test_many_duplicates():
     arr = [3, 1, 2, 3, 1, 2, 3, 1, 2]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_duplicates_at_extremes():
     arr = [1, 5, 1, 3, 5, 2, 1, 5]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 # ============ NEGATIVE NUMBER TESTS ============
@@ -68,37 +75,37 @@ def test_duplicates_at_extremes():
 def test_negative_numbers():
     arr = [-3, -1, -7, 2, 5]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_all_negative():
     arr = [-5, -10, -1, -3]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_negative_duplicates():
     arr = [-2, -2, -1, -5, -1]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_negative_and_positive():
     arr = [-10, 5, -3, 8, 0, -1, 3]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_zero_included():
     arr = [0, -1, 1, -2, 2]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_multiple_zeros():
     arr = [0, 5, 0, -3, 0, 2]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 # ============ FLOAT TESTS ============
@@ -106,25 +113,25 @@ def test_multiple_zeros():
 def test_float_numbers():
     arr = [3.2, 1.5, 2.8]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_float_and_int_mix():
     arr = [4.5, 2, 3.1, 1]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_float_precision():
     arr = [1.1, 1.11, 1.111, 1.0, 1.01]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_negative_floats():
     arr = [-3.5, -1.2, -5.8, -2.0]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 # ============ EDGE CASES ============
@@ -133,49 +140,49 @@ def test_min_max_at_ends():
     """Min and max are already at start/end"""
     arr = [1, 5, 3, 4, 2, 10]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_min_max_at_beginning():
     """Min and max both at beginning"""
     arr = [1, 10, 5, 3, 7, 2]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_min_max_adjacent():
     """Min and max are next to each other"""
     arr = [5, 1, 10, 3, 7]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_alternating_high_low():
     """Alternating between high and low values"""
     arr = [1, 100, 2, 99, 3, 98, 4, 97]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_sawtooth_pattern():
     """Sawtooth ascending-descending pattern"""
     arr = [1, 2, 3, 2, 1, 2, 3, 4, 3, 2]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_mountain_pattern():
     """Mountain: low to high to low"""
     arr = [1, 2, 3, 4, 5, 4, 3, 2, 1]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_valley_pattern():
     """Valley: high to low to high"""
     arr = [5, 4, 3, 2, 1, 2, 3, 4, 5]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 # ============ SIZE TESTS ============
@@ -183,26 +190,26 @@ def test_valley_pattern():
 def test_small_array():
     arr = [3, 1, 4, 1, 5]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_medium_array():
     arr = list(range(100, 0, -1))
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_large_random():
     arr = [random.randint(-100000, 100000) for _ in range(5000)]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_very_large_array():
     """Test with 50,000 elements"""
     arr = [random.randint(-10000, 10000) for _ in range(50000)]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 # ============ PENDING PARAMETER TESTS ============
@@ -212,19 +219,19 @@ def test_pending_parameter_variations():
     arr = [15, 3, 8, 1, 12, 6, 20, 4, 18, 2, 14, 10]
     for p in [0.1, 0.2, 0.3, 0.4, 0.5, 0.55, 0.6, 0.7, 0.8, 0.9]:
         arr_copy = arr.copy()
-        bfc_sort(arr_copy, pending_item_percentage=p)
+        bfc_sort(arr_copy, pending_item_percentage=p, **LINKED_LISTS)
         assert arr_copy == sorted(arr), f"Failed with pending_item_percentage={p}"
 
 def test_pending_parameter_minimum():
     """Test with very small percentage"""
     arr = [5, 1, 4, 2, 3]
-    bfc_sort(arr, pending_item_percentage=0.01)
+    bfc_sort(arr, pending_item_percentage=0.01, **LINKED_LISTS)
     assert arr == [1, 2, 3, 4, 5]
 
 def test_pending_parameter_maximum():
     """Test with very large percentage"""
     arr = [5, 1, 4, 2, 3]
-    bfc_sort(arr, pending_item_percentage=0.99)
+    bfc_sort(arr, pending_item_percentage=0.99, **LINKED_LISTS)
     assert arr == [1, 2, 3, 4, 5]
 
 def test_pending_on_large_array():
@@ -232,7 +239,7 @@ def test_pending_on_large_array():
     for p in [0.3, 0.5, 0.7]:
         arr = [random.randint(0, 1000) for _ in range(1000)]
         expected = sorted(arr)
-        bfc_sort(arr, pending_item_percentage=p)
+        bfc_sort(arr, pending_item_percentage=p, **LINKED_LISTS)
         assert arr == expected
 
 # ============ RANDOM STRESS TESTS ============
@@ -242,14 +249,14 @@ def test_multiple_random_runs():
     for _ in range(50):
         arr = [random.randint(-1000, 1000) for _ in range(200)]
         expected = sorted(arr)
-        bfc_sort(arr)
+        bfc_sort(arr, **LINKED_LISTS)
         assert arr == expected
 
 def test_extreme_stress():
     """Stress test with 20,000 elements"""
     arr = [random.randint(-10**9, 10**9) for _ in range(20000)]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_random_lengths():
@@ -257,7 +264,7 @@ def test_random_lengths():
     for length in [5, 10, 50, 100, 500, 1000, 5000]:
         arr = [random.randint(-1000, 1000) for _ in range(length)]
         expected = sorted(arr)
-        bfc_sort(arr)
+        bfc_sort(arr, **LINKED_LISTS)
         assert arr == expected
 
 def test_worst_case_pending():
@@ -266,7 +273,7 @@ def test_worst_case_pending():
     arr = list(range(50, 150)) + [1] + [200]
     random.shuffle(arr)
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 # ============ SPECIAL VALUE TESTS ============
@@ -275,28 +282,28 @@ def test_large_numbers():
     """Test with very large integers"""
     arr = [10**15, 10**14, 10**16, 10**13]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_small_numbers():
     """Test with very small integers"""
     arr = [-10**15, -10**14, -10**16, -10**13]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_sparse_range():
     """Large gaps between numbers"""
     arr = [1, 1000, 2, 999, 3, 998]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_tight_range():
     """Small range with many duplicates"""
     arr = [random.randint(0, 5) for _ in range(100)]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 # ============ TUPLE/COMPARABLE TESTS ============
@@ -305,13 +312,13 @@ def test_tuple_sorting():
     """Test sorting tuples (by first element)"""
     arr = [(3, 'a'), (1, 'b'), (2, 'c')]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_tuple_with_duplicates():
     """Test tuples with duplicate first elements"""
     arr = [(3, 'a'), (3, 'b'), (1, 'c'), (2, 'd'), (3, 'e')]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     # Check first elements are sorted
     assert [x[0] for x in arr] == [1, 2, 3, 3, 3]
 
@@ -321,7 +328,7 @@ def test_output_length_unchanged():
     """Ensure output has same length as input"""
     arr = [random.randint(0, 100) for _ in range(100)]
     original_len = len(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert len(arr) == original_len
 
 def test_output_contains_same_elements():
@@ -329,16 +336,16 @@ def test_output_contains_same_elements():
     arr = [random.randint(0, 50) for _ in range(100)]
     from collections import Counter
     original_counts = Counter(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     sorted_counts = Counter(arr)
     assert original_counts == sorted_counts
 
 def test_idempotent():
     """Sorting twice gives same result"""
     arr = [random.randint(0, 100) for _ in range(50)]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     first_result = arr.copy()
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == first_result
 
 # ============ COMPARISON TESTS ============
@@ -348,7 +355,7 @@ def test_matches_builtin_sort():
     for _ in range(100):
         arr = [random.randint(-1000, 1000) for _ in range(random.randint(10, 200))]
         expected = sorted(arr)
-        bfc_sort(arr)
+        bfc_sort(arr, **LINKED_LISTS)
         assert arr == expected
 
 # ============ ERROR HANDLING TESTS ============
@@ -357,13 +364,13 @@ def test_non_comparable_raises_error():
     """Test that non-comparable types raise appropriate error"""
     arr = [1, "string", 3]
     with pytest.raises(TypeError):
-        bfc_sort(arr)
+        bfc_sort(arr, **LINKED_LISTS)
 
 def test_none_in_list():
     """Test behavior with None values"""
     arr = [3, None, 1, 2]
     with pytest.raises(TypeError):
-        bfc_sort(arr)
+        bfc_sort(arr, **LINKED_LISTS)
 
 # ============ PERFORMANCE MARKERS ============
 
@@ -372,7 +379,7 @@ def test_performance_50k():
     """Performance test with 50,000 elements (marked as slow)"""
     arr = [random.randint(-100000, 100000) for _ in range(50000)]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 @pytest.mark.slow
@@ -380,25 +387,25 @@ def test_performance_100k():
     """Performance test with 100,000 elements (marked as slow)"""
     arr = [random.randint(-100000, 100000) for _ in range(100000)]
     expected = sorted(arr)
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == expected
 
 def test_pending_percentage_default():
     """Test with default pending percentage (0.55)"""
     arr = [5, 2, 8, 1, 9, 3, 7, 4, 6]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1, 2, 3, 4, 5, 6, 7, 8, 9]
 
 def test_pending_percentage_low():
     """Test with low pending percentage (0.1)"""
     arr = [5, 2, 8, 1, 9, 3, 7, 4, 6]
-    bfc_sort(arr, pending_item_percentage=0.1)
+    bfc_sort(arr, pending_item_percentage=0.1, **LINKED_LISTS)
     assert arr == [1, 2, 3, 4, 5, 6, 7, 8, 9]
 
 def test_pending_percentage_high():
     """Test with high pending percentage (0.9)"""
     arr = [5, 2, 8, 1, 9, 3, 7, 4, 6]
-    bfc_sort(arr, pending_item_percentage=0.9)
+    bfc_sort(arr, pending_item_percentage=0.9, **LINKED_LISTS)
     assert arr == [1, 2, 3, 4, 5, 6, 7, 8, 9]
 
 def test_pending_percentage_variations():
@@ -406,38 +413,38 @@ def test_pending_percentage_variations():
     arr = [15, 3, 8, 1, 12, 6, 20, 4, 18, 2, 14, 10]
     for p in [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]:
         test_arr = arr.copy()
-        bfc_sort(test_arr, pending_item_percentage=p)
+        bfc_sort(test_arr, pending_item_percentage=p, **LINKED_LISTS)
         assert test_arr == sorted(arr), f"Failed with pending_item_percentage={p}"
 
 def test_pending_percentage_minimum():
     """Test with minimum valid percentage"""
     arr = [5, 2, 8, 1, 9]
-    bfc_sort(arr, pending_item_percentage=0.01)
+    bfc_sort(arr, pending_item_percentage=0.01, **LINKED_LISTS)
     assert arr == [1, 2, 5, 8, 9]
 
 def test_pending_percentage_maximum():
     """Test with maximum percentage (1.0)"""
     arr = [5, 2, 8, 1, 9]
-    bfc_sort(arr, pending_item_percentage=1.0)
+    bfc_sort(arr, pending_item_percentage=1.0, **LINKED_LISTS)
     assert arr == [1, 2, 5, 8, 9]
 
 def test_pending_percentage_invalid_zero():
     """Test that 0 percentage raises error"""
     arr = [5, 2, 8]
     with pytest.raises(ValueError, match="must be between 0 and 1"):
-        bfc_sort(arr, pending_item_percentage=0)
+        bfc_sort(arr, pending_item_percentage=0, **LINKED_LISTS)
 
 def test_pending_percentage_invalid_negative():
     """Test that negative percentage raises error"""
     arr = [5, 2, 8]
     with pytest.raises(ValueError, match="must be between 0 and 1"):
-        bfc_sort(arr, pending_item_percentage=-0.1)
+        bfc_sort(arr, pending_item_percentage=-0.1, **LINKED_LISTS)
 
 def test_pending_percentage_invalid_over_one():
     """Test that percentage > 1 raises error"""
     arr = [5, 2, 8]
     with pytest.raises(ValueError, match="must be between 0 and 1"):
-        bfc_sort(arr, pending_item_percentage=1.5)
+        bfc_sort(arr, pending_item_percentage=1.5, **LINKED_LISTS)
 
 def test_pending_percentage_large_array():
     """Test pending percentage on large array"""
@@ -445,7 +452,7 @@ def test_pending_percentage_large_array():
     expected = sorted(arr)
     for p in [0.2, 0.5, 0.8]:
         test_arr = arr.copy()
-        bfc_sort(test_arr, pending_item_percentage=p)
+        bfc_sort(test_arr, pending_item_percentage=p, **LINKED_LISTS)
         assert test_arr == expected
 
 # ============ INPLACE TESTS ============
@@ -453,20 +460,20 @@ def test_pending_percentage_large_array():
 def test_inplace_true():
     """Test inplace=True modifies original array"""
     arr = [5, 2, 8, 1, 9]
-    bfc_sort(arr, inplace=True)
+    bfc_sort(arr, inplace=True, **LINKED_LISTS)
     assert arr == [1, 2, 5, 8, 9] 
 
 def test_inplace_false():
     """Test inplace=False returns new array"""
     arr = [5, 2, 8, 1, 9]
-    result = bfc_sort(arr, inplace=False)
+    result = bfc_sort(arr, inplace=False, **LINKED_LISTS)
     assert arr == [5, 2, 8, 1, 9]  # Original unchanged
     assert result == [1, 2, 5, 8, 9]  # Returns sorted copy
 
 def test_inplace_default():
     """Test default inplace behavior (should be True)"""
     arr = [5, 2, 8, 1, 9]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1, 2, 5, 8, 9]  # Original modified by default
 
 def test_inplace_false_multiple_arrays():
@@ -474,8 +481,8 @@ def test_inplace_false_multiple_arrays():
     arr1 = [5, 2, 8]
     arr2 = [9, 1, 4]
     
-    result1 = bfc_sort(arr1, inplace=False)
-    result2 = bfc_sort(arr2, inplace=False)
+    result1 = bfc_sort(arr1, inplace=False, **LINKED_LISTS)
+    result2 = bfc_sort(arr2, inplace=False, **LINKED_LISTS)
     
     # Originals unchanged
     assert arr1 == [5, 2, 8]
@@ -488,33 +495,33 @@ def test_inplace_false_multiple_arrays():
 def test_inplace_false_returns_different_reference():
     """Test that inplace=False returns different array object"""
     arr = [5, 2, 8, 1, 9]
-    result = bfc_sort(arr, inplace=False)
+    result = bfc_sort(arr, inplace=False, **LINKED_LISTS)
     assert result is not arr  # Different object reference
 
 def test_inplace_with_reverse():
     """Test inplace with reverse parameter"""
     arr = [5, 2, 8, 1, 9]
-    bfc_sort(arr, inplace=True, reverse=True)
+    bfc_sort(arr, inplace=True, reverse=True, **LINKED_LISTS)
     assert arr == [9, 8, 5, 2, 1]
 
 def test_not_inplace_with_reverse():
     """Test inplace=False with reverse parameter"""
     arr = [5, 2, 8, 1, 9]
-    result = bfc_sort(arr, inplace=False, reverse=True)
+    result = bfc_sort(arr, inplace=False, reverse=True, **LINKED_LISTS)
     assert arr == [5, 2, 8, 1, 9]  # Original unchanged
     assert result == [9, 8, 5, 2, 1]
 
 def test_inplace_empty_array():
     """Test inplace with empty array"""
     arr = []
-    result = bfc_sort(arr, inplace=False)
+    result = bfc_sort(arr, inplace=False, **LINKED_LISTS)
     assert arr == []
     assert result == []
 
 def test_inplace_single_element():
     """Test inplace with single element"""
     arr = [5]
-    result = bfc_sort(arr, inplace=False)
+    result = bfc_sort(arr, inplace=False, **LINKED_LISTS)
     assert arr == [5]
     assert result == [5]
 
@@ -523,13 +530,13 @@ def test_inplace_single_element():
 def test_reverse_false_default():
     """Test default reverse=False behavior"""
     arr = [5, 2, 8, 1, 9]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1, 2, 5, 8, 9]
 
 def test_reverse_true():
     """Test reverse=True sorts in descending order"""
     arr = [5, 2, 8, 1, 9]
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == [9, 8, 5, 2, 1]
 
 def test_reverse_ascending_then_descending():
@@ -537,66 +544,66 @@ def test_reverse_ascending_then_descending():
     arr = [5, 2, 8, 1, 9]
     
     # Ascending
-    bfc_sort(arr, reverse=False)
+    bfc_sort(arr, reverse=False, **LINKED_LISTS)
     assert arr == [1, 2, 5, 8, 9]
     
     # Descending
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == [9, 8, 5, 2, 1]
 
 def test_reverse_with_duplicates():
     """Test reverse with duplicate values"""
     arr = [5, 2, 8, 2, 5, 1, 8]
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == [8, 8, 5, 5, 2, 2, 1]
 
 def test_reverse_with_negatives():
     """Test reverse with negative numbers"""
     arr = [-5, 2, -8, 1, -3]
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == [2, 1, -3, -5, -8]
 
 def test_reverse_already_sorted():
     """Test reverse on already sorted array"""
     arr = [1, 2, 3, 4, 5]
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == [5, 4, 3, 2, 1]
 
 def test_reverse_already_reverse_sorted():
     """Test reverse on already reverse sorted array"""
     arr = [5, 4, 3, 2, 1]
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == [5, 4, 3, 2, 1]
 
 def test_reverse_with_floats():
     """Test reverse with float values"""
     arr = [5.5, 2.2, 8.8, 1.1, 9.9]
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == [9.9, 8.8, 5.5, 2.2, 1.1]
 
 def test_reverse_large_array():
     """Test reverse on large array"""
     arr = [random.randint(0, 1000) for _ in range(1000)]
     expected = sorted(arr, reverse=True)
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == expected
 
 def test_reverse_empty_array():
     """Test reverse with empty array"""
     arr = []
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == []
 
 def test_reverse_single_element():
     """Test reverse with single element"""
     arr = [5]
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == [5]
 
 def test_reverse_two_elements():
     """Test reverse with two elements"""
     arr = [5, 2]
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == [5, 2]
 
 # ============ COMBINED PARAMETER TESTS ============
@@ -609,6 +616,7 @@ def test_all_parameters_combined():
         pending_item_percentage=0.4,
         inplace=False,
         reverse=True,
+        **LINKED_LISTS,
     )
     assert arr == [5, 2, 8, 1, 9, 3, 7, 4, 6]  # Original unchanged
     assert result == [9, 8, 7, 6, 5, 4, 3, 2, 1]
@@ -618,7 +626,7 @@ def test_pending_percentage_with_reverse():
     arr = [15, 3, 8, 1, 12, 6, 20, 4, 18, 2, 14, 10]
     for p in [0.2, 0.5, 0.8]:
         test_arr = arr.copy()
-        bfc_sort(test_arr, pending_item_percentage=p, reverse=True)
+        bfc_sort(test_arr, pending_item_percentage=p, reverse=True, **LINKED_LISTS)
         assert test_arr == sorted(arr, reverse=True)
 
 def test_all_parameters_large_array():
@@ -629,6 +637,7 @@ def test_all_parameters_large_array():
         pending_item_percentage=0.3,
         inplace=False,
         reverse=True,
+        **LINKED_LISTS,
     )
     assert arr != result  # Original unchanged
     assert result == sorted(arr, reverse=True)
@@ -645,7 +654,7 @@ def test_multiple_combinations():
     
     for params in combinations:
         test_arr = arr.copy()
-        result = bfc_sort(test_arr, **params)
+        result = bfc_sort(test_arr, **params, **LINKED_LISTS)
         
         # Check result is sorted correctly
         if params.get('reverse', False):
@@ -669,6 +678,7 @@ def test_parameters_with_empty_array():
         pending_item_percentage=0.5,
         inplace=False,
         reverse=True,
+        **LINKED_LISTS,
     )
     assert arr == []
     assert result == []
@@ -681,6 +691,7 @@ def test_parameters_with_single_element():
         pending_item_percentage=0.5,
         inplace=False,
         reverse=True,
+        **LINKED_LISTS,
     )
     assert arr == [5]
     assert result == [5]
@@ -688,7 +699,7 @@ def test_parameters_with_single_element():
 def test_parameters_with_all_duplicates():
     """Test parameters with all duplicate values"""
     arr = [5, 5, 5, 5, 5]
-    bfc_sort(arr, reverse=True, inplace=True)
+    bfc_sort(arr, reverse=True, inplace=True, **LINKED_LISTS)
     assert arr == [5, 5, 5, 5, 5]
 
 # ============ ARRAY VALIDATION TESTS ============
@@ -696,57 +707,119 @@ def test_parameters_with_all_duplicates():
 def test_array_not_list():
     """Array must be a list"""
     with pytest.raises(TypeError, match="array must be a list"):
-        bfc_sort((5, 2, 8))  # Tuple
+        bfc_sort((5, 2, 8), **LINKED_LISTS)  # Tuple
 
 def test_array_not_list_string():
     """String should raise TypeError"""
     with pytest.raises(TypeError, match="array must be a list"):
-        bfc_sort("hello")
+        bfc_sort("hello", **LINKED_LISTS)
 
 def test_array_valid_ints():
     """Valid integer array should work"""
     arr = [5, 2, 8, 1, 9]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1, 2, 5, 8, 9]
 
 def test_array_valid_floats():
     """Valid float array should work"""
     arr = [5.5, 2.2, 8.8, 1.1]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1.1, 2.2, 5.5, 8.8]
 
 def test_array_mixed_int_float():
     """Mixed int and float should work"""
     arr = [5, 2.5, 8, 1.5, 9]
-    bfc_sort(arr)
+    bfc_sort(arr, **LINKED_LISTS)
     assert arr == [1.5, 2.5, 5, 8, 9]
 
+# ============ OTHER SEQUENCE TESTS ============
+
+@pytest.mark.parametrize("make", [
+    lambda v: array.array('i', v),
+    lambda v: bytearray(v),
+    lambda v: collections.deque(v),
+    lambda v: memoryview(array.array('q', v)),
+    lambda v: memoryview(bytearray(v)),
+])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_sorts_mutable_sequence_in_place(make, reverse):
+    values = [random.randint(0, 255) for _ in range(2000)]
+    seq = make(values)
+    assert bfc_sort(seq, reverse=reverse) is None
+    assert list(seq) == sorted(values, reverse=reverse)
+
+def test_mutable_sequence_not_inplace_returns_list():
+    seq = array.array('d', [2.5, -1.0, 3.0])
+    assert bfc_sort(seq, inplace=False) == [-1.0, 2.5, 3.0]
+    assert seq.tolist() == [2.5, -1.0, 3.0]
+
+@pytest.mark.parametrize("make", [
+    lambda v: array.array('h', v),
+    lambda v: memoryview(array.array('q', v)),
+])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_int_buffer_counted_in_place(monkeypatch, make, reverse):
+    """Narrow int arrays are counted from their storage, not a list"""
+    def fail(*args):
+        raise AssertionError("a list of the items was sorted")
+    monkeypatch.setattr(sorter, "_bifurcated_sort", fail)
+    monkeypatch.setattr(sorter, "WRITE_BACK_CHUNK", 7)
+    values = [random.randint(-300, 300) for _ in range(5000)]
+    seq = make(values)
+    stats = SortStats()
+    bfc_sort(seq, reverse=reverse, stats=stats)
+    assert list(seq) == sorted(values, reverse=reverse)
+    assert stats.fast_path == 'counting' and stats.items == 5000
+    assert bfc_sort(make(values), inplace=False, reverse=reverse) == sorted(values, reverse=reverse)
+
+def test_write_back_in_chunks(monkeypatch):
+    monkeypatch.setattr(sorter, "WRITE_BACK_CHUNK", 7)
+    values = [random.random() for _ in range(1000)]
+    seq = array.array('d', values)
+    bfc_sort(seq)
+    assert seq.tolist() == sorted(values)
+
+def test_mutable_sequence_with_key():
+    seq = collections.deque([3, -5, 1, -2])
+    bfc_sort(seq, key=abs)
+    assert list(seq) == [1, -2, 3, -5]
+
+def test_read_only_buffer():
+    with pytest.raises(ValueError, match="read-only"):
+        bfc_sort(b"cab")
+    assert bfc_sort(b"cab", inplace=False) == [97, 98, 99]
+
+def test_multidimensional_buffer():
+    view = memoryview(bytearray(4)).cast('B', (2, 2))
+    with pytest.raises(TypeError, match="one-dimensional"):
+        bfc_sort(view)
+
 # ============ PENDING_ITEM_PERCENTAGE VALIDATION ============
 
 def test_pending_percentage_not_number():
     """pending_item_percentage must be a number"""
     with pytest.raises(TypeError, match="must be a number"):
-        bfc_sort([1, 2, 3], pending_item_percentage="0.5")
+        bfc_sort([1, 2, 3], pending_item_percentage="0.5", **LINKED_LISTS)
 
 def test_pending_percentage_zero():
     """pending_item_percentage cannot be 0"""
     with pytest.raises(ValueError, match="must be between 0 and 1"):
-        bfc_sort([1, 2, 3], pending_item_percentage=0)
+        bfc_sort([1, 2, 3], pending_item_percentage=0, **LINKED_LISTS)
 
 def test_pending_percentage_negative():
     """pending_item_percentage cannot be negative"""
     with pytest.raises(ValueError, match="must be between 0 and 1"):
-        bfc_sort([1, 2, 3], pending_item_percentage=-0.5)
+        bfc_sort([1, 2, 3], pending_item_percentage=-0.5, **LINKED_LISTS)
 
 def test_pending_percentage_over_one():
     """pending_item_percentage cannot exceed 1"""
     with pytest.raises(ValueError, match="must be between 0 and 1"):
-        bfc_sort([1, 2, 3], pending_item_percentage=1.5)
+        bfc_sort([1, 2, 3], pending_item_percentage=1.5, **LINKED_LISTS)
 
 def test_pending_percentage_valid():
     """Valid pending_item_percentage should work"""
     arr = [5, 2, 8, 1, 9]
-    bfc_sort(arr, pending_item_percentage=0.5)
+    bfc_sort(arr, pending_item_percentage=0.5, **LINKED_LISTS)
     assert arr == [1, 2, 5, 8, 9]
 
 # ============ INPLACE VALIDATION ============
@@ -754,28 +827,28 @@ def test_pending_percentage_valid():
 def test_inplace_not_bool():
     """inplace must be boolean"""
     with pytest.raises(TypeError, match="inplace must be a boolean"):
-        bfc_sort([1, 2, 3], inplace=1)
+        bfc_sort([1, 2, 3], inplace=1, **LINKED_LISTS)
 
 def test_inplace_string():
     """inplace cannot be string"""
     with pytest.raises(TypeError, match="inplace must be a boolean"):
-        bfc_sort([1, 2, 3], inplace="True")
+        bfc_sort([1, 2, 3], inplace="True", **LINKED_LISTS)
 
 def test_inplace_none():
     """inplace cannot be None"""
     with pytest.raises(TypeError, match="inplace must be a boolean"):
-        bfc_sort([1, 2, 3], inplace=None)
+        bfc_sort([1, 2, 3], inplace=None, **LINKED_LISTS)
 
 def test_inplace_valid_true():
     """Valid inplace=True should work"""
     arr = [5, 2, 8]
-    bfc_sort(arr, inplace=True)
+    bfc_sort(arr, inplace=True, **LINKED_LISTS)
     assert arr == [2, 5, 8]
 
 def test_inplace_valid_false():
     """Valid inplace=False should work"""
     arr = [5, 2, 8]
-    result = bfc_sort(arr, inplace=False)
+    result = bfc_sort(arr, inplace=False, **LINKED_LISTS)
     assert arr == [5, 2, 8]
     assert result == [2, 5, 8]
 
@@ -784,28 +857,28 @@ def test_inplace_valid_false():
 def test_reverse_not_bool():
     """reverse must be boolean"""
     with pytest.raises(TypeError, match="reverse must be a boolean"):
-        bfc_sort([1, 2, 3], reverse=1)
+        bfc_sort([1, 2, 3], reverse=1, **LINKED_LISTS)
 
 def test_reverse_string():
     """reverse cannot be string"""
     with pytest.raises(TypeError, match="reverse must be a boolean"):
-        bfc_sort([1, 2, 3], reverse="True")
+        bfc_sort([1, 2, 3], reverse="True", **LINKED_LISTS)
 
 def test_reverse_none():
     """reverse cannot be None"""
     with pytest.raises(TypeError, match="reverse must be a boolean"):
-        bfc_sort([1, 2, 3], reverse=None)
+        bfc_sort([1, 2, 3], reverse=None, **LINKED_LISTS)
 
 def test_reverse_valid_true():
     """Valid reverse=True should work"""
     arr = [5, 2, 8, 1]
-    bfc_sort(arr, reverse=True)
+    bfc_sort(arr, reverse=True, **LINKED_LISTS)
     assert arr == [8, 5, 2, 1]
 
 def test_reverse_valid_false():
     """Valid reverse=False should work"""
     arr = [5, 2, 8, 1]
-    bfc_sort(arr, reverse=False)
+    bfc_sort(arr, reverse=False, **LINKED_LISTS)
     assert arr == [1, 2, 5, 8]
 
 # ============ COMBINED VALIDATION ============
@@ -813,7 +886,7 @@ def test_reverse_valid_false():
 def test_multiple_invalid_parameters():
     """Multiple invalid parameters should raise first error"""
     with pytest.raises(TypeError):
-        bfc_sort("not a list", pending_item_percentage=5, inplace="yes")
+        bfc_sort("not a list", pending_item_percentage=5, inplace="yes", **LINKED_LISTS)
 
 def test_all_valid_parameters():
     """All valid parameters should work"""
@@ -823,6 +896,373 @@ def test_all_valid_parameters():
         pending_item_percentage=0.4,
         inplace=False,
         reverse=True,
+        **LINKED_LISTS,
     )
     assert arr == [5, 2, 8, 1, 9, 3, 7, 4, 6]  # Original unchanged
-    assert result == [9, 8, 7, 6, 5, 4, 3, 2, 1]
\ No newline at end of file
+    assert result == [9, 8, 7, 6, 5, 4, 3, 2, 1]
+
+# ============ TREE SELECTION TESTS ============
+
+@pytest.mark.parametrize("tree", ['bst', 'avl', 'rb', 'treap'])
+def test_tree_variants(tree):
+    arr = [random.randint(-1000, 1000) for _ in range(2000)]
+    expected = sorted(arr)
+    bfc_sort(arr, tree=tree, accelerate=False)
+    assert arr == expected
+
+def pending_batch(values, n):
+    """
+    Input whose items 2..n in ``values`` all go pending in that order. A
+    rising item above them after every 4 keeps the natural runs under
+    FAST_PATH_MIN_RUN long, so the run merge does not take over.
+    """
+    arr = [0, 2 * n + 10, n + 5, n + 6, 1]
+    for i, value in enumerate(values):
+        arr.append(value)
+        if i % 4 == 3:
+            arr.append(2 * n + 11 + i)
+    return arr
+
+@pytest.mark.parametrize("order", ['sorted', 'reversed'])
+@pytest.mark.parametrize("tree", ['bst', 'avl', 'rb', 'treap'])
+def test_tree_variants_sorted_pending_batch(tree, order):
+    """Pending items arriving in sorted order"""
+    n = 500
+    values = range(2, n + 1) if order == 'sorted' else range(n, 1, -1)
+    arr = pending_batch(values, n)
+    expected = sorted(arr)
+    stats = SortStats()
+    bfc_sort(arr, tree=tree, accelerate=False, stats=stats)
+    assert arr == expected
+    assert stats.fast_path is None and stats.pending_items > 0
+    assert stats.pending_items == n - 1
+
+def test_tree_invalid():
+    with pytest.raises(ValueError, match="tree must be one of"):
+        bfc_sort([3, 1, 2], tree='splay')
+
+# ============ ENGINE TESTS ============
+
+@pytest.mark.parametrize("engine", ['node', 'array', 'skip', 'rle'])
+def test_engine_variants(engine):
+    arr = [random.randint(-1000, 1000) for _ in range(3000)]
+    expected = sorted(arr)
+    bfc_sort(arr, engine=engine, accelerate=False)
+    assert arr == expected
+
+@pytest.mark.parametrize("engine", ['node', 'array', 'skip', 'rle'])
+def test_engine_variants_reverse(engine):
+    arr = [random.random() for _ in range(500)]
+    expected = sorted(arr, reverse=True)
+    bfc_sort(arr, engine=engine, reverse=True, accelerate=False)
+    assert arr == expected
+
+def test_engine_invalid():
+    with pytest.raises(ValueError, match="engine must be one of"):
+        bfc_sort([3, 1, 2], engine='numpy')
+
+# ============ PERSISTENT INDEX TESTS ============
+
+@pytest.mark.parametrize("engine", ['node', 'array', 'skip', 'rle'])
+@pytest.mark.parametrize("pending", [0.01, 0.55, 'auto'])
+def test_persistent_index(engine, pending):
+    arr = [random.randint(-1000, 1000) for _ in range(3000)]
+    expected = sorted(arr, reverse=True)
+    bfc_sort(arr, pending_item_percentage=pending, reverse=True, engine=engine,
+             persistent_index=True, accelerate=False)
+    assert arr == expected
+
+def test_persistent_index_shortens_walks():
+    from bifurcated_sort import SortStats
+    arr = [random.randint(0, 10**9) for _ in range(5000)]
+    per_batch, persistent = SortStats(), SortStats()
+    bfc_sort(list(arr), pending_item_percentage=0.01, stats=per_batch, accelerate=False)
+    bfc_sort(list(arr), pending_item_percentage=0.01, stats=persistent, persistent_index=True, accelerate=False)
+    # distinct values: each pending item steps over exactly its greater neighbour
+    assert persistent.nodes_walked == persistent.pending_items
+    assert per_batch.nodes_walked > 10 * persistent.nodes_walked
+
+def test_skip_engine_duplicates():
+    """Long runs of equal values are crossed through the express lanes"""
+    arr = [random.randint(0, 4) for _ in range(5000)]
+    expected = sorted(arr)
+    bfc_sort(arr, engine='skip', accelerate=False)
+    assert arr == expected
+
+def test_skip_engine_not_accelerated(monkeypatch):
+    with pytest.raises(ValueError, match="engine='skip'"):
+        bfc_sort([3, 1, 2], engine='skip', accelerate=True)
+    # the engine is rejected whether or not the compiled module was built
+    monkeypatch.setattr(sorter, "_speedups", None)
+    with pytest.raises(ValueError, match="engine='skip'"):
+        bfc_sort([3, 1, 2], engine='skip', accelerate=True)
+    arr = [random.randint(0, 100) for _ in range(500)]
+    bfc_sort(arr, engine='skip')
+    assert arr == sorted(arr)
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_rle_engine_keeps_every_item(reverse):
+    """Equal items share a node but each one is written back"""
+    values = [random.choice([1, 1.0, True, 2, 2.0, 0]) for _ in range(3000)]
+    arr = list(values)
+    node_stats, rle_stats = SortStats(), SortStats()
+    bfc_sort(list(values), reverse=reverse, stats=node_stats, accelerate=False)
+    bfc_sort(arr, engine='rle', reverse=reverse, stats=rle_stats)
+    assert arr == sorted(values, reverse=reverse)
+    assert sorted(map(repr, arr)) == sorted(map(repr, values))
+    # a walk steps over each distinct value once instead of every equal item
+    assert rle_stats.nodes_walked * 100 < node_stats.nodes_walked
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_rle_engine_runs_on_key(reverse):
+    """Records with equal keys share a node and keep their input order"""
+    records = [(random.randint(0, 9), i) for i in range(3000)]
+    expected = sorted(records, key=lambda r: r[0], reverse=reverse)
+    node_stats, rle_stats = SortStats(), SortStats()
+    bfc_sort(list(records), key=lambda r: r[0], reverse=reverse, stats=node_stats, accelerate=False)
+    bfc_sort(records, key=lambda r: r[0], engine='rle', reverse=reverse, stats=rle_stats)
+    assert records == expected
+    assert rle_stats.nodes_walked < node_stats.nodes_walked
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_rle_engine_key_with_runs(reverse):
+    """Pending items of the k-way split are sorted ascending whatever the direction"""
+    records = [(random.randint(0, 9), i) for i in range(3000)]
+    expected = sorted(records, key=lambda r: r[0], reverse=reverse)
+    bfc_sort(records, key=lambda r: r[0], engine='rle', reverse=reverse, runs=8)
+    assert records == expected
+
+def test_rle_engine_not_accelerated(monkeypatch):
+    with pytest.raises(ValueError, match="engine='rle'"):
+        bfc_sort([3, 1, 2], engine='rle', accelerate=True)
+    monkeypatch.setattr(sorter, "_speedups", None)
+    with pytest.raises(ValueError, match="engine='rle'"):
+        bfc_sort([3, 1, 2], engine='rle', accelerate=True)
+
+def test_persistent_index_invalid():
+    with pytest.raises(TypeError, match="persistent_index must be a boolean"):
+        bfc_sort([3, 1, 2], persistent_index='yes')
+
+# ============ KEY FUNCTION TESTS ============
+
+def test_key_function():
+    arr = ["ccc", "a", "bb"]
+    bfc_sort(arr, key=len)
+    assert arr == ["a", "bb", "ccc"]
+
+def test_key_is_stable():
+    records = [(random.randint(0, 20), i) for i in range(2000)]
+    expected = sorted(records, key=lambda r: r[0])
+    bfc_sort(records, key=lambda r: r[0])
+    assert records == expected
+
+def test_key_is_stable_reverse():
+    records = [(random.randint(0, 20), i) for i in range(2000)]
+    expected = sorted(records, key=lambda r: r[0], reverse=True)
+    bfc_sort(records, key=lambda r: r[0], reverse=True)
+    assert records == expected
+
+def test_key_called_once_per_item():
+    calls = []
+    def key(x):
+        calls.append(x)
+        return -x
+    arr = [random.randint(0, 100) for _ in range(300)]
+    bfc_sort(arr, key=key)
+    assert len(calls) == 300
+    assert arr == sorted(arr, reverse=True)
+
+def test_key_items_never_compared():
+    """Records without an ordering can be sorted by key"""
+    class Record:
+        def __init__(self, value):
+            self.value = value
+    records = [Record(v) for v in [3, 1, 2, 1]]
+    result = bfc_sort(records, key=lambda r: r.value, inplace=False)
+    assert [r.value for r in result] == [1, 1, 2, 3]
+    assert result[0] is records[1]
+
+@pytest.mark.parametrize("engine", ['node', 'array', 'skip', 'rle'])
+def test_key_with_engines(engine):
+    arr = [random.random() for _ in range(1000)]
+    expected = sorted(arr, key=abs)
+    bfc_sort(arr, key=abs, engine=engine, accelerate=False)
+    assert arr == expected
+
+def test_key_not_callable():
+    with pytest.raises(TypeError, match="key must be callable"):
+        bfc_sort([3, 1, 2], key="len")
+
+# ============ AUTO PENDING PERCENTAGE TESTS ============
+
+@pytest.mark.parametrize("arr", [
+    [random.randint(-1000, 1000) for _ in range(3000)],
+    [random.randint(0, 5) for _ in range(3000)],
+    list(range(3000)),
+    list(range(3000, 0, -1)),
+    [i % 100 for i in range(3000)],
+    sorted(random.random() for _ in range(2500)) + [random.random() for _ in range(500)],
+])
+def test_pending_percentage_auto(arr):
+    expected = sorted(arr)
+    bfc_sort(arr, pending_item_percentage='auto')
+    assert arr == expected
+
+@pytest.mark.parametrize("accelerate", [False, None])
+def test_pending_percentage_auto_thresholds(accelerate):
+    """Duplicates flush in small batches, local disorder once at the end"""
+    n = 5000
+    inputs = {
+        0.1: [random.randint(0, 10) for _ in range(n)],
+        0.55: [random.random() for _ in range(n)],
+        1.0: [i + random.uniform(-20, 20) for i in range(n)],
+    }
+    flushes = set()
+    for threshold, arr in inputs.items():
+        auto, fixed = SortStats(), SortStats()
+        bfc_sort(list(arr), pending_item_percentage='auto', stats=auto, accelerate=accelerate)
+        bfc_sort(arr, pending_item_percentage=threshold, stats=fixed, accelerate=accelerate)
+        assert arr == sorted(arr)
+        assert auto.pending_flushes == fixed.pending_flushes
+        assert auto.nodes_walked == fixed.nodes_walked
+        flushes.add(auto.pending_flushes)
+    assert len(flushes) == 3
+
+def test_pending_percentage_auto_with_key_and_reverse():
+    arr = [(random.randint(0, 10), i) for i in range(1000)]
+    expected = sorted(arr, key=lambda r: r[0], reverse=True)
+    bfc_sort(arr, pending_item_percentage='auto', key=lambda r: r[0], reverse=True)
+    assert arr == expected
+
+def test_pending_percentage_unknown_string():
+    with pytest.raises(TypeError, match="must be a number or 'auto'"):
+        bfc_sort([1, 2, 3], pending_item_percentage='fast')
+
+# ============ PRESORTED FAST PATH TESTS ============
+
+def organ_pipe(n):
+    return list(range(n // 2)) + list(range(n // 2, 0, -1))
+
+def k_runs(n, k):
+    arr = [random.randint(0, 1000) for _ in range(n)]
+    size = n // k
+    return [x for start in range(0, n, size) for x in sorted(arr[start:start + size])]
+
+PRESORTED_INPUTS = [
+    list(range(1000)),
+    list(range(1000, 0, -1)),
+    [1, 1, 2, 2, 3, 3],
+    [3, 3, 2, 2, 1, 1],
+    organ_pipe(1000),
+    k_runs(1000, 3),
+    k_runs(1000, 50),
+    [i % 100 for i in range(1000)],
+]
+
+@pytest.mark.parametrize("arr", PRESORTED_INPUTS)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_presorted_inputs(arr, reverse):
+    arr = arr.copy()
+    expected = sorted(arr, reverse=reverse)
+    bfc_sort(arr, reverse=reverse)
+    assert arr == expected
+
+@pytest.mark.parametrize("arr", [arr for arr in PRESORTED_INPUTS if len(arr) > 100])
+def test_presorted_skips_linked_lists(arr, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("linked list built for presorted input")
+    monkeypatch.setattr(sorter, "LinkedList", fail)
+    arr = arr.copy()
+    expected = sorted(arr)
+    bfc_sort(arr)
+    assert arr == expected
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_presorted_key_stable(reverse):
+    """Descending runs with equal keys keep input order"""
+    records = [(k, i) for i, k in enumerate([5, 5, 4, 4, 3, 3, 3, 2, 1, 1] * 20)]
+    expected = sorted(records, key=lambda r: r[0], reverse=reverse)
+    bfc_sort(records, key=lambda r: r[0], reverse=reverse)
+    assert records == expected
+
+# ============ ARGSORT TESTS ============
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_argsort_matches_stable_sorted(reverse):
+    values = [random.randint(0, 30) for _ in range(2000)]
+    expected = sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+    assert bfc_argsort(values, reverse=reverse) == expected
+    assert values != sorted(values)
+
+def test_argsort_key_and_options():
+    values = [random.randint(-50, 50) for _ in range(1000)]
+    expected = sorted(range(len(values)), key=lambda i: abs(values[i]))
+    assert bfc_argsort(values, key=abs, engine='array', accelerate=False) == expected
+
+def test_argsort_other_sequences():
+    assert bfc_argsort((3, 1, 2)) == [1, 2, 0]
+    assert bfc_argsort(array.array('d', [0.5, -1.0])) == [1, 0]
+    assert bfc_argsort(b"cab") == [1, 2, 0]
+    assert bfc_argsort([]) == []
+
+def test_argsort_outputs():
+    values = [5, 3, 9, 1]
+    result = bfc_argsort(values, output='array')
+    assert result.typecode == 'q' and result.tolist() == [3, 1, 0, 2]
+    np = pytest.importorskip("numpy")
+    result = bfc_argsort(values, output='numpy')
+    assert result.dtype == np.intp
+    assert result.tolist() == np.argsort(values, kind='stable').tolist()
+
+def test_argsort_invalid():
+    with pytest.raises(TypeError, match="array must be a list or another sequence"):
+        bfc_argsort("abc")
+    with pytest.raises(ValueError, match="output must be one of"):
+        bfc_argsort([1, 2], output='tuple')
+    with pytest.raises(TypeError, match="reverse must be a boolean"):
+        bfc_argsort([1, 2], reverse=None)
+    with pytest.raises(TypeError, match="key must be callable"):
+        bfc_argsort([1, 2], key=1)
+    with pytest.raises(TypeError, match="inplace"):
+        bfc_argsort([3, 1, 2], inplace=False)
+
+# ============ K-WAY RUNS TESTS ============
+
+@pytest.mark.parametrize("runs", [3, 4, 16, 100])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_runs_matches_sorted(runs, reverse):
+    for values in (
+        [random.randint(0, 10**6) for _ in range(3000)],
+        [random.randint(0, 10) for _ in range(3000)],
+        [(i * 37) % 101 for i in range(2000)],
+    ):
+        arr = list(values)
+        bfc_sort(arr, runs=runs, reverse=reverse, accelerate=False)
+        assert arr == sorted(values, reverse=reverse)
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_runs_key_is_stable(reverse):
+    records = [(random.randint(0, 9), i) for i in range(3000)]
+    expected = sorted(records, key=lambda r: r[0], reverse=reverse)
+    bfc_sort(records, key=lambda r: r[0], reverse=reverse, runs=8)
+    assert records == expected
+
+def test_runs_absorb_interleaved_input():
+    """16 interleaved sorted shards fit 16 ascending runs with nothing pending"""
+    shards = [sorted(random.sample(range(10**6), 500)) for _ in range(16)]
+    arr = [x for group in zip(*shards) for x in group]
+    classic, kway = SortStats(), SortStats()
+    bfc_sort(list(arr), stats=classic, counting_threshold=0, radix_max_bits=0)
+    bfc_sort(arr, runs=32, stats=kway)
+    assert arr == sorted(arr)
+    assert classic.pending_items > len(arr) // 2
+    assert kway.pending_items == 0
+    assert kway.asc_appends + kway.dsc_appends == len(arr)
+
+def test_runs_invalid():
+    with pytest.raises(TypeError, match="runs must be an integer"):
+        bfc_sort([3, 1, 2], runs=2.0)
+    with pytest.raises(TypeError, match="runs must be an integer"):
+        bfc_sort([3, 1, 2], runs=True)
+    with pytest.raises(ValueError, match="runs must be at least 2"):
+        bfc_sort([3, 1, 2], runs=1)
@@ -0,0 +1,152 @@
+import random
+import pytest
+from bifurcated_sort.bst import BST, AVLTree, OrderStatisticTree, RedBlackTree, Treap, TREE_TYPES
+
+TREES = [BST, AVLTree, RedBlackTree, Treap]
+
+def depth(node):
+    if node is None:
+        return 0
+    return 1 + max(depth(node.left), depth(node.right))
+
+def in_order(node):
+    if node is None:
+        return []
+    return in_order(node.left) + [node.value] + in_order(node.right)
+
+def brute_smaller(values, value):
+    smaller = [v for v in values if v < value]
+    return max(smaller) if smaller else None
+
+def brute_greater(values, value):
+    greater = [v for v in values if v > value]
+    return min(greater) if greater else None
+
+# ============ NEAREST LOOKUP TESTS ============
+
+@pytest.mark.parametrize("tree_class", TREES)
+def test_empty_tree(tree_class):
+    tree = tree_class()
+    assert tree.find_nearest(5, find_smaller=True) is None
+    assert tree.find_nearest(5, find_smaller=False) is None
+
+@pytest.mark.parametrize("tree_class", TREES)
+def test_find_nearest_matches_brute_force(tree_class):
+    values = [random.randint(0, 200) for _ in range(300)]
+    tree = tree_class()
+    for v in values:
+        tree.insert(v, v)
+    for probe in range(-5, 210):
+        assert tree.find_nearest_smaller(probe) == brute_smaller(values, probe)
+        assert tree.find_nearest_greater(probe) == brute_greater(values, probe)
+
+@pytest.mark.parametrize("tree_class", TREES)
+def test_in_order_is_sorted(tree_class):
+    values = [random.randint(-50, 50) for _ in range(500)]
+    tree = tree_class()
+    for v in values:
+        tree.insert(v)
+    assert in_order(tree.root) == sorted(values)
+
+# ============ BALANCE TESTS ============
+
+@pytest.mark.parametrize("tree_class", [AVLTree, RedBlackTree, Treap])
+@pytest.mark.parametrize("values", [range(2000), range(2000, 0, -1)])
+def test_sorted_inserts_stay_shallow(tree_class, values):
+    """Sorted insert order must not degrade into a chain"""
+    tree = tree_class()
+    for v in values:
+        tree.insert(v)
+    assert depth(tree.root) < 60
+
+def test_plain_bst_degrades_on_sorted_inserts():
+    tree = BST()
+    for v in range(200):
+        tree.insert(v)
+    assert depth(tree.root) == 200
+
+def test_avl_height_bound():
+    tree = AVLTree()
+    for v in range(1023):
+        tree.insert(v)
+    assert depth(tree.root) <= 11
+
+def test_red_black_invariants():
+    tree = RedBlackTree()
+    for v in random.sample(range(1000), 1000):
+        tree.insert(v)
+
+    def black_height(node):
+        if node is None:
+            return 1
+        if node.red:
+            assert not (node.left and node.left.red)
+            assert not (node.right and node.right.red)
+        left = black_height(node.left)
+        assert left == black_height(node.right)
+        return left + (0 if node.red else 1)
+
+    assert not tree.root.red
+    black_height(tree.root)
+
+@pytest.mark.parametrize("tree_class", TREES)
+@pytest.mark.parametrize("values", [range(300), random.sample(range(300), 300)])
+def test_max_insert_depth(tree_class, values):
+    """Tracked during inserts: exact for bst and avl, the search depth otherwise"""
+    tree = tree_class()
+    assert tree.max_insert_depth() == 0
+    for v in values:
+        tree.insert(v)
+    if tree_class in (BST, AVLTree):
+        assert tree.max_insert_depth() == depth(tree.root)
+    else:
+        assert 1 <= tree.max_insert_depth() < 60
+
+def test_tree_types_registry():
+    assert set(TREE_TYPES) == {'bst', 'avl', 'rb', 'treap'}
+
+# ============ ORDER STATISTIC TESTS ============
+
+def check_order_statistics(node):
+    """Heights, balance and subtree sizes are consistent; returns (height, size)"""
+    if node is None:
+        return 0, 0
+    left_height, left_size = check_order_statistics(node.left)
+    right_height, right_size = check_order_statistics(node.right)
+    assert abs(left_height - right_height) <= 1
+    assert node.height == max(left_height, right_height) + 1
+    assert node.size == left_size + right_size + 1
+    return node.height, node.size
+
+def test_order_statistic_rank_queries():
+    values = [random.randint(0, 100) for _ in range(1000)]
+    tree = OrderStatisticTree()
+    for v in values:
+        tree.insert(v)
+    check_order_statistics(tree.root)
+    ordered = sorted(values)
+    assert len(tree) == 1000
+    assert [tree.select(i).value for i in range(1000)] == ordered
+    for v in range(-1, 102):
+        assert tree.bisect_left(v) == sum(x < v for x in values)
+        assert tree.bisect_right(v) == sum(x <= v for x in values)
+
+def test_order_statistic_delete_at():
+    values = list(range(500))
+    tree = OrderStatisticTree.from_sorted([(v, str(v)) for v in values])
+    check_order_statistics(tree.root)
+    while values:
+        i = random.randrange(len(values))
+        assert tree.delete_at(i) == (values[i], str(values[i]))
+        del values[i]
+        check_order_statistics(tree.root)
+        assert in_order(tree.root) == values
+    assert len(tree) == 0 and tree.root is None
+
+def test_order_statistic_keeps_equal_values_in_insert_order():
+    tree = OrderStatisticTree()
+    for i in range(200):
+        tree.insert(i % 3, i)
+    tree.delete_at(0)
+    expected = [i for i in range(200) if i % 3 == 0][1:]
+    assert [tree.select(i).reference for i in range(len(expected))] == expected
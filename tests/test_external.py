@@ -0,0 +1,94 @@
+import random
+from array import array
+import pytest
+from bifurcated_sort import bfc_sort_file, sorter
+from bifurcated_sort.external import BYTES_PER_SORTED_ITEM
+
+def write_values(path, typecode, values):
+    with open(path, 'wb') as f:
+        array(typecode, values).tofile(f)
+
+def read_values(path, typecode):
+    result = array(typecode)
+    with open(path, 'rb') as f:
+        result.frombytes(f.read())
+    return result.tolist()
+
+# ============ EXTERNAL SORT TESTS ============
+
+def test_single_run(tmp_path):
+    values = [random.randint(-10**12, 10**12) for _ in range(1000)]
+    source = tmp_path / "in.bin"
+    write_values(source, 'q', values)
+    runs = bfc_sort_file(source, tmp_path / "out.bin")
+    assert runs == 1
+    assert read_values(tmp_path / "out.bin", 'q') == sorted(values)
+    assert read_values(source, 'q') == values
+
+def test_many_runs(tmp_path):
+    values = [random.randint(0, 10**6) for _ in range(5000)]
+    source = tmp_path / "in.bin"
+    write_values(source, 'q', values)
+    runs = bfc_sort_file(source, tmp_path / "out.bin", memory_limit=300 * BYTES_PER_SORTED_ITEM, tmp_dir=tmp_path)
+    assert runs == 17
+    assert read_values(tmp_path / "out.bin", 'q') == sorted(values)
+    assert list(tmp_path.glob("bfc_*")) == []
+
+def test_in_place_reverse_floats(tmp_path):
+    values = [random.random() for _ in range(2000)]
+    source = tmp_path / "in.bin"
+    write_values(source, 'd', values)
+    bfc_sort_file(source, typecode='d', memory_limit=500 * BYTES_PER_SORTED_ITEM, reverse=True)
+    assert read_values(source, 'd') == sorted(values, reverse=True)
+
+def test_chunk_boundary(tmp_path):
+    """Input length that is an exact multiple of the chunk size"""
+    values = list(range(1000, 0, -1))
+    source = tmp_path / "in.bin"
+    write_values(source, 'i', values)
+    runs = bfc_sort_file(source, typecode='i', memory_limit=250 * BYTES_PER_SORTED_ITEM)
+    assert runs == 4
+    assert read_values(source, 'i') == sorted(values)
+
+def test_chunks_take_integer_sort(tmp_path, monkeypatch):
+    """Int chunks get the counting and radix sort fallbacks of a plain bfc_sort"""
+    methods = []
+    integer_sort = sorter._integer_sort
+    def spy(*args):
+        methods.append(integer_sort(*args))
+        return methods[-1]
+    monkeypatch.setattr(sorter, "_integer_sort", spy)
+    values = [random.randint(0, 10**4) for _ in range(20000)]
+    source = tmp_path / "in.bin"
+    write_values(source, 'q', values)
+    runs = bfc_sort_file(source, memory_limit=5000 * BYTES_PER_SORTED_ITEM)
+    assert runs == 4
+    assert methods == ['radix'] * 4
+    assert read_values(source, 'q') == sorted(values)
+
+def test_empty_file(tmp_path):
+    source = tmp_path / "in.bin"
+    source.write_bytes(b"")
+    assert bfc_sort_file(source, tmp_path / "out.bin") == 0
+    assert (tmp_path / "out.bin").read_bytes() == b""
+
+# ============ VALIDATION TESTS ============
+
+@pytest.mark.parametrize("typecode", ['u', '', 'bB', 'qd'])
+def test_invalid_typecode(tmp_path, typecode):
+    with pytest.raises(ValueError, match="typecode must be one of"):
+        bfc_sort_file(tmp_path / "in.bin", typecode=typecode)
+
+def test_memory_limit_too_small(tmp_path):
+    with pytest.raises(ValueError, match="memory_limit must be at least"):
+        bfc_sort_file(tmp_path / "in.bin", memory_limit=10)
+
+def test_memory_limit_not_int(tmp_path):
+    with pytest.raises(TypeError, match="memory_limit must be an integer"):
+        bfc_sort_file(tmp_path / "in.bin", memory_limit=1e9)
+
+def test_truncated_file(tmp_path):
+    source = tmp_path / "in.bin"
+    source.write_bytes(b"\x00" * 12)
+    with pytest.raises(ValueError, match="not a multiple"):
+        bfc_sort_file(source)
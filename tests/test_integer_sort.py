@@ -0,0 +1,172 @@
+import random
+import pytest
+from bifurcated_sort import bfc_sort, SortStats
+from bifurcated_sort import sorter
+
+# ============ COUNTING SORT TESTS ============
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_counting_sort_narrow_range(reverse):
+    arr = [random.randint(-50, 50) for _ in range(5000)]
+    expected = sorted(arr, reverse=reverse)
+    stats = SortStats()
+    bfc_sort(arr, reverse=reverse, stats=stats)
+    assert arr == expected
+    assert stats.fast_path == 'counting'
+    assert stats.pending_items == stats.asc_appends == stats.dsc_appends == 0
+
+def test_counting_sort_threshold_boundary():
+    """max - min + 1 up to COUNTING_SORT_THRESHOLD * n is counting sorted"""
+    n = 4096
+    span = int(sorter.COUNTING_SORT_THRESHOLD * n)
+    inside = [random.randrange(span) for _ in range(n - 2)] + [0, span - 1]
+    outside = [random.randrange(span) for _ in range(n - 2)] + [0, span]
+    for arr, fast_path in ((inside, 'counting'), (outside, 'radix')):
+        expected = sorted(arr)
+        stats = SortStats()
+        bfc_sort(arr, stats=stats)
+        assert arr == expected
+        assert stats.fast_path == fast_path
+
+def test_counting_threshold():
+    arr = [random.randint(0, 10**4) for _ in range(1000)]
+    expected = sorted(arr)
+    stats = SortStats()
+    bfc_sort(arr, counting_threshold=20, stats=stats)
+    assert arr == expected
+    assert stats.fast_path == 'counting'
+
+def test_counting_threshold_constant(monkeypatch):
+    monkeypatch.setattr(sorter, "COUNTING_SORT_THRESHOLD", 0)
+    stats = SortStats()
+    bfc_sort([random.randint(0, 9) for _ in range(4000)], stats=stats)
+    assert stats.fast_path == 'radix'
+
+# ============ RADIX SORT TESTS ============
+
+@pytest.mark.parametrize("bits", [8, 12, 17, 24, 32])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_radix_sort(bits, reverse):
+    arr = [random.randint(-2**(bits - 1), 2**(bits - 1) - 1) for _ in range(200)]
+    expected = sorted(arr, reverse=reverse)
+    stats = SortStats()
+    bfc_sort(arr, reverse=reverse, stats=stats, counting_threshold=0, radix_max_bits=bits)
+    assert arr == expected
+    assert stats.fast_path == 'radix'
+
+def test_radix_sort_64_bit_pure_python():
+    arr = [random.randint(-2**63, 2**63 - 1) for _ in range(2000)]
+    expected = sorted(arr)
+    stats = SortStats()
+    bfc_sort(arr, accelerate=False, stats=stats)
+    assert arr == expected
+    assert stats.fast_path == 'radix'
+
+def test_radix_max_bits():
+    arr = [random.randint(0, 2**40) for _ in range(1000)]
+    expected = sorted(arr)
+    narrow, wide = SortStats(), SortStats()
+    bfc_sort(list(arr), radix_max_bits=32, stats=narrow)
+    bfc_sort(arr, radix_max_bits=48, stats=wide)
+    assert arr == expected
+    assert narrow.fast_path is None
+    assert wide.fast_path == 'radix'
+
+def test_wider_than_radix_max_bits():
+    arr = [random.randint(0, 2**70) for _ in range(1000)]
+    expected = sorted(arr)
+    stats = SortStats()
+    bfc_sort(arr, accelerate=False, stats=stats)
+    assert arr == expected
+    assert stats.fast_path is None
+
+# ============ FALLBACK SELECTION TESTS ============
+
+@pytest.mark.skipif(sorter._speedups is None, reason="compiled module not built")
+def test_accelerated_defaults():
+    """Short lists and wide ranges keep the compiled linked lists"""
+    cases = [
+        ([random.randint(0, 9) for _ in range(1000)], None),
+        ([random.randint(0, 9) for _ in range(4096)], 'counting'),
+        ([random.getrandbits(16) for _ in range(4096)], 'radix'),
+        ([random.getrandbits(24) for _ in range(4096)], None),
+    ]
+    for arr, fast_path in cases:
+        stats = SortStats()
+        bfc_sort(arr, stats=stats)
+        assert arr == sorted(arr)
+        assert stats.fast_path == fast_path
+
+def test_pure_python_defaults():
+    """Radix sort takes up to RADIX_MAX_BITS_PER_LOG2_N bits per bit of log2(n)"""
+    cases = [
+        ([random.getrandbits(24) for _ in range(1000)], 'radix'),
+        ([random.getrandbits(40) for _ in range(16)], None),
+    ]
+    for arr, fast_path in cases:
+        stats = SortStats()
+        bfc_sort(arr, accelerate=False, stats=stats)
+        assert arr == sorted(arr)
+        assert stats.fast_path == fast_path
+
+@pytest.mark.parametrize("kwargs", [
+    dict(engine='rle'), dict(engine='array'), dict(tree='avl'), dict(persistent_index=True),
+    dict(pending_item_percentage=0.1), dict(pending_item_percentage='auto'), dict(runs=4),
+])
+def test_list_options_keep_linked_lists(kwargs):
+    arr = [random.randint(0, 9) for _ in range(5000)]
+    stats = SortStats()
+    bfc_sort(arr, stats=stats, **kwargs)
+    assert arr == sorted(arr)
+    assert stats.fast_path is None
+    stats = SortStats()
+    bfc_sort([random.randint(0, 9) for _ in range(5000)], stats=stats, counting_threshold=1, **kwargs)
+    assert stats.fast_path == 'counting'
+
+def test_both_disabled():
+    arr = [random.randint(0, 9) for _ in range(1000)]
+    expected = sorted(arr)
+    stats = SortStats()
+    bfc_sort(arr, counting_threshold=0, radix_max_bits=0, stats=stats)
+    assert arr == expected
+    assert stats.fast_path is None
+
+@pytest.mark.parametrize("arr", [
+    [random.choice([True, False]) for _ in range(500)],
+    [random.randint(0, 9) for _ in range(500)] + [2.5],
+    [random.randint(0, 9) for _ in range(500)] + [True],
+    [1.0] + [random.randint(0, 9) for _ in range(500)],
+])
+def test_only_plain_ints(arr):
+    """bools or floats mixed in keep the comparison sort and the item types"""
+    expected = sorted(arr)
+    stats = SortStats()
+    bfc_sort(arr, stats=stats)
+    assert arr == expected
+    assert sorted(type(x).__name__ for x in arr) == sorted(type(x).__name__ for x in expected)
+    assert stats.fast_path is None
+
+def test_presorted_fast_paths_first():
+    stats = SortStats()
+    bfc_sort(list(range(1000)), stats=stats)
+    assert stats.fast_path == 'sorted'
+
+def test_key_uses_comparison_sort():
+    arr = [random.randint(0, 9) for _ in range(500)]
+    expected = sorted(arr, key=lambda x: -x)
+    stats = SortStats()
+    bfc_sort(arr, key=lambda x: -x, stats=stats)
+    assert arr == expected
+    assert stats.fast_path is None
+
+def test_integer_sort_invalid():
+    with pytest.raises(TypeError, match="counting_threshold must be a number"):
+        bfc_sort([3, 1, 2], counting_threshold='1')
+    with pytest.raises(TypeError, match="counting_threshold must be a number"):
+        bfc_sort([3, 1, 2], counting_threshold=True)
+    with pytest.raises(ValueError, match="counting_threshold must be at least 0"):
+        bfc_sort([3, 1, 2], counting_threshold=-1)
+    with pytest.raises(TypeError, match="radix_max_bits must be an integer"):
+        bfc_sort([3, 1, 2], radix_max_bits=32.0)
+    with pytest.raises(ValueError, match="radix_max_bits must be at least 0"):
+        bfc_sort([3, 1, 2], radix_max_bits=-1)
@@ -0,0 +1,140 @@
+import random
+import pytest
+from bifurcated_sort.linkedlist import LinkedList, ArrayLinkedList, RunLengthLinkedList, SkipLinkedList
+from bifurcated_sort.node import NodeArrays
+
+def test_array_linked_list_append_and_iterate():
+    ll = ArrayLinkedList(1)
+    for v in (2, 3, 4):
+        ll.append(v)
+    assert len(ll) == 4
+    assert list(ll) == [1, 2, 3, 4]
+    assert list(reversed(ll)) == [4, 3, 2, 1]
+    assert ll.last() == 4
+
+def test_array_linked_list_desc_order():
+    ll = ArrayLinkedList(10, 'DESC')
+    for v in (8, 5):
+        ll.append(v)
+    assert list(ll) == [5, 8, 10]
+
+def test_array_linked_list_insert_matches_object_list():
+    head = -1
+    tail = 1000
+    pending = [random.randint(0, 999) for _ in range(300)]
+    expected = LinkedList(head)
+    actual = ArrayLinkedList(head)
+    expected.append(tail)
+    actual.append(tail)
+    expected.insert(pending)
+    actual.insert(pending)
+    assert list(actual) == list(expected) == sorted(pending + [head, tail])
+
+def test_shared_pool_grows():
+    pool = NodeArrays(2)
+    asc = ArrayLinkedList(0, pool=pool)
+    dsc = ArrayLinkedList(100, 'DESC', pool=pool)
+    for i in range(1, 50):
+        asc.append(i)
+        dsc.append(100 - i)
+    assert len(pool) == 100
+    assert list(asc) == list(range(50))
+    assert list(dsc) == list(range(51, 101))
+
+def test_insert_before_head():
+    """Pending items smaller than an unseeded head are prepended"""
+    for list_class in (LinkedList, ArrayLinkedList, SkipLinkedList, RunLengthLinkedList):
+        ll = list_class(5)
+        ll.append(10)
+        ll.insert([7, 2, 3, 9, 1])
+        assert list(ll) == [1, 2, 3, 5, 7, 9, 10]
+        assert ll.first() == 1
+        assert len(ll) == 7
+
+def test_persistent_index_covers_every_node():
+    for list_class in (LinkedList, ArrayLinkedList, SkipLinkedList, RunLengthLinkedList):
+        ll = list_class(0, persistent_index=True)
+        for v in range(10, 200, 10):
+            ll.append(v)
+        ll.insert([15, 95, 5])
+        ll.insert([185, 96, 1])
+        assert list(ll) == sorted([0, 1, 5, 15, 95, 96, 185] + list(range(10, 200, 10)))
+        # every value finds its neighbour without walking past other values
+        assert ll.walked == 6
+        assert ll.index.find_nearest(96, find_smaller=False) is not None
+
+def test_persistent_index_desc_and_prepend():
+    for list_class in (LinkedList, ArrayLinkedList, SkipLinkedList, RunLengthLinkedList):
+        ll = list_class(50, 'DESC', persistent_index=True)
+        for v in (40, 30, 20):
+            ll.append(v)
+        ll.insert([35, 60, 25, 55])
+        assert list(ll) == [20, 25, 30, 35, 40, 50, 55, 60]
+        assert ll.insert([45]) is ll.index
+
+def check_lanes(ll):
+    """Every lane links its nodes in order with widths matching their ranks"""
+    ranks = {id(ll.lanes_head): -1}
+    node = ll.head
+    while node:
+        ranks[id(node)] = len(ranks) - 1
+        node = node.next
+    assert len(ranks) - 1 == len(ll)
+    for i, lane_tail in enumerate(ll.lane_tails):
+        prev, node = ll.lanes_head, ll.lanes_head.lane_next[i]
+        while node is not None:
+            assert node.lane_prev[i] is prev
+            assert node.lane_width[i] == ranks[id(node)] - ranks[id(prev)]
+            prev, node = node, node.lane_next[i]
+        assert lane_tail is prev
+        assert ll.lane_tail_ranks[i] == ranks[id(prev)]
+
+@pytest.mark.parametrize("order", ['ASC', 'DESC'])
+def test_skip_linked_list_matches_linked_list(order):
+    for _ in range(20):
+        first, tail = (0, 10**4) if order == 'ASC' else (10**4, 0)
+        expected = LinkedList(first, order)
+        actual = SkipLinkedList(first, order)
+        for ll in (expected, actual):
+            ll.append(tail)
+        for batch in range(5):
+            # one batch of distinct values, one with long runs of duplicates
+            pending = [random.randint(1, 10**4 - 1) for _ in range(200)]
+            if batch % 2:
+                pending = [x // 1000 * 1000 + 1 for x in pending]
+            expected.insert(pending)
+            actual.insert(pending)
+            check_lanes(actual)
+        for ll in (expected, actual):
+            ll.prepend(-1 if order == 'ASC' else 10**5)
+        check_lanes(actual)
+        assert list(actual) == list(expected)
+        assert actual.walked == expected.walked
+
+def test_skip_linked_list_walk_is_logarithmic():
+    ll = SkipLinkedList(0)
+    for _ in range(5000):
+        ll.append(5)
+    ll.append(10)
+    ll.insert([5] * 200)
+    # each insert passes all the equal values but compares only O(log n) of them
+    assert ll.walked > 200 * 5000
+    assert ll.walk_comparisons < 200 * 100
+
+def test_run_length_linked_list_collapses_duplicates():
+    ll = RunLengthLinkedList(0)
+    for v in (0, 0, 1, 1, 1, 5):
+        ll.append(v)
+    ll.append(9)
+    ll.insert([5, 3, 5, 1])
+    assert list(ll) == [0, 0, 0, 1, 1, 1, 1, 3, 5, 5, 5, 9]
+    assert len(ll) == 12 and ll.nodes == 5
+
+def test_nodes_are_slotted():
+    from bifurcated_sort import node
+    for node_class in (node.LinkedListNode, node.SkipListNode, node.RunLengthNode, node.TreeNode,
+                       node.AVLTreeNode, node.OrderStatisticNode, node.RedBlackTreeNode, node.TreapNode):
+        instance = node_class(1)
+        assert not hasattr(instance, '__dict__'), node_class.__name__
+        with pytest.raises(AttributeError):
+            instance.extra = 1
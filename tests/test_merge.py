@@ -0,0 +1,65 @@
+import heapq
+import random
+import pytest
+from bifurcated_sort import bfc_merge, bfc_sort
+
+# ============ BASIC TESTS ============
+
+def test_no_inputs():
+    assert list(bfc_merge()) == []
+    assert list(bfc_merge([], [])) == []
+
+def test_single_input():
+    assert list(bfc_merge([1, 2, 3])) == [1, 2, 3]
+
+@pytest.mark.parametrize("k", [2, 3, 5, 8, 17, 40])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_matches_heapq_merge(k, reverse):
+    shards = [[random.randint(0, 50) for _ in range(random.randint(0, 300))] for _ in range(k)]
+    for shard in shards:
+        bfc_sort(shard, reverse=reverse)
+    expected = list(heapq.merge(*shards, reverse=reverse))
+    assert list(bfc_merge(*shards, reverse=reverse)) == expected
+    assert list(bfc_merge(*map(iter, shards), reverse=reverse)) == expected
+
+def test_streams_lazily():
+    def numbers(start):
+        yield from range(start, 10**9, 3)
+
+    merged = bfc_merge(numbers(0), numbers(1), numbers(2))
+    assert [next(merged) for _ in range(6)] == [0, 1, 2, 3, 4, 5]
+
+# ============ STABILITY TESTS ============
+
+@pytest.mark.parametrize("k", [2, 3, 6])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_key_is_stable(k, reverse):
+    shards = [
+        sorted(((random.randint(0, 5), shard) for _ in range(100)), key=lambda r: r[0], reverse=reverse)
+        for shard in range(k)
+    ]
+    expected = sorted((r for shard in shards for r in shard), key=lambda r: r[0], reverse=reverse)
+    assert list(bfc_merge(*shards, key=lambda r: r[0], reverse=reverse)) == expected
+
+def test_key_called_once_per_item():
+    calls = 0
+
+    def key(x):
+        nonlocal calls
+        calls += 1
+        return -x
+
+    assert list(bfc_merge([3, 2], [5, 1], [4], key=key)) == [5, 4, 3, 2, 1]
+    assert calls == 5
+
+def test_equal_items_keep_input_order():
+    a, b, c = [1.0], [1], [True]
+    assert [type(x) for x in bfc_merge(a, b, c)] == [float, int, bool]
+
+# ============ VALIDATION TESTS ============
+
+def test_invalid_arguments():
+    with pytest.raises(TypeError, match="reverse must be a boolean"):
+        bfc_merge([1], reverse=1)
+    with pytest.raises(TypeError, match="key must be callable"):
+        bfc_merge([1], key=1)
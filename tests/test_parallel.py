@@ -0,0 +1,69 @@
+import random
+import pytest
+from bifurcated_sort import bfc_sort
+from bifurcated_sort import parallel
+
+@pytest.fixture
+def always_parallel(monkeypatch):
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_ITEMS", 0)
+
+# ============ PARALLEL SORT TESTS ============
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_parallel_ints_shared_memory(always_parallel, workers):
+    arr = [random.randint(-10**12, 10**12) for _ in range(5000)]
+    expected = sorted(arr)
+    bfc_sort(arr, workers=workers)
+    assert arr == expected
+
+def test_parallel_floats_reverse(always_parallel):
+    arr = [random.random() for _ in range(3000)]
+    expected = sorted(arr, reverse=True)
+    bfc_sort(arr, workers=2, reverse=True)
+    assert arr == expected
+
+def test_parallel_generic_items(always_parallel):
+    """Tuples and big ints are pickled to the workers"""
+    arr = [(random.randint(0, 50), str(i)) for i in range(2000)] + [(10**30, "big")]
+    expected = sorted(arr)
+    bfc_sort(arr, workers=2)
+    assert arr == expected
+
+def test_parallel_mixed_int_float(always_parallel):
+    arr = [random.choice([random.randint(0, 100), random.random() * 100]) for _ in range(2000)]
+    expected = sorted(arr)
+    bfc_sort(arr, workers=2)
+    assert arr == expected
+
+def test_parallel_key_stable(always_parallel):
+    arr = [(random.randint(0, 10), i) for i in range(2000)]
+    expected = sorted(arr, key=lambda r: r[0], reverse=True)
+    bfc_sort(arr, workers=2, key=lambda r: r[0], reverse=True)
+    assert arr == expected
+
+def test_parallel_few_distinct_values(always_parallel):
+    arr = [random.randint(0, 2) for _ in range(3000)]
+    expected = sorted(arr)
+    bfc_sort(arr, workers=3)
+    assert arr == expected
+
+def test_parallel_more_workers_than_items(always_parallel):
+    arr = [3, 1, 2]
+    bfc_sort(arr, workers=4)
+    assert arr == [1, 2, 3]
+
+def test_small_input_stays_serial():
+    arr = [random.randint(0, 100) for _ in range(100)]
+    expected = sorted(arr)
+    bfc_sort(arr, workers=4)
+    assert arr == expected
+
+# ============ VALIDATION TESTS ============
+
+def test_workers_not_int():
+    with pytest.raises(TypeError, match="workers must be an integer"):
+        bfc_sort([3, 1, 2], workers=2.0)
+
+def test_workers_zero():
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        bfc_sort([3, 1, 2], workers=0)
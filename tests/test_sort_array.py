@@ -0,0 +1,85 @@
+import array
+import random
+import pytest
+from bifurcated_sort import bfc_sort_array
+
+np = pytest.importorskip("numpy")
+
+# ============ NDARRAY TESTS ============
+
+@pytest.mark.parametrize("dtype", [np.int64, np.int32, np.uint8, np.float64, np.float32])
+def test_matches_numpy_sort(dtype):
+    for _ in range(20):
+        arr = np.random.randint(0, 200, size=random.randint(0, 500)).astype(dtype)
+        expected = np.sort(arr)
+        bfc_sort_array(arr)
+        assert np.array_equal(arr, expected)
+
+def test_reverse():
+    arr = np.random.randn(1000)
+    expected = np.sort(arr)[::-1]
+    bfc_sort_array(arr, reverse=True)
+    assert np.array_equal(arr, expected)
+
+def test_not_inplace_returns_copy():
+    arr = np.array([5, 2, 8, 1, 9])
+    result = bfc_sort_array(arr, inplace=False)
+    assert arr.tolist() == [5, 2, 8, 1, 9]
+    assert result.tolist() == [1, 2, 5, 8, 9]
+
+def test_sorts_view_in_place():
+    base = np.array([9, 4, 7, 1, 3, 8])
+    bfc_sort_array(base[1:5])
+    assert base.tolist() == [9, 1, 3, 4, 7, 8]
+
+def test_all_equal():
+    arr = np.full(10, 7)
+    bfc_sort_array(arr)
+    assert arr.tolist() == [7] * 10
+
+def test_sorted_and_reversed_inputs():
+    arr = np.arange(1000)
+    bfc_sort_array(arr)
+    assert np.array_equal(arr, np.arange(1000))
+    arr = np.arange(1000)[::-1].copy()
+    bfc_sort_array(arr)
+    assert np.array_equal(arr, np.arange(1000))
+
+# ============ BUFFER PROTOCOL TESTS ============
+
+def test_array_module_buffer():
+    arr = array.array('i', [5, -3, 9, 1, 2])
+    bfc_sort_array(arr)
+    assert arr.tolist() == [-3, 1, 2, 5, 9]
+
+def test_bytearray_buffer():
+    arr = bytearray(b'bifurcated')
+    bfc_sort_array(arr)
+    assert arr == bytearray(sorted(b'bifurcated'))
+
+def test_memoryview_buffer():
+    data = array.array('d', [3.5, 1.25, 2.0])
+    bfc_sort_array(memoryview(data))
+    assert data.tolist() == [1.25, 2.0, 3.5]
+
+# ============ VALIDATION TESTS ============
+
+def test_rejects_list():
+    with pytest.raises(TypeError, match="buffer protocol"):
+        bfc_sort_array([3, 1, 2])
+
+def test_rejects_2d():
+    with pytest.raises(TypeError, match="one-dimensional"):
+        bfc_sort_array(np.zeros((2, 2)))
+
+def test_rejects_non_numeric():
+    with pytest.raises(TypeError, match="numeric"):
+        bfc_sort_array(np.array(["b", "a"]))
+
+def test_rejects_nan():
+    with pytest.raises(ValueError, match="NaN"):
+        bfc_sort_array(np.array([1.0, np.nan, 0.5]))
+
+def test_rejects_read_only_buffer():
+    with pytest.raises(ValueError, match="read-only"):
+        bfc_sort_array(b'read only')
@@ -0,0 +1,102 @@
+import bisect
+import random
+import pytest
+from bifurcated_sort import SortedList
+
+# ============ BASIC TESTS ============
+
+def test_empty():
+    sl = SortedList()
+    assert len(sl) == 0
+    assert list(sl) == [] and list(reversed(sl)) == []
+    assert 1 not in sl
+    assert list(sl.irange(0, 10)) == []
+    with pytest.raises(IndexError, match="pop from empty SortedList"):
+        sl.pop()
+
+def test_init_sorts():
+    sl = SortedList([5, 1, 4, 1])
+    assert list(sl) == [1, 1, 4, 5]
+    assert repr(sl) == "SortedList([1, 1, 4, 5])"
+
+def test_matches_insort_reference():
+    sl = SortedList(random.randint(0, 40) for _ in range(100))
+    reference = sorted(sl)
+    for _ in range(3000):
+        value = random.randint(0, 40)
+        op = random.random()
+        if op < 0.45:
+            sl.add(value)
+            bisect.insort(reference, value)
+        elif op < 0.7:
+            sl.discard(value)
+            if value in reference:
+                reference.remove(value)
+        elif op < 0.8 and reference:
+            i = random.randrange(-len(reference), len(reference))
+            assert sl.pop(i) == reference.pop(i)
+        assert len(sl) == len(reference)
+        assert (value in sl) == (value in reference)
+        assert sl.bisect_left(value) == bisect.bisect_left(reference, value)
+        assert sl.bisect_right(value) == bisect.bisect_right(reference, value)
+        assert sl.count(value) == reference.count(value)
+    assert list(sl) == reference
+    assert list(reversed(sl)) == reference[::-1]
+    assert [sl[i] for i in range(-len(sl), len(sl))] == reference + reference
+
+def test_equal_values_keep_insertion_order():
+    class Item:
+        def __init__(self, value):
+            self.value = value
+
+        def __lt__(self, other):
+            return self.value < other.value
+
+    items = [Item(i % 4) for i in range(100)]
+    sl = SortedList()
+    sl.update(items)
+    expected = sorted(items, key=lambda item: item.value)
+    assert [id(x) for x in sl] == [id(x) for x in expected]
+    assert [id(sl[i]) for i in range(100)] == [id(x) for x in expected]
+
+# ============ RANGE TESTS ============
+
+@pytest.mark.parametrize("inclusive", [(True, True), (True, False), (False, True), (False, False)])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_irange(inclusive, reverse):
+    values = [random.randint(0, 50) for _ in range(500)]
+    sl = SortedList(values)
+    for _ in range(50):
+        low, high = sorted(random.sample(range(-5, 56), 2))
+        expected = [
+            v for v in sorted(values)
+            if (low <= v if inclusive[0] else low < v) and (v <= high if inclusive[1] else v < high)
+        ]
+        if reverse:
+            expected.reverse()
+        assert list(sl.irange(low, high, inclusive, reverse)) == expected
+    assert list(sl.irange(maximum=10)) == [v for v in sorted(values) if v <= 10]
+    assert list(sl.irange(minimum=40)) == [v for v in sorted(values) if v >= 40]
+
+# ============ ERROR HANDLING TESTS ============
+
+def test_errors():
+    sl = SortedList([3, 1, 2])
+    with pytest.raises(ValueError, match="4 not in SortedList"):
+        sl.remove(4)
+    with pytest.raises(ValueError, match="4 not in SortedList"):
+        sl.index(4)
+    assert sl.index(2) == 1
+    with pytest.raises(IndexError, match="SortedList index out of range"):
+        sl[3]
+    with pytest.raises(IndexError, match="SortedList index out of range"):
+        sl.pop(-4)
+    with pytest.raises(TypeError, match="SortedList indices must be integers"):
+        sl['a']
+
+def test_remove_last_value():
+    sl = SortedList([7])
+    sl.remove(7)
+    assert len(sl) == 0 and list(sl) == []
+    sl.add(3)
+    assert list(sl) == [3]
@@ -0,0 +1,208 @@
+import random
+import pytest
+from bifurcated_sort import bfc_sort, SortStats
+from bifurcated_sort import sorter
+
+speedups = pytest.importorskip("bifurcated_sort._speedups")
+
+def make_inputs():
+    rng = random.Random(1359)
+    return {
+        "random": [rng.randint(-10**6, 10**6) for _ in range(3000)],
+        "few-unique": [rng.randint(0, 9) for _ in range(3000)],
+        "floats": [rng.random() for _ in range(2000)],
+        "sawtooth": [i % 7 for i in range(500)],
+        "strings": [str(rng.randint(0, 10**4)) for _ in range(1500)],
+        "tuples": [(rng.randint(0, 20), rng.randint(0, 5)) for _ in range(1500)],
+        "small": [3, 1, 2],
+        "pair": [2, 1],
+    }
+
+INPUTS = make_inputs()
+
+class Boxed:
+    """Equal-comparing items that stay distinguishable by identity"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __le__(self, other):
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        return self.value > other.value
+
+    def __ge__(self, other):
+        return self.value >= other.value
+
+# ============ PARITY TESTS ============
+
+@pytest.mark.parametrize("accelerate", [False, True])
+@pytest.mark.parametrize("name", sorted(INPUTS))
+@pytest.mark.parametrize("reverse", [False, True])
+def test_matches_sorted(accelerate, name, reverse):
+    arr = list(INPUTS[name])
+    bfc_sort(arr, reverse=reverse, accelerate=accelerate, counting_threshold=0, radix_max_bits=0)
+    assert arr == sorted(INPUTS[name], reverse=reverse)
+
+@pytest.mark.parametrize("accelerate", [False, True])
+@pytest.mark.parametrize("pending", [0.01, 0.1, 0.55, 1, 'auto'])
+def test_pending_percentages(accelerate, pending):
+    arr = list(INPUTS["random"])
+    bfc_sort(arr, pending_item_percentage=pending, accelerate=accelerate)
+    assert arr == sorted(INPUTS["random"])
+
+@pytest.mark.parametrize("accelerate", [False, True])
+def test_key_stability(accelerate):
+    records = [(random.randint(0, 5), i) for i in range(1000)]
+    expected = sorted(records, key=lambda r: r[0], reverse=True)
+    bfc_sort(records, key=lambda r: r[0], reverse=True, accelerate=accelerate)
+    assert records == expected
+
+@pytest.mark.parametrize("pending", [0.1, 0.55, 'auto'])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_same_placement_as_python_avl(pending, reverse):
+    """The compiled path builds the same lists as the pure-Python AVL path"""
+    values = [random.randint(0, 50) for _ in range(2000)]
+    items = [Boxed(v) for v in values]
+    native = list(items)
+    python = list(items)
+    bfc_sort(native, pending_item_percentage=pending, reverse=reverse, accelerate=True)
+    bfc_sort(python, pending_item_percentage=pending, reverse=reverse, tree='avl', accelerate=False)
+    assert [id(x) for x in native] == [id(x) for x in python]
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_same_stats_as_python_avl(reverse):
+    arr = [random.randint(0, 10**6) for _ in range(5000)]
+    native, python = SortStats(), SortStats()
+    bfc_sort(list(arr), reverse=reverse, stats=native, accelerate=True, counting_threshold=0, radix_max_bits=0)
+    bfc_sort(list(arr), reverse=reverse, stats=python, tree='avl', accelerate=False)
+    native_counters = native.as_dict()
+    python_counters = python.as_dict()
+    del native_counters['phase_times'], python_counters['phase_times']
+    assert native_counters == python_counters
+    assert native.phase_times['insert'] == 0.0
+
+@pytest.mark.parametrize("pending", [0.01, 0.55])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_persistent_index_same_placement(pending, reverse):
+    items = [Boxed(random.randint(0, 300)) for _ in range(2000)]
+    native, python = list(items), list(items)
+    native_stats, python_stats = SortStats(), SortStats()
+    bfc_sort(native, pending_item_percentage=pending, reverse=reverse, persistent_index=True,
+             stats=native_stats, accelerate=True)
+    bfc_sort(python, pending_item_percentage=pending, reverse=reverse, persistent_index=True,
+             stats=python_stats, tree='avl', accelerate=False)
+    assert [id(x) for x in native] == [id(x) for x in python]
+    assert native_stats.nodes_walked == python_stats.nodes_walked
+    assert native_stats.tree_depths == python_stats.tree_depths
+
+# ============ ERROR HANDLING TESTS ============
+
+def test_comparison_error_propagates():
+    class Flaky(Boxed):
+        calls = 0
+
+        def __le__(self, other):
+            Flaky.calls += 1
+            if Flaky.calls == 500:
+                raise RuntimeError("comparison failed")
+            return self.value <= other.value
+
+    arr = [Flaky(random.randint(0, 100)) for _ in range(1000)]
+    with pytest.raises(RuntimeError, match="comparison failed"):
+        bfc_sort(arr, accelerate=True)
+    assert len(arr) == 1000
+
+def test_merge_rejects_resized_list():
+    arr = [5, 9, 1, 7, 3, 8, 2]
+    state = speedups.distribute(arr, 2, 1, 1, False)[0]
+    arr.pop()
+    with pytest.raises(ValueError, match="list size does not match"):
+        speedups.merge(state, arr, False)
+
+def test_accelerate_invalid():
+    with pytest.raises(TypeError, match="accelerate must be a boolean or None"):
+        bfc_sort([3, 1, 2], accelerate=1)
+
+@pytest.mark.parametrize("options", [
+    dict(tree='bst'), dict(tree='rb'), dict(tree='treap'), dict(engine='array'),
+])
+def test_python_only_options(monkeypatch, options):
+    """An explicit tree or engine the compiled module does not build keeps the Python path"""
+    def fail(*args, **kwargs):
+        raise AssertionError("accelerated path taken")
+    monkeypatch.setattr(sorter, "_accelerated_sort", fail)
+    arr = [random.randint(0, 10**6) for _ in range(3000)]
+    expected = sorted(arr)
+    bfc_sort(arr, **options)
+    assert arr == expected
+    with pytest.raises(ValueError, match="not available with accelerate=True"):
+        bfc_sort([3, 1, 2], accelerate=True, **options)
+
+@pytest.mark.parametrize("options", [dict(tree='avl'), dict(engine='node')])
+def test_accelerated_options(monkeypatch, options):
+    calls = []
+    accelerated_sort = sorter._accelerated_sort
+    def spy(*args, **kwargs):
+        calls.append(args)
+        return accelerated_sort(*args, **kwargs)
+    monkeypatch.setattr(sorter, "_accelerated_sort", spy)
+    arr = [random.randint(0, 10**6) for _ in range(3000)]
+    expected = sorted(arr)
+    bfc_sort(arr, **options)
+    assert arr == expected
+    assert len(calls) == 1
+
+def test_accelerate_required_but_missing(monkeypatch):
+    monkeypatch.setattr(sorter, "_speedups", None)
+    with pytest.raises(ImportError, match="accelerate=True"):
+        bfc_sort([3, 1, 2], accelerate=True)
+    arr = [3, 1, 2, 5, 4]
+    bfc_sort(arr)
+    assert arr == [1, 2, 3, 4, 5]
+
+# ============ UNBOXED KEYS TESTS ============
+
+@pytest.mark.parametrize("arr, typecode", [
+    ([3, -1, 2**63 - 1, -2**63], 'q'),
+    ([0.5, -1.0, float('inf')], 'd'),
+    ([3, 1.0], None),
+    ([2**63, 1], None),
+    ([True, False], None),
+    ([(1, 2), (0, 1)], None),
+    (["b", "a"], None),
+])
+def test_unboxed_keys_detection(arr, typecode):
+    keys = sorter._unboxed_keys(arr, min(arr), max(arr))
+    if typecode is None:
+        assert keys is None
+    else:
+        assert keys.typecode == typecode
+        assert keys.tolist() == arr
+
+@pytest.mark.parametrize("arr", [
+    [random.randint(-2**63, 2**63 - 1) for _ in range(3000)],
+    [random.choice([0.0, -0.0, 1.5, -2.5]) for _ in range(3000)],
+    [random.choice([1e308, 3.0, float('inf'), float('-inf')]) for _ in range(1000)],
+    [random.randint(0, 2**70) for _ in range(1000)],
+])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_unboxed_keys_same_placement(arr, reverse):
+    """Unboxed comparisons order items exactly like rich comparison"""
+    native = list(arr)
+    python = list(arr)
+    bfc_sort(native, reverse=reverse, accelerate=True, counting_threshold=0, radix_max_bits=0)
+    bfc_sort(python, reverse=reverse, tree='avl', accelerate=False)
+    assert [id(x) for x in native] == [id(x) for x in python]
+
+def test_distribute_rejects_bad_keys():
+    from array import array
+    arr = [5, 9, 1, 7, 3]
+    with pytest.raises(ValueError, match="keys must be"):
+        speedups.distribute(arr, 2, 1, 1, False, array('i', arr))
+    with pytest.raises(ValueError, match="keys must be"):
+        speedups.distribute(arr, 2, 1, 1, False, array('q', arr[:-1]))
@@ -0,0 +1,117 @@
+import random
+import pytest
+from bifurcated_sort import bfc_sort, SortStats
+from bifurcated_sort import parallel
+from bifurcated_sort import sorter
+
+class Counted:
+    """Wraps a value and counts comparisons made outside the nearest-value tree"""
+    count = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        Counted.count += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        Counted.count += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        Counted.count += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        Counted.count += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        Counted.count += 1
+        return self.value == other.value
+
+# ============ COUNTER TESTS ============
+
+def test_counters_add_up():
+    arr = [random.randint(0, 10**6) for _ in range(5000)]
+    stats = SortStats()
+    bfc_sort(arr, stats=stats, counting_threshold=0, radix_max_bits=0)
+    assert arr == sorted(arr)
+    assert stats.items == 5000
+    assert stats.fast_path is None
+    # min and max seed the two lists
+    assert stats.asc_appends + stats.dsc_appends + stats.pending_items == 5000 - 2
+    assert stats.pending_flushes == len(stats.tree_depths) >= 1
+    assert all(depth >= 1 for depth in stats.tree_depths)
+    assert set(stats.phase_times) == {'scan', 'distribute', 'insert', 'merge'}
+    assert all(seconds >= 0 for seconds in stats.phase_times.values())
+
+@pytest.mark.parametrize("pending", [0.55, 'auto'])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("engine", ['node', 'array', 'skip', 'rle'])
+def test_comparisons_exact(monkeypatch, reverse, engine, pending):
+    """Every comparison outside the tree lookups is counted"""
+    class UncountedTree:
+        def __init__(self):
+            self.entries = []
+
+        def insert(self, value, reference=None):
+            self.entries.append((value.value, reference))
+
+        def find_nearest(self, value, find_smaller=True):
+            if find_smaller:
+                candidates = [e for e in self.entries if e[0] < value.value]
+                return max(candidates, key=lambda e: e[0])[1] if candidates else None
+            candidates = [e for e in self.entries if e[0] > value.value]
+            return min(candidates, key=lambda e: e[0])[1] if candidates else None
+
+        def max_insert_depth(self):
+            return len(self.entries)
+
+    monkeypatch.setitem(sorter.TREE_TYPES, 'uncounted', UncountedTree)
+    arr = [Counted(random.randint(0, 500)) for _ in range(400)]
+    stats = SortStats()
+    Counted.count = 0
+    bfc_sort(
+        arr, stats=stats, reverse=reverse, engine=engine, tree='uncounted', accelerate=False,
+        pending_item_percentage=pending,
+    )
+    assert stats.comparisons == Counted.count
+
+@pytest.mark.parametrize("arr, fast_path", [
+    ([4, 4, 4], 'equal'),
+    (list(range(100)), 'sorted'),
+    (list(range(100, 0, -1)), 'reversed'),
+    (list(range(50)) + list(range(50)), 'runs'),
+])
+def test_fast_paths_reported(arr, fast_path):
+    stats = SortStats()
+    bfc_sort(arr, stats=stats)
+    assert stats.fast_path == fast_path
+    assert stats.pending_items == 0
+
+def test_stats_accumulate_and_reset():
+    stats = SortStats()
+    bfc_sort([3, 1, 2, 5, 4, 9, 0], stats=stats)
+    bfc_sort([3, 1, 2, 5, 4, 9, 0], stats=stats)
+    assert stats.items == 14
+    stats.reset()
+    assert stats.as_dict()['items'] == 0
+
+def test_stats_with_key():
+    stats = SortStats()
+    bfc_sort([(random.random(), i) for i in range(500)], key=lambda r: r[0], stats=stats)
+    assert stats.items == 500
+
+def test_stats_with_workers(monkeypatch):
+    monkeypatch.setattr(parallel, "PARALLEL_MIN_ITEMS", 0)
+    arr = [random.randint(0, 10**6) for _ in range(3000)]
+    stats = SortStats()
+    bfc_sort(arr, workers=2, stats=stats)
+    assert arr == sorted(arr)
+    assert stats.items == 3000
+
+def test_stats_invalid():
+    with pytest.raises(TypeError, match="stats must be a SortStats"):
+        bfc_sort([3, 1, 2], stats={})
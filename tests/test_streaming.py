@@ -0,0 +1,192 @@
+import random
+import pytest
+from bifurcated_sort import BifurcatedSorter, SortStats, bfc_iter, bfc_sort, bfc_topk
+
+# ============ BASIC TESTS ============
+
+def test_empty():
+    sorter = BifurcatedSorter()
+    assert list(sorter) == []
+    assert len(sorter) == 0
+    with pytest.raises(ValueError):
+        sorter.min()
+    with pytest.raises(ValueError):
+        sorter.max()
+
+def test_single_item():
+    sorter = BifurcatedSorter([7])
+    assert list(sorter) == [7]
+    assert sorter.min() == sorter.max() == 7
+
+def test_push_and_extend():
+    sorter = BifurcatedSorter()
+    sorter.push(5)
+    sorter.extend([2, 8, 1, 9])
+    assert len(sorter) == 5
+    assert list(sorter) == [1, 2, 5, 8, 9]
+
+def test_accepts_generator():
+    sorter = BifurcatedSorter(x % 97 for x in range(0, 5000, 7))
+    assert list(sorter) == sorted(x % 97 for x in range(0, 5000, 7))
+
+@pytest.mark.parametrize("engine", ['node', 'array', 'skip', 'rle'])
+def test_matches_sorted(engine):
+    for _ in range(50):
+        data = [random.randint(-500, 500) for _ in range(random.randint(1, 400))]
+        assert list(BifurcatedSorter(data, engine=engine)) == sorted(data)
+
+@pytest.mark.parametrize("pattern", [
+    list(range(300)),
+    list(range(300, 0, -1)),
+    [5, 10, 3, 4, 4, 4, 4],
+    list(range(50, 150)) + [1, 200],
+])
+def test_patterns(pattern):
+    assert list(BifurcatedSorter(pattern)) == sorted(pattern)
+
+def test_reverse():
+    data = [random.random() for _ in range(1000)]
+    assert list(BifurcatedSorter(data, reverse=True)) == sorted(data, reverse=True)
+
+@pytest.mark.parametrize("engine", ['node', 'array', 'skip', 'rle'])
+def test_persistent_index(engine):
+    data = [random.randint(0, 10**6) for _ in range(2000)]
+    sorter = BifurcatedSorter(data, pending_item_percentage=0.05, engine=engine, persistent_index=True)
+    assert list(sorter) == sorted(data)
+
+# ============ INCREMENTAL TESTS ============
+
+def test_min_max_track_stream():
+    sorter = BifurcatedSorter()
+    seen = []
+    for _ in range(1000):
+        item = random.randint(-10**6, 10**6)
+        sorter.push(item)
+        seen.append(item)
+        assert sorter.min() == min(seen)
+        assert sorter.max() == max(seen)
+
+def test_iterate_between_pushes():
+    sorter = BifurcatedSorter()
+    seen = []
+    for _ in range(20):
+        chunk = [random.randint(0, 100) for _ in range(50)]
+        sorter.extend(chunk)
+        seen.extend(chunk)
+        assert list(sorter) == sorted(seen)
+
+def test_lazy_iteration():
+    sorter = BifurcatedSorter(random.randint(0, 10**6) for _ in range(2000))
+    it = iter(sorter)
+    first = [next(it) for _ in range(3)]
+    assert first == sorted(sorter)[:3]
+
+# ============ KEY TESTS ============
+
+def test_key_stable():
+    records = [(random.randint(0, 10), i) for i in range(1000)]
+    sorter = BifurcatedSorter(records, key=lambda r: r[0])
+    assert list(sorter) == sorted(records, key=lambda r: r[0])
+    assert sorter.min() == min(records, key=lambda r: r[0])
+
+def test_key_stable_reverse():
+    records = [(random.randint(0, 10), i) for i in range(1000)]
+    sorter = BifurcatedSorter(records, key=lambda r: r[0], reverse=True)
+    assert list(sorter) == sorted(records, key=lambda r: r[0], reverse=True)
+
+# ============ VALIDATION TESTS ============
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match="must be between 0 and 1"):
+        BifurcatedSorter(pending_item_percentage=0)
+    with pytest.raises(TypeError, match="reverse must be a boolean"):
+        BifurcatedSorter(reverse=1)
+    with pytest.raises(TypeError, match="key must be callable"):
+        BifurcatedSorter(key=3)
+    with pytest.raises(ValueError, match="tree must be one of"):
+        BifurcatedSorter(tree='splay')
+    with pytest.raises(ValueError, match="engine must be one of"):
+        BifurcatedSorter(engine='numpy')
+    with pytest.raises(TypeError, match="persistent_index must be a boolean"):
+        BifurcatedSorter(persistent_index=1)
+
+# ============ ITERATOR AND TOP-K TESTS ============
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_bfc_iter_matches_sorted(reverse):
+    data = [random.randint(-500, 500) for _ in range(2000)]
+    it = bfc_iter(iter(data), reverse=reverse)
+    assert next(it) == (max(data) if reverse else min(data))
+    assert [next(it)] + list(it) == sorted(data, reverse=reverse)[1:]
+
+def test_bfc_iter_key_and_options():
+    records = [(random.randint(0, 5), i) for i in range(500)]
+    it = bfc_iter(records, key=lambda r: r[0], engine='array', tree='avl')
+    assert list(it) == sorted(records, key=lambda r: r[0])
+    assert list(bfc_iter([])) == []
+
+def test_bfc_iter_merges_lazily():
+    """Distributes like bfc_sort and only runs the merge as items are pulled"""
+    data = [random.randint(0, 10**6) for _ in range(3000)]
+    options = dict(accelerate=False, counting_threshold=0, radix_max_bits=0)
+    iter_stats, sort_stats = SortStats(), SortStats()
+    it = bfc_iter(data, stats=iter_stats, **options)
+    bfc_sort(list(data), stats=sort_stats, **options)
+    assert iter_stats.pending_items == sort_stats.pending_items > 0
+    distributed = iter_stats.comparisons
+    assert next(it) == min(data)
+    assert iter_stats.comparisons == distributed
+    assert list(it) == sorted(data)[1:]
+    assert iter_stats.comparisons == sort_stats.comparisons
+
+@pytest.mark.parametrize("data, fast_path", [
+    (list(range(1000)), 'sorted'),
+    ([random.randint(0, 100) for _ in range(5000)], 'counting'),
+])
+def test_bfc_iter_fast_paths(data, fast_path):
+    stats = SortStats()
+    assert list(bfc_iter(data, stats=stats)) == sorted(data)
+    assert stats.fast_path == fast_path
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_bfc_iter_stable_with_key(reverse):
+    records = [(random.randint(0, 20), i) for i in range(3000)]
+    expected = sorted(records, key=lambda r: r[0], reverse=reverse)
+    assert list(bfc_iter(records, reverse=reverse, key=lambda r: r[0], accelerate=False)) == expected
+
+def test_bfc_iter_validates_eagerly():
+    with pytest.raises(TypeError, match="reverse must be a boolean"):
+        bfc_iter([1, 2], reverse=1)
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("k", [0, 1, 7, 100, 5000, 20000])
+def test_bfc_topk_matches_sorted(k, reverse):
+    data = [random.randint(0, 10**4) for _ in range(10000)]
+    assert bfc_topk(data, k, reverse=reverse) == sorted(data, reverse=reverse)[:k]
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_bfc_topk_stable_with_key(reverse):
+    records = [(random.randint(0, 20), i) for i in range(10000)]
+    expected = sorted(records, key=lambda r: r[0], reverse=reverse)[:50]
+    assert bfc_topk(iter(records), 50, reverse=reverse, key=lambda r: r[0]) == expected
+
+def test_bfc_topk_calls_key_once_per_item():
+    calls = 0
+
+    def key(x):
+        nonlocal calls
+        calls += 1
+        return x
+
+    assert bfc_topk(range(100000), 3, key=key) == [0, 1, 2]
+    assert calls == 100000
+
+def test_bfc_topk_invalid():
+    with pytest.raises(TypeError, match="k must be an integer"):
+        bfc_topk([1, 2], 1.5)
+    with pytest.raises(TypeError, match="k must be an integer"):
+        bfc_topk([1, 2], True)
+    with pytest.raises(ValueError, match="k must be at least 0"):
+        bfc_topk([1, 2], -1)
+    with pytest.raises(TypeError, match="key must be callable"):
+        bfc_topk([1, 2], 1, key=3)